@@ -0,0 +1,14 @@
+import pytest
+
+from tests.data import records
+
+
+@pytest.fixture
+def make_record():
+    """Factory for minimal valid DataRelease records as plain dicts."""
+    return records.make_record
+
+
+@pytest.fixture
+def record():
+    return records.make_record()
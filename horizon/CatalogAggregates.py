@@ -0,0 +1,180 @@
+from collections import Counter
+from enum import Enum
+from typing import Any, Dict, Iterable, Tuple
+
+from pydantic import BaseModel
+
+from ._util import get
+
+# Dimensions counted for every record, in the order of a record's contribution tuple.
+DIMENSIONS = (
+    "status",
+    "usgsReleaseType",
+    "usgsAssetType",
+    "accessRights",
+    "dataSourceId",
+    "missionAreaId",
+)
+
+# Records without a value for a dimension are counted under this key.
+MISSING = ""
+
+
+def _key(value) -> str:
+    if value is None:
+        return MISSING
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _total_bytes(record) -> int:
+    total = sum(get(d, "byteSize") or 0 for d in get(record, "distribution") or ())
+    for component in get(record, "component") or ():
+        total += sum(
+            get(d, "byteSize") or 0 for d in get(component, "distribution") or ()
+        )
+    return total
+
+
+def contribution(record) -> Tuple[Tuple[str, ...], int]:
+    """The dimension values and total byteSize a record adds to the aggregates."""
+    values = (
+        _key(get(record, "status")),
+        _key(get(record, "usgsReleaseType")),
+        _key(get(record, "usgsAssetType")),
+        _key(get(record, "accessRights")),
+        _key(get(get(record, "usgsDataSource"), "dataSourceId")),
+        _key(get(get(record, "usgsMissionArea"), "missionAreaId")),
+    )
+    return values, _total_bytes(record)
+
+
+class AggregateSnapshot(BaseModel):
+    """Point-in-time copy of catalog aggregates.
+
+    Fields
+    ------
+    records: int
+        Number of records.
+    totalBytes: int
+        Total byteSize of every distribution, including component distributions.
+    counts: Dict[str, Dict[str, int]]
+        Number of records per value of each dimension.
+    sizes: Dict[str, Dict[str, int]]
+        Total byteSize per value of each dimension.
+    """
+
+    records: int = 0
+    totalBytes: int = 0
+    counts: Dict[str, Dict[str, int]] = {}
+    sizes: Dict[str, Dict[str, int]] = {}
+
+    def merge(self, other: "AggregateSnapshot") -> "AggregateSnapshot":
+        """Combine snapshots of disjoint sets of records, e.g. from parallel workers."""
+        counts, sizes = {}, {}
+        for dimension in DIMENSIONS:
+            for merged, mine, theirs in (
+                (counts, self.counts, other.counts),
+                (sizes, self.sizes, other.sizes),
+            ):
+                total = dict(mine.get(dimension, {}))
+                for value, amount in theirs.get(dimension, {}).items():
+                    total[value] = total.get(value, 0) + amount
+                merged[dimension] = total
+        return AggregateSnapshot(
+            records=self.records + other.records,
+            totalBytes=self.totalBytes + other.totalBytes,
+            counts=counts,
+            sizes=sizes,
+        )
+
+    def __add__(self, other: "AggregateSnapshot") -> "AggregateSnapshot":
+        return self.merge(other)
+
+
+class CatalogAggregates:
+    """Record counts and byte totals per status, release type, asset type,
+    access rights, data source and mission area, kept up to date as records change.
+
+    Each record's contribution (its dimension values and total byteSize) is
+    remembered by usgsIdentifier, so inserting, updating or deleting a record
+    adjusts the counters in O(1) without rescanning the catalog. A status
+    transition is an update: the old status is decremented and the new one
+    incremented.
+    """
+
+    def __init__(self, records: Iterable = ()):
+        self._contributions: Dict[str, Tuple[Tuple[str, ...], int]] = {}
+        self._counts = [Counter() for _ in DIMENSIONS]
+        self._bytes = [Counter() for _ in DIMENSIONS]
+        self.totalBytes = 0
+        self.update(records)
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def __contains__(self, usgsIdentifier: str) -> bool:
+        return usgsIdentifier in self._contributions
+
+    def _apply(self, values: Tuple[str, ...], size: int, sign: int):
+        for i, value in enumerate(values):
+            counts = self._counts[i]
+            counts[value] += sign
+            self._bytes[i][value] += sign * size
+            if not counts[value]:
+                del counts[value]
+                del self._bytes[i][value]
+        self.totalBytes += sign * size
+
+    def _set(self, usgsIdentifier: str, new: Tuple[Tuple[str, ...], int]):
+        old = self._contributions.get(usgsIdentifier)
+        if old is not None:
+            self._apply(*old, -1)
+        self._contributions[usgsIdentifier] = new
+        self._apply(*new, 1)
+
+    def upsert(self, record: Any):
+        """Insert a model or dict, or replace the record with the same usgsIdentifier."""
+        self._set(get(record, "usgsIdentifier"), contribution(record))
+
+    def update(self, records: Iterable):
+        for record in records:
+            self.upsert(record)
+
+    def remove(self, usgsIdentifier: str) -> bool:
+        old = self._contributions.pop(usgsIdentifier, None)
+        if old is None:
+            return False
+        self._apply(*old, -1)
+        return True
+
+    def set_status(self, usgsIdentifier: str, status: Any):
+        """Record a status transition without re-reading the whole record."""
+        values, size = self._contributions[usgsIdentifier]
+        self._set(usgsIdentifier, ((_key(status),) + values[1:], size))
+
+    def count(self, dimension: str, value: Any = None) -> int:
+        """Number of records with ``value`` (None for missing) in ``dimension``."""
+        return self._counts[DIMENSIONS.index(dimension)][_key(value)]
+
+    def counts(self, dimension: str) -> Dict[str, int]:
+        return dict(self._counts[DIMENSIONS.index(dimension)])
+
+    def merge(self, other: "CatalogAggregates"):
+        """Add another aggregate's records into this one.
+
+        Records present in both are replaced by the other aggregate's version,
+        so partial aggregates from parallel workers can be merged even when
+        their inputs overlap.
+        """
+        for usgsIdentifier, new in other._contributions.items():
+            self._set(usgsIdentifier, new)
+
+    def snapshot(self) -> AggregateSnapshot:
+        return AggregateSnapshot(
+            records=len(self),
+            totalBytes=self.totalBytes,
+            counts={d: dict(c) for d, c in zip(DIMENSIONS, self._counts)},
+            sizes={d: dict(b) for d, b in zip(DIMENSIONS, self._bytes)},
+        )
@@ -0,0 +1,289 @@
+import base64
+import os
+import sqlite3
+from datetime import datetime
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from .DataRelease import DataRelease
+from .Dataset import Dataset
+from .TemporalIndex import to_microseconds
+
+MODELS: Dict[str, Type[Dataset]] = {"Dataset": Dataset, "DataRelease": DataRelease}
+
+# Columns that are extracted from every record and indexed.
+INDEXED_COLUMNS = (
+    "status",
+    "usgsReleaseType",
+    "usgsAssetType",
+    "accessRights",
+    "dataSourceId",
+    "missionAreaId",
+    "issued",
+    "usgsModified",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    usgsIdentifier TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    status TEXT,
+    usgsReleaseType TEXT,
+    usgsAssetType TEXT NOT NULL,
+    accessRights TEXT NOT NULL,
+    dataSourceId TEXT,
+    missionAreaId TEXT,
+    issued INTEGER NOT NULL,
+    usgsModified INTEGER NOT NULL,
+    document BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+_UPSERT = """
+INSERT INTO records (
+    usgsIdentifier, model, status, usgsReleaseType, usgsAssetType, accessRights,
+    dataSourceId, missionAreaId, issued, usgsModified, document
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (usgsIdentifier) DO UPDATE SET
+    model = excluded.model,
+    status = excluded.status,
+    usgsReleaseType = excluded.usgsReleaseType,
+    usgsAssetType = excluded.usgsAssetType,
+    accessRights = excluded.accessRights,
+    dataSourceId = excluded.dataSourceId,
+    missionAreaId = excluded.missionAreaId,
+    issued = excluded.issued,
+    usgsModified = excluded.usgsModified,
+    document = excluded.document
+"""
+
+_SELECT = "SELECT usgsIdentifier, model, {columns}, document FROM records".format(
+    columns=", ".join(INDEXED_COLUMNS)
+)
+
+# Range filters on the timestamp columns: keyword argument -> SQL condition.
+_RANGE_FILTERS = {
+    "issued_after": "issued >= ?",
+    "issued_before": "issued < ?",
+    "modified_after": "usgsModified >= ?",
+    "modified_before": "usgsModified < ?",
+}
+
+
+def _value(value) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return to_microseconds(value, None)
+    return value
+
+
+class StoredRecord:
+    """A catalog record read from a CatalogStore, validated only when needed.
+
+    The indexed columns are available without validation. Accessing any other
+    attribute, or ``model``, validates the stored JSON once and caches the model.
+    """
+
+    __slots__ = ("usgsIdentifier", "modelName", "columns", "document", "_model")
+
+    def __init__(self, row: Tuple):
+        self.usgsIdentifier = row[0]
+        self.modelName = row[1]
+        self.columns = dict(zip(INDEXED_COLUMNS, row[2:-1]))
+        self.document = row[-1]
+        self._model = None
+
+    @property
+    def model(self) -> Dataset:
+        if self._model is None:
+            self._model = MODELS[self.modelName].model_validate_json(self.document)
+        return self._model
+
+    def __getattr__(self, name):
+        # Only model fields are delegated. Private and special names (looked up
+        # by copy and pickle, possibly before __init__ ran) are not.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+    def __reduce__(self):
+        row = (self.usgsIdentifier, self.modelName, *self.columns.values())
+        return StoredRecord, (row + (self.document,),)
+
+    def __repr__(self) -> str:
+        return f"StoredRecord({self.modelName}, {self.usgsIdentifier!r})"
+
+
+class Page:
+    """One page of query results and the cursor for the next page (None on the last page)."""
+
+    def __init__(self, records: List[StoredRecord], cursor: Optional[str]):
+        self.records = records
+        self.cursor = cursor
+
+    def __iter__(self) -> Iterator[StoredRecord]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+def _encode_cursor(record: StoredRecord) -> str:
+    key = f"{record.columns['issued']}:{record.usgsIdentifier}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str]:
+    issued, usgsIdentifier = base64.urlsafe_b64decode(cursor).decode().split(":", 1)
+    return int(issued), usgsIdentifier
+
+
+class CatalogStore:
+    """Local SQLite store of validated Dataset and DataRelease records.
+
+    Each record is stored as its JSON document next to indexed columns for
+    status, usgsReleaseType, usgsAssetType, accessRights,
+    usgsDataSource.dataSourceId, usgsMissionArea.missionAreaId, issued and
+    usgsModified (as int64 microseconds, UTC). Queries filter on those indexes
+    and only validate the documents that are actually used.
+
+    Queries are built from a fixed set of statement shapes with bound
+    parameters, so SQLite's statement cache reuses the prepared statements.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:"):
+        self._db = sqlite3.connect(path, cached_statements=256)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        with self._db:
+            self._db.execute(_SCHEMA)
+            for column in INDEXED_COLUMNS:
+                self._db.execute(
+                    f"CREATE INDEX IF NOT EXISTS records_{column} ON records ({column})"
+                )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS records_page ON records (issued, usgsIdentifier)"
+            )
+
+    @staticmethod
+    def _row(record: Dataset) -> Tuple:
+        dataSource = record.usgsDataSource
+        missionArea = record.usgsMissionArea
+        return (
+            record.usgsIdentifier,
+            "DataRelease" if isinstance(record, DataRelease) else "Dataset",
+            _value(getattr(record, "status", None)),
+            _value(getattr(record, "usgsReleaseType", None)),
+            _value(record.usgsAssetType),
+            _value(record.accessRights),
+            dataSource.dataSourceId if dataSource is not None else None,
+            missionArea.missionAreaId if missionArea is not None else None,
+            _value(record.issued),
+            _value(record.usgsModified),
+            record.model_dump_json().encode(),
+        )
+
+    def upsert(self, records: Iterable[Dataset], batch_size: int = 10000) -> int:
+        """Insert or replace records, committing one transaction per ``batch_size`` records."""
+        records = iter(records)
+        n = 0
+        while batch := [self._row(r) for r in islice(records, batch_size)]:
+            with self._db:
+                self._db.executemany(_UPSERT, batch)
+            n += len(batch)
+        return n
+
+    def delete(self, usgsIdentifier: str) -> bool:
+        with self._db:
+            cursor = self._db.execute(
+                "DELETE FROM records WHERE usgsIdentifier = ?", (usgsIdentifier,)
+            )
+        return cursor.rowcount > 0
+
+    def get(self, usgsIdentifier: str) -> Optional[StoredRecord]:
+        row = self._db.execute(
+            f"{_SELECT} WHERE usgsIdentifier = ?", (usgsIdentifier,)
+        ).fetchone()
+        return StoredRecord(row) if row is not None else None
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def __contains__(self, usgsIdentifier: str) -> bool:
+        return self.get(usgsIdentifier) is not None
+
+    @staticmethod
+    def _where(filters: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        conditions, parameters = [], []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name in _RANGE_FILTERS:
+                conditions.append(_RANGE_FILTERS[name])
+                parameters.append(_value(value))
+            elif name in INDEXED_COLUMNS:
+                conditions.append(f"{name} = ?")
+                parameters.append(_value(value))
+            else:
+                raise TypeError(f"Unknown filter {name!r}")
+        return conditions, parameters
+
+    def query(self, limit: Optional[int] = None, **filters) -> Iterator[StoredRecord]:
+        """Stream records matching ``filters``, ordered by issued then usgsIdentifier.
+
+        Filters are equality matches on the indexed columns (status,
+        usgsReleaseType, usgsAssetType, accessRights, dataSourceId,
+        missionAreaId) and the ranges issued_after, issued_before,
+        modified_after and modified_before.
+        """
+        conditions, parameters = self._where(filters)
+        sql = _SELECT
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY issued, usgsIdentifier"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        # Not a generator function, so bad filters raise here rather than on
+        # the first next().
+        return (StoredRecord(row) for row in self._db.execute(sql, parameters))
+
+    def count(self, **filters) -> int:
+        conditions, parameters = self._where(filters)
+        sql = "SELECT COUNT(*) FROM records"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return self._db.execute(sql, parameters).fetchone()[0]
+
+    def page(self, cursor: Optional[str] = None, limit: int = 100, **filters) -> Page:
+        """Return one page of matching records. Pass the returned cursor to get the next page.
+
+        Pages are keyed on (issued, usgsIdentifier) rather than offsets, so each
+        page is an index seek no matter how deep into the results it is.
+        """
+        if limit < 1:
+            raise ValueError(f"Page limit must be at least 1, not {limit}")
+        conditions, parameters = self._where(filters)
+        if cursor is not None:
+            conditions.append("(issued, usgsIdentifier) > (?, ?)")
+            parameters.extend(_decode_cursor(cursor))
+        sql = _SELECT
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY issued, usgsIdentifier LIMIT ?"
+        parameters.append(limit + 1)
+        records = [StoredRecord(row) for row in self._db.execute(sql, parameters)]
+        if len(records) > limit:
+            return Page(records[:limit], _encode_cursor(records[limit - 1]))
+        return Page(records, None)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
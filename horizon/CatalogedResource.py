@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional
 from enum import Enum
 from datetime import datetime
@@ -41,6 +41,8 @@ class CatalogedResource(BaseModel):
 
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str
     usgsAssetType: UsgsAssetTypeEnum
     description: str
@@ -0,0 +1,283 @@
+import hashlib
+import os
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .Distribution import Distribution
+
+CHUNK_SIZE = 1 << 20
+
+
+class _Adler32:
+    """hashlib-style wrapper around zlib.adler32."""
+
+    def __init__(self):
+        self._value = 1
+
+    def update(self, data):
+        self._value = zlib.adler32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return format(self._value, "08x")
+
+
+# SPDX checksum algorithm names mapped to hashlib-style constructors.
+SPDX_ALGORITHMS: Dict[str, Callable] = {
+    "SHA1": hashlib.sha1,
+    "SHA224": hashlib.sha224,
+    "SHA256": hashlib.sha256,
+    "SHA384": hashlib.sha384,
+    "SHA512": hashlib.sha512,
+    "SHA3-256": hashlib.sha3_256,
+    "SHA3-384": hashlib.sha3_384,
+    "SHA3-512": hashlib.sha3_512,
+    "BLAKE2b-256": lambda: hashlib.blake2b(digest_size=32),
+    "BLAKE2b-384": lambda: hashlib.blake2b(digest_size=48),
+    "BLAKE2b-512": lambda: hashlib.blake2b(digest_size=64),
+    "MD5": hashlib.md5,
+    "ADLER32": _Adler32,
+}
+
+_ALGORITHMS_BY_KEY = {
+    name.upper().replace("-", "").replace("_", ""): constructor
+    for name, constructor in SPDX_ALGORITHMS.items()
+}
+
+
+def get_hasher(algorithm: str):
+    """Return a new hasher for an SPDX algorithm name, or None if it is not supported.
+
+    Names are matched ignoring case, dashes and underscores, so "sha256" and
+    "SHA-256" both select SHA256.
+    """
+    constructor = _ALGORITHMS_BY_KEY.get(
+        algorithm.upper().replace("-", "").replace("_", "")
+    )
+    return constructor() if constructor is not None else None
+
+
+class VerificationStatusEnum(str, Enum):
+    """The outcome of verifying a single distribution file."""
+
+    ok = "OK"
+    missing = "Missing"
+    sizeMismatch = "Size Mismatch"
+    checksumMismatch = "Checksum Mismatch"
+    unsupportedAlgorithm = "Unsupported Algorithm"
+    noChecksum = "No Checksum"
+    unreadable = "Unreadable"
+    outsideRoot = "Outside Root"
+
+
+class FileReport(BaseModel):
+    """Verification result for a single distribution file.
+
+    Fields
+    ------
+    name: Optional[str]
+        The distribution name (filename).
+    path: str
+        The local path that was verified.
+    status: VerificationStatusEnum
+        The outcome of the verification.
+    algorithm: Optional[str]
+        The checksum algorithm used.
+    expected: Optional[str]
+        The checksumValue recorded in the distribution.
+    actual: Optional[str]
+        The digest computed from the local file.
+    byteSize: Optional[int]
+        The size of the local file in bytes.
+    seconds: float
+        Time spent verifying the file.
+    """
+
+    name: Optional[str]
+    path: str
+    status: VerificationStatusEnum
+    algorithm: Optional[str] = None
+    expected: Optional[str] = None
+    actual: Optional[str] = None
+    byteSize: Optional[int] = None
+    seconds: float = 0.0
+
+
+class VerificationReport(BaseModel):
+    """Verification results for a set of distribution files.
+
+    Fields
+    ------
+    files: List[FileReport]
+        Per-file results, in input order.
+    counts: Dict[VerificationStatusEnum, int]
+        Number of files per status.
+    bytesHashed: int
+        Total bytes read and hashed.
+    seconds: float
+        Wall-clock time of the whole run.
+    throughputMBps: float
+        bytesHashed per second of wall-clock time, in MB (10^6 bytes).
+    """
+
+    files: List[FileReport]
+    counts: Dict[VerificationStatusEnum, int]
+    bytesHashed: int
+    seconds: float
+    throughputMBps: float
+
+    @property
+    def ok(self) -> bool:
+        return all(f.status == VerificationStatusEnum.ok for f in self.files)
+
+
+def hash_file(
+    path: Union[str, os.PathLike], hasher, chunk_size: int = CHUNK_SIZE
+) -> str:
+    """Hash a file with a reusable buffer so memory use does not depend on the file size."""
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def _inside(path: Union[str, os.PathLike], root: Union[str, os.PathLike]) -> bool:
+    resolved, root = Path(path).resolve(), Path(root).resolve()
+    return resolved != root and resolved.is_relative_to(root)
+
+
+def verify_file(
+    distribution: Distribution,
+    path: Union[str, os.PathLike],
+    chunk_size: int = CHUNK_SIZE,
+    root: Optional[Union[str, os.PathLike]] = None,
+) -> FileReport:
+    """Verify one local file against a distribution's byteSize and checksum.
+
+    The size is checked first so that truncated or wrong files are reported
+    without reading them. With ``root``, a path that resolves outside of it
+    (an absolute name, ``..``, a symlink) is reported and never read. Files
+    that exist but cannot be read are reported as unreadable.
+    """
+    start = time.perf_counter()
+    report = FileReport(
+        name=distribution.name, path=str(path), status=VerificationStatusEnum.ok
+    )
+    checksum = distribution.checksum
+    if checksum is not None:
+        report.algorithm = checksum.algorithm
+        report.expected = checksum.checksumValue
+
+    if root is not None and not _inside(path, root):
+        report.status = VerificationStatusEnum.outsideRoot
+        return report
+    try:
+        report.byteSize = os.stat(path).st_size
+    except FileNotFoundError:
+        report.status = VerificationStatusEnum.missing
+        return report
+    except OSError:
+        report.status = VerificationStatusEnum.unreadable
+        return report
+
+    if distribution.byteSize is not None and distribution.byteSize != report.byteSize:
+        report.status = VerificationStatusEnum.sizeMismatch
+    elif checksum is None:
+        report.status = VerificationStatusEnum.noChecksum
+    elif (hasher := get_hasher(checksum.algorithm)) is None:
+        report.status = VerificationStatusEnum.unsupportedAlgorithm
+    else:
+        try:
+            report.actual = hash_file(path, hasher, chunk_size)
+        except OSError:
+            # A directory, a permission problem or a read error.
+            report.status = VerificationStatusEnum.unreadable
+            report.seconds = time.perf_counter() - start
+            return report
+        if report.actual != checksum.checksumValue.lower():
+            report.status = VerificationStatusEnum.checksumMismatch
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def dataset_files(
+    dataset, resolve: Union[str, os.PathLike, Callable[[Distribution], Optional[str]]]
+) -> List[Tuple[Distribution, str]]:
+    """Map the distributions of a Dataset and its components to local paths.
+
+    ``resolve`` is either a directory, in which case each distribution is
+    expected at ``<directory>/<distribution.name>``, or a callable returning the
+    local path for a distribution (or None to skip it). Names are not trusted:
+    verify_dataset reports any that resolve outside the directory.
+    """
+    if not callable(resolve):
+        root = Path(resolve)
+
+        def resolve(distribution):
+            return root / distribution.name if distribution.name else None
+
+    distributions = list(dataset.distribution)
+    for component in dataset.component:
+        distributions.extend(component.distribution)
+    files = []
+    for distribution in distributions:
+        path = resolve(distribution)
+        if path is not None:
+            files.append((distribution, path))
+    return files
+
+
+def verify_files(
+    files: Iterable[Tuple[Distribution, Union[str, os.PathLike]]],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    root: Optional[Union[str, os.PathLike]] = None,
+) -> VerificationReport:
+    """Verify (distribution, local path) pairs in a thread pool.
+
+    hashlib releases the GIL while hashing, so threads hash files in parallel.
+    With ``root``, files outside that directory are reported instead of read.
+    """
+    start = time.perf_counter()
+    files = list(files)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reports = list(
+            pool.map(
+                lambda file: verify_file(*file, chunk_size=chunk_size, root=root),
+                files,
+            )
+        )
+    seconds = time.perf_counter() - start
+
+    counts: Dict[VerificationStatusEnum, int] = {}
+    for report in reports:
+        counts[report.status] = counts.get(report.status, 0) + 1
+    hashed = sum(r.byteSize for r in reports if r.actual is not None)
+    return VerificationReport(
+        files=reports,
+        counts=counts,
+        bytesHashed=hashed,
+        seconds=seconds,
+        throughputMBps=hashed / seconds / 1e6 if seconds else 0.0,
+    )
+
+
+def verify_dataset(
+    dataset,
+    resolve: Union[str, os.PathLike, Callable[[Distribution], Optional[str]]],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> VerificationReport:
+    """Verify every distribution of a Dataset (or DataRelease) and its components.
+
+    When ``resolve`` is a directory, only files inside it are read.
+    """
+    root = None if callable(resolve) else resolve
+    return verify_files(dataset_files(dataset, resolve), workers, chunk_size, root)
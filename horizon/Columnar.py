@@ -0,0 +1,222 @@
+from array import array
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+
+from .CatalogedResource import AccessRightsEnum, UsgsAssetTypeEnum
+from .DataRelease import DataRelease, StatusEnum, UsgsReleaseTypeEnum
+from .TemporalIndex import to_microseconds
+from ._util import get
+
+# Null markers. NULL_TIMESTAMP is the int64 value NumPy uses for NaT, so
+# timestamp columns can be viewed as datetime64[us] without conversion.
+NULL_CODE = -1
+NULL_TIMESTAMP = np.iinfo(np.int64).min
+NULL_SIZE = -1
+
+Record = Union[BaseModel, Dict[str, Any]]
+
+
+_DATETIME = TypeAdapter(datetime)
+
+
+def _timestamp(value) -> int:
+    if value is not None and not isinstance(value, datetime):
+        # ISO strings and Unix timestamps, parsed as the models parse them.
+        value = _DATETIME.validate_python(value)
+    return to_microseconds(value, NULL_TIMESTAMP)
+
+
+class DictionaryEncoder:
+    """Assign dense int32 codes to the distinct values of a column.
+
+    Enum columns are seeded with every member value in declaration order so
+    their codes are stable between runs.
+    """
+
+    def __init__(self, enum: Optional[Type[Enum]] = None):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for member in enum or ():
+            self.encode(member.value)
+
+    def encode(self, value) -> int:
+        if value is None:
+            return NULL_CODE
+        if isinstance(value, Enum):
+            value = value.value
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+_ENUM_COLUMNS = {
+    "usgsAssetType": UsgsAssetTypeEnum,
+    "accessRights": AccessRightsEnum,
+    "status": StatusEnum,
+    "usgsReleaseType": UsgsReleaseTypeEnum,
+}
+
+_TIMESTAMP_COLUMNS = ("issued", "modified", "usgsCreated", "usgsModified")
+
+_BBOX_COLUMNS = (
+    "westBoundLongitude",
+    "eastBoundLongitude",
+    "southBoundLatitude",
+    "northBoundLatitude",
+)
+
+
+class DatasetColumns:
+    """Columnar (struct-of-arrays) projection of a collection of Dataset or DataRelease records.
+
+    Built in a single pass over models or raw dicts. Raw dicts are read as
+    records of ``model``: a missing top-level field takes the model's default,
+    as it would when validated. Every column is a NumPy
+    array laid out the way Arrow lays out the matching type, so buffers can be
+    handed to Arrow without copying:
+
+    - enum and identifier columns are dictionary-encoded as int32 codes, with
+      the values in ``dictionaries[name]`` and NULL_CODE for missing values
+    - datetimes are int64 microseconds since the epoch (UTC), NULL_TIMESTAMP if missing
+    - bounding box columns are float64, NaN if missing
+    - strings and nested lists are flattened into child arrays with an
+      ``<name>.offsets`` array of length n + 1
+
+    For example, ``np.bincount(columns["accessRights"] + 1)`` counts records
+    per access right (index 0 holds missing values).
+    """
+
+    def __init__(
+        self, arrays: Dict[str, np.ndarray], dictionaries: Dict[str, List[str]]
+    ):
+        self.arrays = arrays
+        self.dictionaries = dictionaries
+
+    def __len__(self) -> int:
+        return len(self.arrays["usgsIdentifier.offsets"]) - 1
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays
+
+    def identifiers(self) -> List[str]:
+        """Decode the usgsIdentifier column."""
+        offsets = self.arrays["usgsIdentifier.offsets"]
+        data = self.arrays["usgsIdentifier"].tobytes()
+        return [data[offsets[i] : offsets[i + 1]].decode() for i in range(len(self))]
+
+    def decode(self, name: str) -> List[Optional[str]]:
+        """Decode a dictionary-encoded column back to its values."""
+        values = self.dictionaries[name]
+        return [
+            values[code] if code != NULL_CODE else None for code in self.arrays[name]
+        ]
+
+    def timestamps(self, name: str) -> np.ndarray:
+        """View a timestamp column as datetime64[us]; missing values become NaT."""
+        return self.arrays[name].view("datetime64[us]")
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Record], model: Type[BaseModel] = DataRelease
+    ) -> "DatasetColumns":
+        defaults = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in model.model_fields.items()
+            if not field.is_required()
+        }
+
+        def top_level(record, name):
+            if isinstance(record, dict):
+                return record.get(name, defaults.get(name))
+            return getattr(record, name, None)
+
+        encoders = {
+            name: DictionaryEncoder(enum) for name, enum in _ENUM_COLUMNS.items()
+        }
+        for name in (
+            "usgsDataSource.dataSourceId",
+            "usgsMissionArea.missionAreaId",
+            "distribution.mediaType",
+            "keyword.concept",
+        ):
+            encoders[name] = DictionaryEncoder()
+
+        identifier = bytearray()
+        identifier_offsets = array("q", [0])
+        codes = {name: array("i") for name in encoders}
+        timestamps = {name: array("q") for name in _TIMESTAMP_COLUMNS}
+        bbox = {name: array("d") for name in _BBOX_COLUMNS}
+        total_size = array("q")
+        distribution_offsets = array("q", [0])
+        distribution_size = array("q")
+        keyword_offsets = array("q", [0])
+
+        for record in records:
+            identifier += get(record, "usgsIdentifier").encode()
+            identifier_offsets.append(len(identifier))
+            for name in _ENUM_COLUMNS:
+                codes[name].append(encoders[name].encode(top_level(record, name)))
+            for name in _TIMESTAMP_COLUMNS:
+                timestamps[name].append(_timestamp(top_level(record, name)))
+            codes["usgsDataSource.dataSourceId"].append(
+                encoders["usgsDataSource.dataSourceId"].encode(
+                    get(get(record, "usgsDataSource"), "dataSourceId")
+                )
+            )
+            codes["usgsMissionArea.missionAreaId"].append(
+                encoders["usgsMissionArea.missionAreaId"].encode(
+                    get(get(record, "usgsMissionArea"), "missionAreaId")
+                )
+            )
+
+            box = get(get(record, "spatial"), "bbox")
+            for name in _BBOX_COLUMNS:
+                value = get(box, name)
+                bbox[name].append(np.nan if value is None else value)
+
+            total = 0
+            for distribution in get(record, "distribution") or ():
+                size = get(distribution, "byteSize")
+                distribution_size.append(NULL_SIZE if size is None else size)
+                codes["distribution.mediaType"].append(
+                    encoders["distribution.mediaType"].encode(
+                        get(distribution, "mediaType")
+                    )
+                )
+                total += size or 0
+            distribution_offsets.append(len(distribution_size))
+            for component in get(record, "component") or ():
+                for distribution in get(component, "distribution") or ():
+                    total += get(distribution, "byteSize") or 0
+            total_size.append(total)
+
+            for keyword in get(record, "keyword") or ():
+                codes["keyword.concept"].append(
+                    encoders["keyword.concept"].encode(get(keyword, "concept"))
+                )
+            keyword_offsets.append(len(codes["keyword.concept"]))
+
+        arrays = {
+            "usgsIdentifier": np.frombuffer(bytes(identifier), dtype=np.uint8),
+            "usgsIdentifier.offsets": np.array(identifier_offsets, dtype=np.int64),
+            "totalByteSize": np.array(total_size, dtype=np.int64),
+            "distribution.offsets": np.array(distribution_offsets, dtype=np.int64),
+            "distribution.byteSize": np.array(distribution_size, dtype=np.int64),
+            "keyword.offsets": np.array(keyword_offsets, dtype=np.int64),
+        }
+        for name, values in codes.items():
+            arrays[name] = np.array(values, dtype=np.int32)
+        for name, values in timestamps.items():
+            arrays[name] = np.array(values, dtype=np.int64)
+        for name, values in bbox.items():
+            arrays[f"spatial.bbox.{name}"] = np.array(values, dtype=np.float64)
+        return cls(arrays, {name: encoder.values for name, encoder in encoders.items()})
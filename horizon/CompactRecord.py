@@ -0,0 +1,353 @@
+import sys
+from collections.abc import Sequence
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, HttpUrl
+
+from .DataRelease import DataRelease
+
+# Strings up to this length are pooled; longer ones (descriptions, citations) are rarely repeated.
+MAX_POOLED_LENGTH = 256
+
+# Field kinds, decided once per field from its annotation.
+PLAIN, STRING, DATETIME, URL, MODEL, MODEL_LIST = range(6)
+
+
+class ValuePool:
+    """Canonical instances of repeated values shared by compact records.
+
+    Short strings, datetimes, URLs and whole compact sub-records (an agency
+    publisher, a license, a contact point) are stored once per pool, however
+    many records refer to them.
+
+    Values are only shared when they are indistinguishable, not merely equal:
+    datetimes are keyed with their time zone (equal instants at different
+    offsets compare equal), plain values with their type (a ``str`` enum
+    member equals its value), and sub-records by the identity of their own
+    pooled values.
+    """
+
+    def __init__(self):
+        self._values: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, value):
+        return self._values.setdefault(value, value)
+
+    def datetime(self, value: datetime) -> datetime:
+        return self._values.setdefault((value, value.utcoffset(), value.tzinfo), value)
+
+    def record(self, record: "CompactRecord") -> "CompactRecord":
+        return self._values.setdefault(_Indistinguishable(record), record)
+
+    def string(self, value: str) -> str:
+        if len(value) > MAX_POOLED_LENGTH:
+            return value
+        return self._values.setdefault(value, value)
+
+
+class _Indistinguishable:
+    """Pool key of a compact record: equal only to records with the very same values.
+
+    Datetimes, enum members and sub-records in a compact record are already
+    canonical instances, so they are compared by identity; other values must
+    also have the same type.
+    """
+
+    __slots__ = ("record",)
+
+    def __init__(self, record: "CompactRecord"):
+        self.record = record
+
+    def __hash__(self) -> int:
+        return hash(self.record)
+
+    def __eq__(self, other) -> bool:
+        mine, theirs = self.record, other.record
+        if type(mine) is not type(theirs) or mine._unset != theirs._unset:
+            return False
+        for a, b in zip(mine._values(), theirs._values()):
+            if isinstance(a, (CompactRecord, datetime, Enum)):
+                if a is not b:
+                    return False
+            elif isinstance(a, tuple):
+                if len(a) != len(b) or any(x is not y for x, y in zip(a, b)):
+                    return False
+            elif type(a) is not type(b) or a != b:
+                return False
+        return True
+
+
+def _kind(annotation) -> Tuple[int, Optional[Type[BaseModel]]]:
+    args = [a for a in get_args(annotation) if a is not type(None)]
+    if get_origin(annotation) is list:
+        kind, model = _kind(args[0])
+        return (MODEL_LIST, model) if kind == MODEL else (PLAIN, None)
+    if args and get_origin(annotation) is not None:
+        # Optional[X]
+        return _kind(args[0]) if len(args) == 1 else (PLAIN, None)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return MODEL, annotation
+        if issubclass(annotation, datetime):
+            return DATETIME, None
+        if issubclass(annotation, HttpUrl):
+            return URL, None
+        if annotation is str:
+            return STRING, None
+    return PLAIN, None
+
+
+class CompactRecord:
+    """Frozen, ``__slots__``-backed copy of a pydantic model instance.
+
+    Compact classes are generated from the models by ``compact_class``: one
+    slot per field, no per-instance ``__dict__``, lists stored as tuples, URLs
+    as strings, and nested models as compact records. Values that repeat
+    across records are shared through a ``ValuePool``. Enum members are kept
+    as the (singleton) members themselves.
+
+    Fields read like the model's (``record.title``,
+    ``record.distribution[0].byteSize``) and ``to_model`` converts back to an
+    equal model instance, including which fields were explicitly set.
+    """
+
+    __slots__ = ("_unset", "_hash")
+    __model__: Type[BaseModel]
+    __kinds__: Tuple[Tuple[str, int, Optional[Type[BaseModel]]], ...]
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    __delattr__ = __setattr__
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name, _, _ in self.__kinds__)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._unset == other._unset and self._values() == other._values()
+
+    def __hash__(self) -> int:
+        value = self._hash
+        if value is None:
+            value = hash((type(self), self._unset, self._values()))
+            object.__setattr__(self, "_hash", value)
+        return value
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name, _, _ in self.__kinds__
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return _restore, (self.__model__, self._unset, self._values())
+
+    @classmethod
+    def from_model(
+        cls, instance: BaseModel, pool: Optional[ValuePool] = None
+    ) -> "CompactRecord":
+        return to_compact(instance, pool)
+
+    def to_model(self) -> BaseModel:
+        """Rebuild the pydantic model instance (without revalidating it)."""
+        values = {}
+        for name, kind, _ in self.__kinds__:
+            value = getattr(self, name)
+            if value is not None:
+                if kind == URL:
+                    value = HttpUrl(value)
+                elif kind == MODEL:
+                    value = value.to_model()
+                elif kind == MODEL_LIST:
+                    value = [item.to_model() for item in value]
+            values[name] = value
+        fields_set = set(self.__model__.model_fields) - self._unset
+        return self.__model__.model_construct(fields_set, **values)
+
+
+def _restore(model, unset, values):
+    record = object.__new__(compact_class(model))
+    _fill(record, unset, values)
+    return record
+
+
+def _fill(record: CompactRecord, unset: FrozenSet[str], values: Iterable[Any]):
+    setter = object.__setattr__
+    setter(record, "_unset", unset)
+    setter(record, "_hash", None)
+    for (name, _, _), value in zip(record.__kinds__, values):
+        setter(record, name, value)
+
+
+@lru_cache(maxsize=None)
+def compact_class(model: Type[BaseModel] = DataRelease) -> Type[CompactRecord]:
+    """The compact record class generated from ``model``'s fields."""
+    kinds = tuple(
+        (name, *_kind(field.annotation)) for name, field in model.model_fields.items()
+    )
+    return type(
+        f"Compact{model.__name__}",
+        (CompactRecord,),
+        {
+            "__slots__": tuple(name for name, _, _ in kinds),
+            "__model__": model,
+            "__kinds__": kinds,
+            "__module__": __name__,
+        },
+    )
+
+
+def to_compact(instance: BaseModel, pool: Optional[ValuePool] = None) -> CompactRecord:
+    """Convert a model instance to its compact record, sharing values through ``pool``."""
+    pool = ValuePool() if pool is None else pool
+    cls = compact_class(type(instance))
+    values = []
+    for name, kind, _ in cls.__kinds__:
+        value = getattr(instance, name)
+        if value is not None:
+            if kind == STRING:
+                value = pool.string(value) if type(value) is str else value
+            elif kind == DATETIME:
+                value = pool.datetime(value)
+            elif kind == URL:
+                value = pool.string(str(value))
+            elif kind == MODEL:
+                value = pool.record(to_compact(value, pool))
+            elif kind == MODEL_LIST:
+                value = tuple(pool.record(to_compact(item, pool)) for item in value)
+        values.append(value)
+    unset = pool.get(frozenset(cls.__model__.model_fields) - instance.model_fields_set)
+    record = object.__new__(cls)
+    _fill(record, unset, values)
+    return record
+
+
+class CompactCatalog(Sequence):
+    """Read-only in-memory catalog of compact records sharing one ValuePool.
+
+    Indexing returns compact records; ``model(i)`` and ``models()`` convert
+    back to pydantic models on demand.
+    """
+
+    def __init__(self, records: Iterable[BaseModel] = ()):
+        self.pool = ValuePool()
+        self._records: List[CompactRecord] = []
+        self.extend(records)
+
+    def append(self, record: BaseModel):
+        self._records.append(to_compact(record, self.pool))
+
+    def extend(self, records: Iterable[BaseModel]):
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def model(self, index: int) -> BaseModel:
+        return self._records[index].to_model()
+
+    def models(self) -> Iterator[BaseModel]:
+        return (record.to_model() for record in self._records)
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """Bytes used by ``obj`` and everything it references, counting shared objects once.
+
+    Classes, functions and modules are not counted. Pass the same ``seen``
+    set to measure several objects together.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, BaseModel):
+            stack.append(obj.__dict__)
+            stack.append(obj.__pydantic_fields_set__)
+            stack.append(obj.__pydantic_extra__)
+            stack.append(obj.__pydantic_private__)
+        elif isinstance(obj, CompactRecord):
+            stack.extend(getattr(obj, name) for name in type(obj).__slots__)
+            stack.append(obj._unset)
+        elif isinstance(obj, CompactCatalog):
+            stack.append(obj._records)
+            stack.append(obj.pool._values)
+        elif hasattr(obj, "__dict__") and not callable(obj):
+            stack.append(obj.__dict__)
+    return total
+
+
+class MemoryReport(BaseModel):
+    """Memory used by a set of records as pydantic models and as a CompactCatalog.
+
+    Fields
+    ------
+    records: int
+        Number of records measured.
+    modelBytes: int
+        Bytes used by the model instances.
+    compactBytes: int
+        Bytes used by the compact catalog, including its value pool.
+    modelBytesPerRecord: float
+        Average bytes per model record.
+    compactBytesPerRecord: float
+        Average bytes per compact record.
+    ratio: float
+        modelBytes / compactBytes.
+    """
+
+    records: int
+    modelBytes: int
+    compactBytes: int
+    modelBytesPerRecord: float
+    compactBytesPerRecord: float
+    ratio: float
+
+
+def memory_report(records: List[BaseModel]) -> MemoryReport:
+    """Measure ``records`` as models and as a CompactCatalog built from them."""
+    catalog = CompactCatalog(records)
+    model_bytes = deep_sizeof(records) - sys.getsizeof(records)
+    compact_bytes = deep_sizeof(catalog)
+    count = max(len(records), 1)
+    return MemoryReport(
+        records=len(records),
+        modelBytes=model_bytes,
+        compactBytes=compact_bytes,
+        modelBytesPerRecord=round(model_bytes / count, 1),
+        compactBytesPerRecord=round(compact_bytes / count, 1),
+        ratio=round(model_bytes / max(compact_bytes, 1), 2),
+    )
@@ -0,0 +1,497 @@
+from collections.abc import Sequence
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, TypeAdapter
+from pydantic_core import Url, to_json
+
+from ._util import DOI_PREFIXES
+
+# A compiled rule: takes a record (or a nested value of it) and returns the output value.
+Rule = Callable[[Any], Any]
+
+
+class Path:
+    """Mapping rule: the value at a dotted path of the source record.
+
+    With ``typed``, datetimes are passed on as datetime objects instead of
+    ISO strings, for an ``Fn`` that formats them itself.
+    """
+
+    def __init__(self, path: str, typed: bool = False):
+        self.path = path
+        self.typed = typed
+
+
+class Each:
+    """Mapping rule: map every item of the list at ``path`` with ``template``.
+
+    A single object at ``path`` is treated as a one-item list. Items that map
+    to nothing are dropped.
+    """
+
+    def __init__(self, path: str, template: Any):
+        self.path = path
+        self.template = template
+
+
+class Fn:
+    """Mapping rule: ``function`` applied to the values of other rules."""
+
+    def __init__(self, function: Callable, *arguments: Any):
+        self.function = function
+        self.arguments = arguments
+
+
+class Obj:
+    """Mapping rule: an output object that is dropped unless every ``required`` key has a value."""
+
+    def __init__(self, template: Dict[str, Any], required: Iterable[str] = ()):
+        self.template = template
+        self.required = tuple(required)
+
+
+def _empty(value) -> bool:
+    return value is None or value == [] or value == {}
+
+
+def _is_sequence(value) -> bool:
+    # Lists, tuples and sequence views such as LazyDistributionList, but not strings.
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+
+
+def _scalar(value):
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float, dict, BaseModel)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (AnyUrl, Url)):
+        return str(value)
+    raise TypeError(f"Cannot export a {type(value).__name__} value")
+
+
+def _typed_scalar(value):
+    return value if isinstance(value, datetime) else _scalar(value)
+
+
+def _walk(value, steps: List[str], start: int, scalar: Rule = _scalar):
+    for i in range(start, len(steps)):
+        if value is None:
+            return None
+        if _is_sequence(value):
+            # Paths through lists collect the value of every item.
+            return [_walk(item, steps, i, scalar) for item in value]
+        if isinstance(value, dict):
+            value = value.get(steps[i])
+        else:
+            value = getattr(value, steps[i], None)
+    if _is_sequence(value):
+        return [scalar(item) for item in value]
+    return scalar(value)
+
+
+def _getter(path: str, typed: bool = False) -> Rule:
+    steps = path.split(".")
+    scalar = _typed_scalar if typed else _scalar
+    return lambda record: _walk(record, steps, 0, scalar)
+
+
+def _flatten(value) -> Iterator[Any]:
+    if _is_sequence(value):
+        for item in value:
+            yield from _flatten(item)
+    elif value is not None:
+        yield value
+
+
+def compile_mapping(spec: Any) -> Rule:
+    """Compile a mapping specification into a single transformation function.
+
+    The specification mirrors the output document. Dicts, lists and ``Obj``
+    become objects and arrays, ``Path``, ``Each`` and ``Fn`` read the source
+    record, and any other value is a constant. Source records may be models or
+    raw dicts. Output objects and arrays omit empty values (None, [] or {}).
+    Every path is parsed, and every rule resolved, once at compile time.
+    """
+    if isinstance(spec, Path):
+        return _getter(spec.path, spec.typed)
+    if isinstance(spec, Each):
+        items = _getter(spec.path)
+        template = compile_mapping(spec.template)
+
+        def each(record):
+            value = items(record)
+            if value is None:
+                return None
+            if not _is_sequence(value):
+                value = [value]
+            mapped = [template(item) for item in value]
+            return [item for item in mapped if not _empty(item)]
+
+        return each
+    if isinstance(spec, Fn):
+        arguments = [compile_mapping(argument) for argument in spec.arguments]
+        function = spec.function
+        return lambda record: function(*[argument(record) for argument in arguments])
+    if isinstance(spec, (dict, Obj)):
+        template = spec.template if isinstance(spec, Obj) else spec
+        required = spec.required if isinstance(spec, Obj) else ()
+        fields = [(key, compile_mapping(value)) for key, value in template.items()]
+
+        def obj(record):
+            result = {}
+            for key, rule in fields:
+                value = rule(record)
+                if not _empty(value):
+                    result[key] = value
+            for key in required:
+                if key not in result:
+                    return None
+            return result
+
+        return obj
+    if isinstance(spec, list):
+        rules = [compile_mapping(item) for item in spec]
+
+        def array(record):
+            values = [rule(record) for rule in rules]
+            return [value for value in values if not _empty(value)]
+
+        return array
+    return lambda record: spec
+
+
+def _doi(identifier: Optional[str]) -> Optional[str]:
+    if not identifier:
+        return None
+    for prefix in DOI_PREFIXES:
+        if identifier.lower().startswith(prefix):
+            return identifier[len(prefix) :]
+    return None
+
+
+_DATETIME = TypeAdapter(datetime)
+
+
+def _datetime(value: Union[datetime, str, int, None]) -> Optional[str]:
+    """ISO 8601 form of a datetime value as the model would validate it.
+
+    Model records give datetimes, which are formatted directly. Raw dicts carry
+    whatever the source had (``Z`` suffixes, spaces, timestamps), so those
+    values are parsed first.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = _DATETIME.validate_python(value)
+    return value.isoformat()
+
+
+def _when(path: str) -> Fn:
+    return Fn(_datetime, Path(path, typed=True))
+
+
+def _year(issued: Union[datetime, str, int, None]) -> Optional[str]:
+    return _datetime(issued)[:4] if issued else None
+
+
+def _pascal(value: Optional[str]) -> Optional[str]:
+    """DataCite vocabulary form of an enum value, e.g. "Is Part Of" -> "IsPartOf"."""
+    return value.replace(" ", "") if value else None
+
+
+def _name_type(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    # DataCite only has Personal and Organizational; a service is an organization's.
+    return "Organizational" if value in ("Organizational", "Service") else "Personal"
+
+
+def _name_identifiers(identifier: Optional[str]) -> Optional[List[Dict[str, str]]]:
+    if not identifier:
+        return None
+    entry = {"nameIdentifier": identifier}
+    if "orcid.org" in identifier:
+        entry.update(nameIdentifierScheme="ORCID", schemeUri="https://orcid.org")
+    return [entry]
+
+
+def _affiliation(name: Optional[str], identifier: Optional[str]):
+    if not name:
+        return None
+    entry = {"name": name}
+    if identifier:
+        entry["affiliationIdentifier"] = identifier
+    return [entry]
+
+
+def _resource_type_general(asset_type: Optional[str]) -> str:
+    return {
+        "Model": "Model",
+        "Publication": "Text",
+        "Software": "Software",
+    }.get(asset_type, "Dataset")
+
+
+def _formats(*media_types) -> Optional[List[str]]:
+    return list(dict.fromkeys(_flatten(list(media_types)))) or None
+
+
+def _sizes(*sizes) -> Optional[List[str]]:
+    total = sum(_flatten(list(sizes)))
+    return [f"{total} bytes"] if total else None
+
+
+_CREATOR = {
+    "name": Path("name"),
+    "nameType": Fn(_name_type, Path("nameType")),
+    "nameIdentifiers": Fn(_name_identifiers, Path("nameIdentifier")),
+    "affiliation": Fn(_affiliation, Path("affiliation"), Path("affiliationIdentifier")),
+}
+
+DATACITE = {
+    "doi": Fn(_doi, Path("identifier")),
+    "url": Path("identifier"),
+    "types": {
+        "resourceTypeGeneral": Fn(_resource_type_general, Path("usgsAssetType")),
+        "resourceType": Path("usgsAssetType"),
+    },
+    "creators": Each("creator", _CREATOR),
+    "titles": [Obj({"title": Path("title")}, required=("title",))],
+    "publisher": Path("publisher.name"),
+    "publicationYear": Fn(_year, Path("issued", typed=True)),
+    "subjects": Each(
+        "keyword",
+        {
+            "subject": Path("concept"),
+            "subjectScheme": Path("conceptScheme"),
+            "valueUri": Path("conceptUri"),
+        },
+    ),
+    "contributors": Each(
+        "qualifiedAttribution",
+        dict(_CREATOR, contributorType=Fn(_pascal, Path("contributorType"))),
+    ),
+    "dates": [
+        Obj({"date": _when(name), "dateType": kind}, required=("date",))
+        for name, kind in (
+            ("issued", "Issued"),
+            ("modified", "Updated"),
+            ("usgsCreated", "Created"),
+        )
+    ],
+    "alternateIdentifiers": Each(
+        "alternateIdentifier",
+        {
+            "alternateIdentifier": Path("identifier"),
+            "alternateIdentifierType": Path("identifierType"),
+        },
+    ),
+    "relatedIdentifiers": Each(
+        "relation",
+        {
+            "relatedIdentifier": Path("relatedIdentifier"),
+            "relatedIdentifierType": Path("relatedIdentifierType"),
+            "relationType": Fn(_pascal, Path("dataciteRelationType")),
+        },
+    ),
+    "sizes": Fn(
+        _sizes,
+        Path("distribution.byteSize"),
+        Path("component.distribution.byteSize"),
+    ),
+    "formats": Fn(
+        _formats,
+        Path("distribution.mediaType"),
+        Path("component.distribution.mediaType"),
+    ),
+    "version": Path("versionHistory.version"),
+    "rightsList": [
+        Obj(
+            {
+                "rights": Path("license.license"),
+                "rightsUri": Path("license.licenseUri"),
+                "rightsIdentifier": Path("license.licenseIdentifier"),
+                "rightsIdentifierScheme": Path("license.licenseIdentifierScheme"),
+                "schemeUri": Path("license.schemeUri"),
+            },
+            required=("rights",),
+        )
+    ],
+    "descriptions": [
+        Obj(
+            {"description": Path("description"), "descriptionType": "Abstract"},
+            required=("description",),
+        ),
+        Obj(
+            {"description": Path("usgsPurpose"), "descriptionType": "Other"},
+            required=("description",),
+        ),
+    ],
+    "geoLocations": [
+        {
+            "geoLocationBox": Obj(
+                {
+                    name: Path(f"spatial.bbox.{name}")
+                    for name in (
+                        "westBoundLongitude",
+                        "eastBoundLongitude",
+                        "southBoundLatitude",
+                        "northBoundLatitude",
+                    )
+                },
+                required=("westBoundLongitude",),
+            ),
+            "geoLocationPoint": Obj(
+                {
+                    "pointLongitude": Path("spatial.centroid.pointLongitude"),
+                    "pointLatitude": Path("spatial.centroid.pointLatitude"),
+                },
+                required=("pointLongitude",),
+            ),
+        }
+    ],
+}
+
+
+def _access_level(access_rights: Optional[str]) -> str:
+    return "public" if access_rights == "Public" else "non-public"
+
+
+def _mailto(email: Optional[str]) -> Optional[str]:
+    return f"mailto:{email}" if email else None
+
+
+def _first(*values):
+    for value in values:
+        if value:
+            return value
+    return None
+
+
+def _spatial(west, south, east, north) -> Optional[str]:
+    if None in (west, south, east, north):
+        return None
+    return f"{west},{south},{east},{north}"
+
+
+_start_date = _getter("startDate", typed=True)
+_end_date = _getter("endDate", typed=True)
+
+
+def _temporal(period) -> Optional[str]:
+    if not period:
+        return None
+    period = period[0] if _is_sequence(period) else period
+    start, end = _datetime(_start_date(period)), _datetime(_end_date(period))
+    if not start and not end:
+        return None
+    return f"{start or '..'}/{end or '..'}"
+
+
+# USGS codes from the OMB Federal Program Inventory.
+BUREAU_CODE = "010:12"
+PROGRAM_CODE = "010:000"
+
+DCAT_US = {
+    "@type": "dcat:Dataset",
+    "title": Path("title"),
+    "description": Path("description"),
+    "keyword": Each("keyword", Path("concept")),
+    "modified": Fn(_first, _when("modified"), _when("usgsModified")),
+    "issued": _when("issued"),
+    "publisher": Obj(
+        {"@type": "org:Organization", "name": Path("publisher.name")},
+        required=("name",),
+    ),
+    "contactPoint": Obj(
+        {
+            "@type": "vcard:Contact",
+            "fn": Path("contactPoint.name"),
+            "hasEmail": Fn(_mailto, Path("contactPoint.email")),
+        },
+        required=("fn",),
+    ),
+    "identifier": Fn(_first, Path("identifier"), Path("usgsIdentifier")),
+    "accessLevel": Fn(_access_level, Path("accessRights")),
+    "bureauCode": [BUREAU_CODE],
+    "programCode": [PROGRAM_CODE],
+    "license": Path("license.licenseUri"),
+    "rights": Path("license.license"),
+    "spatial": Fn(
+        _spatial,
+        Path("spatial.bbox.westBoundLongitude"),
+        Path("spatial.bbox.southBoundLatitude"),
+        Path("spatial.bbox.eastBoundLongitude"),
+        Path("spatial.bbox.northBoundLatitude"),
+    ),
+    "temporal": Fn(_temporal, Path("temporal")),
+    "distribution": Each(
+        "distribution",
+        {
+            "@type": "dcat:Distribution",
+            "title": Path("title"),
+            "description": Path("description"),
+            "downloadURL": Path("downloadURL"),
+            "accessURL": Path("accessURL"),
+            "mediaType": Path("mediaType"),
+            "format": Path("format"),
+        },
+    ),
+    "references": Each("relation", Path("relatedIdentifier")),
+    "version": Path("versionHistory.version"),
+}
+
+DCAT_US_CONTEXT = "https://project-open-data.cio.gov/v1.1/schema/catalog.jsonld"
+DCAT_US_SCHEMA = "https://project-open-data.cio.gov/v1.1/schema"
+
+MAPPINGS = {"datacite": DATACITE, "dcat-us": DCAT_US}
+
+
+@lru_cache(maxsize=None)
+def plan(target: str) -> Rule:
+    """The compiled transformation for a target format ("datacite" or "dcat-us")."""
+    if target not in MAPPINGS:
+        raise ValueError(f"Unknown crosswalk target {target!r}")
+    return compile_mapping(MAPPINGS[target])
+
+
+def export(records: Iterable[Any], target: str) -> Iterator[Dict[str, Any]]:
+    """Lazily transform Dataset/DataRelease models or raw dicts into ``target`` documents."""
+    transform = plan(target)
+    for record in records:
+        yield transform(record)
+
+
+def write_datacite(records: Iterable[Any], f: IO[bytes]) -> int:
+    """Stream DataCite JSON as NDJSON, one ``{"data": {"type": "dois", ...}}`` per line."""
+    transform = plan("datacite")
+    n = 0
+    for record in records:
+        f.write(to_json({"data": {"type": "dois", "attributes": transform(record)}}))
+        f.write(b"\n")
+        n += 1
+    return n
+
+
+def write_dcat_us(records: Iterable[Any], f: IO[bytes]) -> int:
+    """Stream a DCAT-US (Project Open Data v1.1) catalog JSON-LD document."""
+    transform = plan("dcat-us")
+    header = {
+        "@context": DCAT_US_CONTEXT,
+        "@type": "dcat:Catalog",
+        "conformsTo": DCAT_US_SCHEMA,
+    }
+    f.write(to_json(header)[:-1] + b',"dataset":[')
+    n = 0
+    for record in records:
+        if n:
+            f.write(b",")
+        f.write(to_json(transform(record)))
+        n += 1
+    f.write(b"]}\n")
+    return n
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import List, Optional
 from enum import Enum
 from datetime import datetime
@@ -19,6 +19,8 @@ class Keyword(BaseModel):
         The URI of the concept
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     concept: str
     conceptScheme: str = None
     conceptUri: Optional[HttpUrl]
@@ -102,6 +104,8 @@ class RelatedIdentifier(BaseModel):
         The type of related identifier.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     dataciteRelationType: DataciteRelationTypeEnum
     relatedIdentifier: str
     primaryRelatedIdentifier: bool  # Should we get rid of this?
@@ -137,6 +141,8 @@ class AlternateIdentifier(BaseModel):
         The type of alternate identifier
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     identifier: str
     identifierType: AlternateIdentifierTypeEnum
 
@@ -154,6 +160,8 @@ class PeriodOfTime(BaseModel):
         The end of the period
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     startDate: Optional[datetime]
     endDate: Optional[datetime]
 
@@ -166,6 +174,8 @@ class UsgsDataSource(BaseModel):
     dataSourceId: str
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     dataSourceId: str
 
@@ -178,6 +188,8 @@ class UsgsMissionArea(BaseModel):
     missionAreaId: str
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     missionAreaId: str
 
@@ -194,6 +206,8 @@ class VersionHistory(BaseModel):
         A description of changes between this version and the previous version of the resource
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     version: Optional[str]
     issued: Optional[datetime]
     versionNotes: Optional[datetime]
@@ -224,6 +238,8 @@ class Component(BaseModel):
         USGS Metadata PID
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     identifier: Optional[HttpUrl]
     title: str
     description: str
@@ -0,0 +1,236 @@
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
+
+from .CatalogedResource import CatalogedResource
+from .DataRelease import DataRelease
+from .Dataset import Dataset
+
+ModelResolver = Callable[[Path, bytes], Type[BaseModel]]
+Progress = Callable[[int, int], Any]
+
+
+class FileError(BaseModel):
+    """A metadata file that could not be read or validated.
+
+    Fields
+    ------
+    path: str
+        The file path.
+    errors: List[Dict[str, Any]]
+        The pydantic error details, or a single entry describing an I/O error.
+    """
+
+    path: str
+    errors: List[Dict[str, Any]]
+
+
+def _parse_and_detect(document: bytes) -> Tuple[Type[BaseModel], Any]:
+    """The model for a document and the parsed document (None if it is not JSON)."""
+    try:
+        parsed = from_json(document)
+    except ValueError:
+        return CatalogedResource, None
+    if not isinstance(parsed, dict):
+        return CatalogedResource, parsed
+    if "usgsReleaseType" in parsed or "status" in parsed:
+        return DataRelease, parsed
+    if "usgsCitation" in parsed:
+        return Dataset, parsed
+    return CatalogedResource, parsed
+
+
+def detect_model(path: Path, document: bytes) -> Type[BaseModel]:
+    """Pick the model for a metadata document from its top-level properties.
+
+    ``status`` and ``usgsReleaseType`` only exist on DataRelease, and
+    ``usgsCitation`` only on Dataset; anything else is a CatalogedResource.
+    The document is parsed to look at its keys (values such as a keyword
+    ``"status"`` must not count); ``load_file`` then validates that parsed
+    document instead of parsing it again. Documents that are not JSON objects
+    go to CatalogedResource, whose validation reports the problem.
+    """
+    return _parse_and_detect(document)[0]
+
+
+def discover(root: Union[str, os.PathLike], suffix: str = ".json") -> List[Path]:
+    """Recursively list the metadata files under ``root`` in a stable (sorted) order."""
+    found = []
+    stack = [Path(root)]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.name.endswith(suffix):
+                    found.append(Path(entry.path))
+    found.sort()
+    return found
+
+
+def load_file(
+    path: Path, model: Union[Type[BaseModel], ModelResolver, None] = None
+) -> Union[BaseModel, FileError]:
+    """Read and validate one metadata file. Runs in a worker thread."""
+    try:
+        document = path.read_bytes()
+    except OSError as exc:
+        return FileError(path=str(path), errors=[{"type": "os_error", "msg": str(exc)}])
+    parsed = None
+    if model is None:
+        model, parsed = _parse_and_detect(document)
+    elif not isinstance(model, type):
+        model = model(path, document)
+    try:
+        if parsed is not None:
+            return model.model_validate(parsed)
+        return model.model_validate_json(document)
+    except ValidationError as exc:
+        return FileError(
+            path=str(path),
+            errors=exc.errors(
+                include_url=False, include_context=False, include_input=False
+            ),
+        )
+
+
+async def aload_directory(
+    root: Union[str, os.PathLike],
+    model: Union[Type[BaseModel], ModelResolver, None] = None,
+    concurrency: int = 32,
+    ordered: bool = False,
+    progress: Optional[Progress] = None,
+    suffix: str = ".json",
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Tuple[Path, Union[BaseModel, FileError]]]:
+    """Load every metadata file under ``root``, yielding (path, model or FileError) pairs.
+
+    Files are read and validated in a thread pool with at most ``concurrency``
+    files in flight. Results are yielded as soon as they are ready, or in path
+    order when ``ordered`` is true.
+
+    Parameters
+    ----------
+    root: str or PathLike
+        The metadata directory tree.
+    model: Type[BaseModel] or callable, optional
+        The model to validate every file against, or a callable
+        ``(path, document) -> model``. By default the model is picked from the
+        document by ``detect_model``.
+    concurrency: int
+        Maximum number of files being read or validated at once.
+    ordered: bool
+        Yield results in path order instead of completion order.
+    progress: callable, optional
+        Called as ``progress(done, total)`` after each file.
+    suffix: str
+        Only files ending with this suffix are loaded.
+    executor: Executor, optional
+        The executor used for file I/O and validation. A thread pool sized to
+        ``concurrency`` is created (and shut down) when not given.
+    """
+    loop = asyncio.get_running_loop()
+    paths = await loop.run_in_executor(executor, discover, root, suffix)
+    total = len(paths)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def submit(path):
+        return loop.run_in_executor(executor, load_file, path, model)
+
+    remaining = iter(paths)
+    done = 0
+    try:
+        if ordered:
+            pending = deque()
+            for path in remaining:
+                pending.append((path, submit(path)))
+                if len(pending) >= concurrency:
+                    path, future = pending.popleft()
+                    result = await future
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+                    yield path, result
+            while pending:
+                path, future = pending.popleft()
+                result = await future
+                done += 1
+                if progress is not None:
+                    progress(done, total)
+                yield path, result
+        else:
+            pending = {}
+            for path in remaining:
+                pending[submit(path)] = path
+                if len(pending) < concurrency:
+                    continue
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in finished:
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+                    yield pending.pop(future), future.result()
+            while pending:
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in finished:
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+                    yield pending.pop(future), future.result()
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def load_directory(
+    root: Union[str, os.PathLike],
+    model: Union[Type[BaseModel], ModelResolver, None] = None,
+    concurrency: int = 32,
+    progress: Optional[Progress] = None,
+    suffix: str = ".json",
+) -> Iterator[Tuple[Path, Union[BaseModel, FileError]]]:
+    """Synchronous counterpart of ``aload_directory``; yields results in path order."""
+    paths = discover(root, suffix)
+    total = len(paths)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque()
+        done = 0
+        for path in paths:
+            pending.append((path, executor.submit(load_file, path, model)))
+            if len(pending) < concurrency:
+                continue
+            path, future = pending.popleft()
+            done += 1
+            if progress is not None:
+                progress(done, total)
+            yield path, future.result()
+        while pending:
+            path, future = pending.popleft()
+            done += 1
+            if progress is not None:
+                progress(done, total)
+            yield path, future.result()
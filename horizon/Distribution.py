@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional
 from datetime import datetime
 from .Entity import Entity
@@ -22,6 +22,8 @@ class Checksum(BaseModel):
         encoded digest value produced using a specific algorithm
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     algorithm: str
     checksumValue: str
 
@@ -61,6 +63,8 @@ class Distribution(BaseModel):
         We may need a special preview class to make this work
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     title: Optional[str]
     name: Optional[str]
     description: Optional[str]
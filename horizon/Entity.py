@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional
 from enum import Enum
 from datetime import datetime
@@ -65,6 +65,8 @@ class Entity(BaseModel):
 
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     entity_id: Optional[str]
     name: str
     nameType: NameTypeEnum
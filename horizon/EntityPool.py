@@ -0,0 +1,173 @@
+import sys
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Hashable, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict
+
+from .Entity import Entity
+
+
+class _Frozen:
+    """Mixin of the read-only classes of pooled entities.
+
+    Pooled entities compare equal to (and dump like) instances of the class
+    they were interned from.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            _plain(type(self)) is _plain(type(other))
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_private__ == other.__pydantic_private__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    __hash__ = BaseModel.__hash__
+
+    def __reduce__(self):
+        return _freeze, (_plain(type(self)), self.model_fields_set, self.__dict__)
+
+
+@lru_cache(maxsize=None)
+def frozen_class(cls: Type[Entity]) -> Type[Entity]:
+    """The read-only subclass of an Entity class (Entity, Creator, Contributor) used by pools."""
+    return type(
+        cls.__name__,
+        (_Frozen, cls),
+        {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": f"Read-only {cls.__name__} shared between records by an EntityPool.",
+            "model_config": ConfigDict(frozen=True),
+        },
+    )
+
+
+def _freeze(cls: Type[Entity], fields_set, values) -> Entity:
+    return frozen_class(cls).model_construct(fields_set, **values)
+
+
+def _plain(cls: type) -> type:
+    """The class an entity class was frozen from (the class itself if not frozen)."""
+    return cls.__mro__[2] if issubclass(cls, _Frozen) else cls
+
+
+class PoolStats(BaseModel):
+    """Interning statistics of an EntityPool.
+
+    Fields
+    ------
+    hits: int
+        Number of entities replaced by an already pooled instance.
+    misses: int
+        Number of entities added to the pool.
+    hitRate: float
+        hits / (hits + misses)
+    uniqueEntities: int
+        Number of distinct entities held by the pool.
+    bytesSaved: int
+        Estimated memory released by sharing pooled instances instead of keeping duplicates.
+    """
+
+    hits: int
+    misses: int
+    hitRate: float
+    uniqueEntities: int
+    bytesSaved: int
+
+
+def _instance_size(entity: Entity) -> int:
+    """Estimate the memory held by a single entity instance and its field values."""
+    size = sys.getsizeof(entity) + sys.getsizeof(entity.__dict__)
+    size += sys.getsizeof(entity.__pydantic_fields_set__)
+    for value in entity.__dict__.values():
+        if value is not None and not isinstance(value, Enum):
+            size += sys.getsizeof(value)
+    return size
+
+
+class EntityPool:
+    """Opt-in flyweight pool that deduplicates Entity, Creator and Contributor instances.
+
+    A single read-only instance is shared by every record that refers to the
+    same publisher, contact or creator. Pooled instances belong to a frozen
+    subclass of the entity's class (see ``frozen_class``): assigning to one of
+    their fields raises, instead of silently changing every record that shares
+    it, while they still compare equal to, dump like and are instances of the
+    original class. Use ``model_copy(update=...)`` to change one record's
+    entity. Entities are keyed on their class and all field values, including
+    entity_id and nameIdentifier, so two entities that share an identifier but
+    differ in any field are never merged.
+    """
+
+    def __init__(self):
+        self._entities: Dict[Hashable, Entity] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    @staticmethod
+    def key(entity: Entity) -> Tuple:
+        return (_plain(type(entity)), tuple(entity.__dict__.values()))
+
+    def intern(self, entity: Optional[Entity]) -> Optional[Entity]:
+        """Return the pooled read-only instance equal to ``entity``, pooling a frozen copy if new."""
+        if entity is None:
+            return None
+        key = self.key(entity)
+        pooled = self._entities.get(key)
+        if pooled is not None:
+            self.hits += 1
+            if pooled is not entity:
+                self.bytes_saved += _instance_size(entity)
+            return pooled
+
+        self.misses += 1
+        if not isinstance(entity, _Frozen):
+            entity = _freeze(type(entity), entity.model_fields_set, entity.__dict__)
+        self._entities[key] = entity
+        return entity
+
+    def _intern_distributions(self, distributions):
+        for distribution in distributions or ():
+            distribution.modifiedBy = self.intern(distribution.modifiedBy)
+
+    def intern_dataset(self, dataset):
+        """Replace every entity referenced by a Dataset (or DataRelease) with its pooled instance.
+
+        Covers publisher, contactPoint, usgsMetadataContactPoint, creator,
+        qualifiedAttribution and the modifiedBy entity of every distribution,
+        including the distributions of each component. The dataset is updated
+        in place and returned.
+        """
+        dataset.publisher = self.intern(dataset.publisher)
+        dataset.contactPoint = self.intern(dataset.contactPoint)
+        dataset.usgsMetadataContactPoint = self.intern(dataset.usgsMetadataContactPoint)
+        dataset.qualifiedAttribution = self.intern(dataset.qualifiedAttribution)
+        dataset.creator[:] = [self.intern(creator) for creator in dataset.creator]
+        self._intern_distributions(dataset.distribution)
+        for component in dataset.component:
+            self._intern_distributions(component.distribution)
+        return dataset
+
+    def stats(self) -> PoolStats:
+        lookups = self.hits + self.misses
+        return PoolStats(
+            hits=self.hits,
+            misses=self.misses,
+            hitRate=self.hits / lookups if lookups else 0.0,
+            uniqueEntities=len(self._entities),
+            bytesSaved=self.bytes_saved,
+        )
+
+    def clear(self):
+        self._entities.clear()
+        self.hits = self.misses = self.bytes_saved = 0
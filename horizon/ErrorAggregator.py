@@ -0,0 +1,288 @@
+import json
+import os
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from .DataRelease import DataRelease
+from .StreamingValidator import LineError, iter_batches, validate_batch
+
+
+class ErrorGroup(BaseModel):
+    """Validation errors that share a model, field path and error type.
+
+    Fields
+    ------
+    model: str
+        The model the records were validated against.
+    path: str
+        The dotted field path, with list indices replaced by ``*``,
+        e.g. ``distribution.*.downloadURL``.
+    type: str
+        The pydantic error type, e.g. ``url_parsing``.
+    message: str
+        The message of the first error in the group.
+    count: int
+        Number of errors in the group.
+    sampleIdentifiers: List[str]
+        usgsIdentifier of the first failing records (when the record has one).
+    sampleLines: List[int]
+        Line numbers of the first failing records.
+    """
+
+    model: str
+    path: str
+    type: str
+    message: str
+    count: int
+    sampleIdentifiers: List[str]
+    sampleLines: List[int]
+
+
+class BulkValidationResult(BaseModel):
+    """Outcome of validating a whole feed.
+
+    Fields
+    ------
+    total: int
+        Number of records read from the feed.
+    checked: int
+        Number of records validated. Smaller than total in sampling or fail-fast mode.
+    valid: int
+        Number of valid records among those checked.
+    invalid: int
+        Number of invalid records among those checked.
+    errorRate: float
+        invalid / checked; an estimate for the whole feed when sampled.
+    sampled: bool
+        Whether only a random subset of the records was validated.
+    stopped: bool
+        Whether validation stopped early after reaching ``max_errors`` or
+        ``max_checked``.
+    groups: List[ErrorGroup]
+        The errors, grouped and sorted by decreasing count.
+    """
+
+    total: int
+    checked: int
+    valid: int
+    invalid: int
+    errorRate: float
+    sampled: bool
+    stopped: bool
+    groups: List[ErrorGroup]
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+    def summary(self) -> str:
+        """Short text summary listing each error group on its own line."""
+        lines = [
+            f"{self.invalid} of {self.checked} checked records invalid "
+            f"({self.errorRate:.1%}){' [sampled]' if self.sampled else ''}"
+            f"{' [stopped early]' if self.stopped else ''}"
+        ]
+        for group in self.groups:
+            samples = ", ".join(group.sampleIdentifiers)
+            lines.append(
+                f"{group.count:>8}  {group.model}.{group.path}  {group.type}"
+                f"  {group.message}" + (f"  (e.g. {samples})" if samples else "")
+            )
+        return "\n".join(lines)
+
+
+def _path(loc: Tuple) -> str:
+    return ".".join("*" if isinstance(part, int) else str(part) for part in loc)
+
+
+def _identifier(line: bytes) -> Optional[str]:
+    try:
+        document = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(document, dict):
+        identifier = document.get("usgsIdentifier")
+        if isinstance(identifier, str):
+            return identifier
+    return None
+
+
+class ErrorAggregator:
+    """Group validation errors by (model, field path, error type).
+
+    Only counts and the first ``samples`` failing records of each group are
+    kept, so memory stays bounded however many errors a feed has.
+    """
+
+    def __init__(self, model: Type[BaseModel] = DataRelease, samples: int = 5):
+        self.model = model
+        self.samples = samples
+        self.valid = 0
+        self.invalid = 0
+        self._groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def add_valid(self):
+        self.valid += 1
+
+    def add(
+        self,
+        errors: List[Dict[str, Any]],
+        lineNumber: Optional[int] = None,
+        line: Optional[bytes] = None,
+    ):
+        """Add the error details of one invalid record.
+
+        ``line`` is the raw record, read for its usgsIdentifier only while a
+        group still has room for samples.
+        """
+        self.invalid += 1
+        identifier = None
+        # A record is sampled once per group, however many of its errors fall in it.
+        sampled = set()
+        for error in errors:
+            key = (_path(error["loc"]), error["type"])
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = {
+                    "message": error["msg"],
+                    "count": 0,
+                    "sampleIdentifiers": [],
+                    "sampleLines": [],
+                }
+            group["count"] += 1
+            if key in sampled:
+                continue
+            sampled.add(key)
+            if lineNumber is not None and len(group["sampleLines"]) < self.samples:
+                group["sampleLines"].append(lineNumber)
+            if line is not None and len(group["sampleIdentifiers"]) < self.samples:
+                if identifier is None:
+                    identifier = _identifier(line) or ""
+                if identifier:
+                    group["sampleIdentifiers"].append(identifier)
+
+    def groups(self) -> List[ErrorGroup]:
+        groups = [
+            ErrorGroup(model=self.model.__name__, path=path, type=kind, **group)
+            for (path, kind), group in self._groups.items()
+        ]
+        groups.sort(key=lambda g: g.count, reverse=True)
+        return groups
+
+    def result(
+        self, total: int, sampled: bool = False, stopped: bool = False
+    ) -> BulkValidationResult:
+        checked = self.valid + self.invalid
+        return BulkValidationResult(
+            total=total,
+            checked=checked,
+            valid=self.valid,
+            invalid=self.invalid,
+            errorRate=self.invalid / checked if checked else 0.0,
+            sampled=sampled,
+            stopped=stopped,
+            groups=self.groups(),
+        )
+
+
+def _sampled_batches(
+    path,
+    batch_size: int,
+    fraction: float,
+    seed: int,
+    counter: List[int],
+    limit: Optional[int] = None,
+) -> Iterator[List[Tuple[int, bytes]]]:
+    rng = random.Random(seed)
+    batch = []
+    yielded = 0
+    for lines in iter_batches(path, batch_size):
+        for line in lines:
+            counter[0] += 1
+            if rng.random() >= fraction:
+                continue
+            batch.append(line)
+            # With a limit, the batch holding the last sampled record is
+            # yielded at once, so no more of the feed is read.
+            if len(batch) >= batch_size or yielded + len(batch) == limit:
+                yield batch
+                yielded += len(batch)
+                batch = []
+                if yielded == limit:
+                    return
+    if batch:
+        yield batch
+
+
+def validate_bulk(
+    path: Union[str, os.PathLike],
+    model: Type[BaseModel] = DataRelease,
+    batch_size: int = 1000,
+    max_errors: Optional[int] = None,
+    sample: Optional[float] = None,
+    max_checked: Optional[int] = None,
+    seed: int = 0,
+    samples: int = 5,
+) -> BulkValidationResult:
+    """Validate an NDJSON feed and aggregate its errors instead of raising them.
+
+    Parameters
+    ----------
+    path: str or PathLike
+        The NDJSON file to validate (optionally gzip).
+    model: Type[BaseModel]
+        The model to validate each record against.
+    batch_size: int
+        Number of lines validated together (see ``validate_batch``).
+    max_errors: Optional[int]
+        Fail fast: stop after this many invalid records.
+    sample: Optional[float]
+        Validate only this random fraction of the records, e.g. 0.01. The
+        error rate of the sample estimates the error rate of the feed, so a
+        broken feed can be rejected before validating all of it.
+    max_checked: Optional[int]
+        Stop reading the feed once this many records have been validated,
+        e.g. once a sample is large enough for its error rate. ``total`` then
+        counts only the records read so far.
+    seed: int
+        Seed of the sampling, so repeated runs check the same records.
+    samples: int
+        Number of sample records kept per error group.
+    """
+    aggregator = ErrorAggregator(model, samples)
+    counter = [0]
+    if max_checked is not None and max_checked < 1:
+        raise ValueError("max_checked must be at least 1")
+    if sample is not None:
+        if not 0 < sample <= 1:
+            raise ValueError("sample must be in (0, 1]")
+        batches = _sampled_batches(path, batch_size, sample, seed, counter, max_checked)
+    else:
+        batches = iter_batches(path, batch_size)
+
+    stopped = False
+    for batch in batches:
+        if sample is None:
+            if max_checked is not None:
+                batch = batch[: max_checked - counter[0]]
+            counter[0] += len(batch)
+        lines = dict(batch)
+        for result in validate_batch(batch, model):
+            if isinstance(result, LineError):
+                aggregator.add(
+                    result.errors, result.lineNumber, lines[result.lineNumber]
+                )
+                if max_errors is not None and aggregator.invalid >= max_errors:
+                    stopped = True
+                    break
+            else:
+                aggregator.add_valid()
+        if stopped:
+            break
+        checked = aggregator.valid + aggregator.invalid
+        if max_checked is not None and checked >= max_checked:
+            stopped = True
+            break
+    return aggregator.result(counter[0], sampled=sample is not None, stopped=stopped)
@@ -0,0 +1,131 @@
+from array import array
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+def normalize_concept(concept: str) -> str:
+    """Normalize a keyword concept for matching: trimmed, single-spaced and case-folded."""
+    return " ".join(concept.split()).casefold()
+
+
+class KeywordIndex:
+    """Inverted index from Dataset.keyword concepts to the datasets that use them.
+
+    Datasets are numbered in the order they are indexed, and each normalized
+    concept (and each conceptUri) maps to a sorted int32 NumPy array of those
+    numbers. AND/OR queries are set operations over the sorted arrays. Facet
+    counts per conceptScheme are computed once while the index is built and
+    can be narrowed to a query result without touching any model.
+
+    The index is built once from a loaded catalog; rebuild it after changes.
+    """
+
+    def __init__(self, datasets: Iterable):
+        self.keys: List[str] = []
+        self.labels: Dict[str, str] = {}
+        concepts: Dict[str, array] = {}
+        uris: Dict[str, array] = {}
+        # Every (conceptScheme, concept) pair is a facet. Each dataset's facets
+        # are stored as a CSR list so counts can be narrowed to any result set.
+        facet_ids: Dict[Tuple[Optional[str], str], int] = {}
+        doc_facets = array("i")
+        doc_offsets = array("q", [0])
+
+        for dataset in datasets:
+            doc = len(self.keys)
+            self.keys.append(dataset.usgsIdentifier)
+            seen = set()
+            for keyword in dataset.keyword or ():
+                concept = normalize_concept(keyword.concept)
+                self.labels.setdefault(concept, keyword.concept)
+                postings = concepts.setdefault(concept, array("i"))
+                if not postings or postings[-1] != doc:
+                    postings.append(doc)
+                if keyword.conceptUri is not None:
+                    postings = uris.setdefault(str(keyword.conceptUri), array("i"))
+                    if not postings or postings[-1] != doc:
+                        postings.append(doc)
+                facet = facet_ids.setdefault(
+                    (keyword.conceptScheme, concept), len(facet_ids)
+                )
+                if facet not in seen:
+                    seen.add(facet)
+                    doc_facets.append(facet)
+            doc_offsets.append(len(doc_facets))
+
+        self._concepts = {k: np.array(v, dtype=np.int32) for k, v in concepts.items()}
+        self._uris = {k: np.array(v, dtype=np.int32) for k, v in uris.items()}
+        self._facets = list(facet_ids)
+        self._scheme_facets: Dict[Optional[str], List[int]] = {}
+        for facet, (scheme, _) in enumerate(self._facets):
+            self._scheme_facets.setdefault(scheme, []).append(facet)
+        self._doc_facets = np.array(doc_facets, dtype=np.int32)
+        self._doc_offsets = np.array(doc_offsets, dtype=np.int64)
+        self._facet_counts = np.bincount(self._doc_facets, minlength=len(self._facets))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def postings(self, concept: str) -> np.ndarray:
+        """Sorted dataset numbers tagged with ``concept``. Concepts are matched after normalization."""
+        return self._concepts.get(normalize_concept(concept), np.empty(0, np.int32))
+
+    def uri_postings(self, conceptUri: str) -> np.ndarray:
+        """Sorted dataset numbers tagged with a keyword whose conceptUri is ``conceptUri``."""
+        return self._uris.get(str(conceptUri), np.empty(0, np.int32))
+
+    def all_of(self, *concepts: str) -> np.ndarray:
+        """Datasets tagged with every one of ``concepts`` (AND)."""
+        if not concepts:
+            return np.arange(len(self.keys), dtype=np.int32)
+        lists = sorted((self.postings(c) for c in concepts), key=len)
+        return reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), lists)
+
+    def any_of(self, *concepts: str) -> np.ndarray:
+        """Datasets tagged with at least one of ``concepts`` (OR)."""
+        if not concepts:
+            return np.empty(0, np.int32)
+        return np.unique(np.concatenate([self.postings(c) for c in concepts]))
+
+    def exclude(self, postings: np.ndarray, *concepts: str) -> np.ndarray:
+        """Remove datasets tagged with any of ``concepts`` from ``postings`` (NOT)."""
+        return np.setdiff1d(postings, self.any_of(*concepts), assume_unique=True)
+
+    def identifiers(self, postings: np.ndarray) -> List[str]:
+        """Map dataset numbers back to usgsIdentifiers."""
+        return [self.keys[doc] for doc in postings]
+
+    def schemes(self) -> List[Optional[str]]:
+        return list(self._scheme_facets)
+
+    def facet_counts(
+        self, conceptScheme: Optional[str], within: Optional[np.ndarray] = None
+    ) -> Dict[str, int]:
+        """Number of datasets per concept of a conceptScheme, most common first.
+
+        Without ``within`` the counts precomputed for the whole catalog are
+        returned. With ``within`` (for example the result of a query) only
+        those datasets are counted, by gathering their facets from the CSR
+        arrays and counting them in one pass.
+        """
+        if within is None:
+            counts = self._facet_counts
+        else:
+            within = np.asarray(within, dtype=np.int64)
+            starts = self._doc_offsets[within]
+            lengths = self._doc_offsets[within + 1] - starts
+            ends = np.cumsum(lengths)
+            positions = np.arange(ends[-1] if len(ends) else 0) + np.repeat(
+                starts - (ends - lengths), lengths
+            )
+            counts = np.bincount(
+                self._doc_facets[positions], minlength=len(self._facets)
+            )
+        facets = [
+            (self.labels[self._facets[facet][1]], int(counts[facet]))
+            for facet in self._scheme_facets.get(conceptScheme, ())
+            if counts[facet]
+        ]
+        return dict(sorted(facets, key=lambda item: -item[1]))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional
 
 
@@ -17,6 +17,8 @@ class License(BaseModel):
         The URI of the licenseIdentifierScheme
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     licenseIdentifier: Optional[str]
     license: str
     licenseUri: Optional[HttpUrl]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -18,6 +18,8 @@ class BoundingBox(BaseModel):
 
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     westBoundLongitude: float
     eastBoundLongitude: float
     southBoundLatitude: float
@@ -37,6 +39,8 @@ class Centroid(BaseModel):
 
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     pointLongitude: float
     pointLatitude: float
 
@@ -54,5 +58,7 @@ class Location(BaseModel):
         The longitude and latitude coordinates of the Location's centroid
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     bbox: Optional[BoundingBox]
     centroid: Optional[Centroid]
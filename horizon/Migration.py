@@ -0,0 +1,386 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from .DirectoryLoader import discover
+from .StreamingValidator import iter_batches
+
+# Key of the schema version stamp in stored records. Records without it are version 0.
+VERSION_KEY = "schemaVersion"
+
+Transform = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+# Outcomes of migrating one record.
+CURRENT, MIGRATED, CHANGED, FAILED = "current", "migrated", "changed", "failed"
+
+
+def _targets(record, path: List[str]):
+    """Yield the (container, key) pairs a dotted path with ``*`` list wildcards points to."""
+    if not path:
+        return
+    *parents, last = path
+    nodes = [record]
+    for step in parents:
+        following = []
+        for node in nodes:
+            if step == "*" and isinstance(node, list):
+                following.extend(node)
+            elif isinstance(node, dict) and node.get(step) is not None:
+                following.append(node[step])
+        nodes = following
+    for node in nodes:
+        if last == "*" and isinstance(node, list):
+            yield from ((node, i) for i in range(len(node)))
+        elif isinstance(node, dict):
+            yield node, last
+
+
+class DropField:
+    """Transform: remove the field at a dotted path, e.g. ``relation.*.primaryRelatedIdentifier``."""
+
+    def __init__(self, path: str):
+        self.path = path.split(".")
+
+    def __call__(self, record):
+        for node, key in _targets(record, self.path):
+            node.pop(key, None)
+        return record
+
+
+class RenameField:
+    """Transform: rename the field at a dotted path to ``name`` (in the same object)."""
+
+    def __init__(self, path: str, name: str):
+        self.path = path.split(".")
+        self.name = name
+
+    def __call__(self, record):
+        for node, key in _targets(record, self.path):
+            if key in node:
+                node[self.name] = node.pop(key)
+        return record
+
+
+class MapField:
+    """Transform: replace the value at a dotted path with ``function(value)`` where present."""
+
+    def __init__(self, path: str, function: Callable[[Any], Any]):
+        self.path = path.split(".")
+        self.function = function
+
+    def __call__(self, record):
+        for node, key in _targets(record, self.path):
+            if isinstance(node, list) or key in node:
+                node[key] = self.function(node[key])
+        return record
+
+
+class SetDefault:
+    """Transform: set the field at a dotted path to ``value`` where it is missing."""
+
+    def __init__(self, path: str, value: Any):
+        self.path = path.split(".")
+        self.value = value
+
+    def __call__(self, record):
+        for node, key in _targets(record, self.path):
+            if isinstance(node, dict):
+                node.setdefault(key, self.value)
+        return record
+
+
+class Chain:
+    """Transform: apply several transforms in order."""
+
+    def __init__(self, *transforms: Transform):
+        self.transforms = transforms
+
+    def __call__(self, record):
+        for transform in self.transforms:
+            record = transform(record)
+        return record
+
+
+class MigrationRegistry:
+    """Ordered per-version transforms of stored records.
+
+    Version ``n``'s transform upgrades a record from version ``n - 1`` to
+    ``n``; versions start at 1 and must be registered without gaps. Transforms
+    receive and return the record as a plain dict. For parallel migrations
+    they must be picklable, so use module-level functions or the transform
+    classes in this module (DropField, RenameField, MapField, SetDefault, Chain).
+    """
+
+    def __init__(self):
+        self.transforms: Dict[int, Transform] = {}
+        self.descriptions: Dict[int, str] = {}
+
+    @property
+    def latest(self) -> int:
+        return max(self.transforms, default=0)
+
+    def add(self, version: int, transform: Transform, description: str = ""):
+        if version in self.transforms:
+            raise ValueError(f"Migration to version {version} is already registered")
+        if version != self.latest + 1:
+            raise ValueError(f"Expected migration to version {self.latest + 1}")
+        self.transforms[version] = transform
+        self.descriptions[version] = description
+
+    def register(self, version: int, description: str = ""):
+        """Decorator form of ``add``."""
+
+        def decorator(transform: Transform) -> Transform:
+            self.add(version, transform, description)
+            return transform
+
+        return decorator
+
+    def migrate(
+        self, record: Dict[str, Any], target: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], List[int]]:
+        """Upgrade a record dict to ``target`` (default: latest), stamping its version.
+
+        Returns the record and the versions that were applied. The record is
+        modified in place.
+        """
+        target = self.latest if target is None else target
+        version = record.get(VERSION_KEY, 0)
+        applied = []
+        for step in range(version + 1, target + 1):
+            record = self.transforms[step](record)
+            record[VERSION_KEY] = step
+            applied.append(step)
+        return record, applied
+
+
+class MigrationReport(BaseModel):
+    """Counts of a bulk migration (or of a dry run).
+
+    Fields
+    ------
+    total: int
+        Number of records read.
+    current: int
+        Records already at the target version.
+    migrated: int
+        Records upgraded (or, in a dry run, that would be upgraded).
+    changed: int
+        Migrated records whose content changed apart from the version stamp.
+    failed: int
+        Records whose transforms raised or whose result failed validation; they are left unchanged.
+    versions: Dict[str, int]
+        Number of records per source schema version.
+    failures: List[str]
+        Line numbers or paths of the first failed records.
+    dryRun: bool
+        Whether nothing was written.
+    """
+
+    total: int = 0
+    current: int = 0
+    migrated: int = 0
+    changed: int = 0
+    failed: int = 0
+    versions: Dict[str, int] = {}
+    failures: List[str] = []
+    dryRun: bool = False
+
+    def add(self, version: int, outcome: str, source: str, max_failures: int = 20):
+        self.total += 1
+        self.versions[str(version)] = self.versions.get(str(version), 0) + 1
+        if outcome == CURRENT:
+            self.current += 1
+        elif outcome == FAILED:
+            self.failed += 1
+            if len(self.failures) < max_failures:
+                self.failures.append(source)
+        else:
+            self.migrated += 1
+            self.changed += outcome == CHANGED
+
+
+def migrate_document(
+    document: bytes,
+    registry: MigrationRegistry,
+    target: Optional[int] = None,
+    model: Optional[Type[BaseModel]] = None,
+) -> Tuple[bytes, int, str]:
+    """Migrate one raw JSON record; returns (output document, source version, outcome).
+
+    A document that is not a JSON object, or whose transforms raise, or whose
+    result does not validate against ``model``, is returned unchanged as FAILED.
+    """
+    target = registry.latest if target is None else target
+    version = 0
+    try:
+        record = from_json(document)
+        version = record.get(VERSION_KEY, 0)
+        if version >= target:
+            return document, version, CURRENT
+        original = dict(record)
+        original.pop(VERSION_KEY, None)
+        before = to_json(original)
+        record, _ = registry.migrate(record, target)
+        if model is not None:
+            model.model_validate(record)
+    except Exception:
+        return document, version if isinstance(version, int) else 0, FAILED
+    stamp = record.pop(VERSION_KEY)
+    outcome = CHANGED if to_json(record) != before else MIGRATED
+    record[VERSION_KEY] = stamp
+    return to_json(record), version, outcome
+
+
+def _migrate_batch(batch, registry, target, model):
+    return [
+        (line_number, *migrate_document(line, registry, target, model))
+        for line_number, line in batch
+    ]
+
+
+def _checkpoint_path(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".checkpoint")
+
+
+def migrate_ndjson(
+    source: Union[str, os.PathLike],
+    destination: Optional[Union[str, os.PathLike]],
+    registry: MigrationRegistry,
+    target: Optional[int] = None,
+    model: Optional[Type[BaseModel]] = None,
+    dry_run: bool = False,
+    batch_size: int = 1000,
+    workers: int = 1,
+    resume: bool = True,
+) -> MigrationReport:
+    """Stream an NDJSON store (optionally gzip) through the registry into ``destination``.
+
+    Records are migrated in batches, in a process pool when ``workers`` > 1,
+    and written in their original order. Records that fail are written
+    unchanged and reported, as are lines that are not JSON objects. With
+    ``model``, every migrated record must validate against it. The destination
+    must be a different file from the source.
+
+    After each batch a checkpoint (``<destination>.checkpoint``) records how
+    far the migration got; when ``resume`` is true an interrupted migration
+    continues from there instead of starting over. The checkpoint is removed
+    when the migration completes. A dry run writes nothing and only reports
+    what would change.
+    """
+    report = MigrationReport(dryRun=dry_run)
+    out = None
+    checkpoint = None
+    done = 0
+    if not dry_run:
+        destination = Path(destination)
+        if destination.resolve() == Path(source).resolve():
+            raise ValueError("Cannot migrate an NDJSON store onto itself")
+        checkpoint = _checkpoint_path(destination)
+        if resume and checkpoint.exists() and destination.exists():
+            state = json.loads(checkpoint.read_text())
+            done = state["lines"]
+            report = MigrationReport(**state["report"])
+            out = open(destination, "r+b")
+            out.truncate(state["offset"])
+            out.seek(state["offset"])
+        else:
+            out = open(destination, "wb")
+
+    def batches():
+        for batch in iter_batches(source, batch_size):
+            batch = [(n, line) for n, line in batch if n > done]
+            if batch:
+                yield batch
+
+    def consume(results):
+        for line_number, document, version, outcome in results:
+            report.add(version, outcome, str(line_number))
+            if out is not None:
+                out.write(document)
+                out.write(b"\n")
+        if out is not None:
+            out.flush()
+            state = {
+                "lines": results[-1][0],
+                "offset": out.tell(),
+                "report": report.model_dump(),
+            }
+            checkpoint.write_text(json.dumps(state))
+
+    try:
+        if workers == 1:
+            for batch in batches():
+                consume(_migrate_batch(batch, registry, target, model))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for batch in batches():
+                    pending.append(
+                        pool.submit(_migrate_batch, batch, registry, target, model)
+                    )
+                    if len(pending) >= 2 * workers:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+    finally:
+        if out is not None:
+            out.close()
+    if checkpoint is not None and checkpoint.exists():
+        checkpoint.unlink()
+    return report
+
+
+def _migrate_files(paths, registry, target, model, dry_run):
+    results = []
+    for path in paths:
+        document = path.read_bytes()
+        output, version, outcome = migrate_document(document, registry, target, model)
+        if not dry_run and outcome in (MIGRATED, CHANGED):
+            temporary = path.with_name(path.name + ".migrating")
+            temporary.write_bytes(output)
+            os.replace(temporary, path)
+        results.append((str(path), version, outcome))
+    return results
+
+
+def migrate_directory(
+    root: Union[str, os.PathLike],
+    registry: MigrationRegistry,
+    target: Optional[int] = None,
+    model: Optional[Type[BaseModel]] = None,
+    dry_run: bool = False,
+    batch_size: int = 100,
+    workers: int = 1,
+) -> MigrationReport:
+    """Migrate a directory tree of JSON records (one record per file) in place.
+
+    Each file is replaced atomically. Files already stamped with the target
+    version are skipped, so an interrupted migration resumes by running it again.
+    """
+    report = MigrationReport(dryRun=dry_run)
+    paths = discover(root)
+    chunks = [paths[i : i + batch_size] for i in range(0, len(paths), batch_size)]
+    if workers == 1:
+        results = (
+            _migrate_files(chunk, registry, target, model, dry_run) for chunk in chunks
+        )
+        for chunk_results in results:
+            for source, version, outcome in chunk_results:
+                report.add(version, outcome, source)
+        return report
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_migrate_files, chunk, registry, target, model, dry_run)
+            for chunk in chunks
+        ]
+        for future in futures:
+            for source, version, outcome in future.result():
+                report.add(version, outcome, source)
+    return report
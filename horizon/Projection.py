@@ -0,0 +1,139 @@
+import copy
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr, create_model
+
+from .DataRelease import DataRelease
+from ._util import nested_model
+
+# The fields shown on listing and search result pages.
+LISTING_FIELDS = (
+    "title",
+    "identifier",
+    "usgsAssetType",
+    "accessRights",
+    "status",
+    "issued",
+)
+
+
+class Projection(BaseModel):
+    """Read-only view of a subset of a record's fields.
+
+    Projection classes are created by ``projection``; every other property of
+    the source document is skipped without being validated. A view created
+    with ``from_json`` keeps its source document and can be upgraded to the
+    full model with ``upgrade``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    source: ClassVar[Type[BaseModel]]
+    _document: Optional[Union[bytes, str]] = PrivateAttr(None)
+
+    @classmethod
+    def from_json(cls, document: Union[bytes, str]) -> "Projection":
+        view = cls.model_validate_json(document)
+        view._document = document
+        return view
+
+    def upgrade(self) -> BaseModel:
+        """Validate the source document into the full model."""
+        if self._document is None:
+            raise ValueError("Only projections created with from_json can be upgraded")
+        return self.source.model_validate_json(self._document)
+
+
+class _Frozen(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+
+def _field_tree(fields: Sequence[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def _substitute(annotation, old: Type[BaseModel], new: Type[BaseModel]):
+    if annotation is old:
+        return new
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    args = tuple(_substitute(arg, old, new) for arg in args)
+    origin = get_origin(annotation)
+    if origin is Union:
+        return Union[args]
+    if origin is list:
+        return List[args[0]]
+    return origin[args]
+
+
+def _project(
+    model: Type[BaseModel], tree: Dict[str, Any], base: Type[BaseModel], name: str
+) -> Type[BaseModel]:
+    definitions = {}
+    for field_name, subtree in tree.items():
+        field = model.model_fields.get(field_name)
+        if field is None:
+            raise ValueError(f"{model.__name__} has no field {field_name!r}")
+        annotation = field.annotation
+        if subtree:
+            nested = nested_model(annotation)
+            if nested is None:
+                raise ValueError(f"{model.__name__}.{field_name} has no nested fields")
+            projected = _project(
+                nested, subtree, _Frozen, f"{nested.__name__}Projection"
+            )
+            annotation = _substitute(annotation, nested, projected)
+        info = copy.copy(field)
+        info.annotation = annotation
+        definitions[field_name] = (annotation, info)
+    return create_model(name, __base__=base, **definitions)
+
+
+@lru_cache(maxsize=None)
+def _projection(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[Projection]:
+    view = _project(
+        model, _field_tree(fields), Projection, f"{model.__name__}Projection"
+    )
+    view.source = model
+    return view
+
+
+def projection(
+    fields: Sequence[str] = LISTING_FIELDS, model: Type[BaseModel] = DataRelease
+) -> Type[Projection]:
+    """Create (or reuse) a Projection class with only the given fields of ``model``.
+
+    Fields are property names or dotted paths into nested models, e.g.
+    ``creator.name`` keeps only the name of each creator. Required fields stay
+    required and keep their types, so a projection accepts everything the full
+    model accepts for those fields.
+    """
+    return _projection(model, tuple(sorted(set(fields))))
+
+
+def project(
+    document: Union[bytes, str],
+    fields: Sequence[str] = LISTING_FIELDS,
+    model: Type[BaseModel] = DataRelease,
+) -> Projection:
+    """Validate only ``fields`` of a raw JSON document."""
+    return projection(fields, model).from_json(document)
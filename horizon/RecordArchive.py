@@ -0,0 +1,455 @@
+import json
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+
+from .DataRelease import DataRelease
+from ._util import unwrap_optional
+
+MAGIC = b"HZNR"
+VERSION = 1
+
+# Field encodings, chosen from each field's annotation when the archive is written.
+ENUM, STR, DATETIME, BOOL, INT, FLOAT, JSON = (
+    "enum",
+    "str",
+    "datetime",
+    "bool",
+    "int",
+    "float",
+    "json",
+)
+
+_HEADER = struct.Struct("<4sHI")  # magic, version, schema length
+_TRAILER = struct.Struct("<Q4s")  # footer offset, magic
+_LENGTH = struct.Struct("<I")
+_DATETIME = struct.Struct(
+    "<qi"
+)  # microseconds since the epoch (UTC), utcoffset seconds
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+# Enum values are stored as one-byte codes.
+MAX_ENUM_MEMBERS = 256
+
+_NAIVE = -(1 << 31)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+def _field_kind(annotation) -> str:
+    annotation = unwrap_optional(annotation)
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return ENUM
+        for kind, base in (
+            (BOOL, bool),
+            (STR, str),
+            (DATETIME, datetime),
+            (INT, int),
+            (FLOAT, float),
+        ):
+            if issubclass(annotation, base):
+                return kind
+    return JSON
+
+
+def _encode_datetime(value: datetime) -> bytes:
+    if value.tzinfo is None:
+        delta, offset = value - _NAIVE_EPOCH, _NAIVE
+    else:
+        delta, offset = value - _EPOCH, int(value.utcoffset().total_seconds())
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return _DATETIME.pack(micros, offset)
+
+
+def _decode_datetime(data) -> datetime:
+    micros, offset = _DATETIME.unpack(data)
+    if offset == _NAIVE:
+        return _NAIVE_EPOCH + timedelta(microseconds=micros)
+    value = _EPOCH + timedelta(microseconds=micros)
+    return value.astimezone(timezone(timedelta(seconds=offset)))
+
+
+class _Schema:
+    """Per-field encoders and decoders for a model, shared by the writer and the reader."""
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        fields: List[List[str]],
+        enums: Dict[str, List[str]],
+    ):
+        self.model = model
+        self.names = [name for name, _ in fields]
+        self.kinds = [kind for _, kind in fields]
+        self.enums = enums
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        self.adapters = {
+            name: TypeAdapter(model.model_fields[name].annotation)
+            for name, kind in fields
+            if kind == JSON
+        }
+        self.enum_codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in enums.items()
+        }
+        self.enum_types = {
+            name: unwrap_optional(model.model_fields[name].annotation) for name in enums
+        }
+        self.null_bytes = (len(fields) + 7) // 8
+        self.offsets = struct.Struct(f"<{len(fields) + 1}I")
+
+    @classmethod
+    def from_model(cls, model: Type[BaseModel]) -> "_Schema":
+        fields, enums = [], {}
+        for name, field in model.model_fields.items():
+            kind = _field_kind(field.annotation)
+            fields.append([name, kind])
+            if kind == ENUM:
+                enum = unwrap_optional(field.annotation)
+                if len(enum) > MAX_ENUM_MEMBERS:
+                    raise ValueError(
+                        f"{model.__name__}.{name}: {enum.__name__} has {len(enum)} "
+                        f"members, more than the {MAX_ENUM_MEMBERS} one-byte codes"
+                    )
+                enums[name] = [member.value for member in enum]
+        return cls(model, fields, enums)
+
+    def to_json(self) -> bytes:
+        fields = [[name, kind] for name, kind in zip(self.names, self.kinds)]
+        schema = {"model": self.model.__name__, "fields": fields, "enums": self.enums}
+        return json.dumps(schema).encode()
+
+    def encode_value(self, name: str, kind: str, value) -> bytes:
+        if kind == ENUM:
+            return bytes(
+                [
+                    self.enum_codes[name][
+                        value.value if isinstance(value, Enum) else value
+                    ]
+                ]
+            )
+        if kind == STR:
+            return value.encode()
+        if kind == DATETIME:
+            return _encode_datetime(value)
+        if kind == BOOL:
+            return b"\x01" if value else b"\x00"
+        if kind == INT:
+            return _INT.pack(value)
+        if kind == FLOAT:
+            return _FLOAT.pack(value)
+        return self.adapters[name].dump_json(value)
+
+    def decode_value(self, name: str, kind: str, data) -> Any:
+        if kind == ENUM:
+            return self.enum_types[name](self.enums[name][data[0]])
+        if kind == STR:
+            return bytes(data).decode()
+        if kind == DATETIME:
+            return _decode_datetime(data)
+        if kind == BOOL:
+            return data[0] == 1
+        if kind == INT:
+            return _INT.unpack(data)[0]
+        if kind == FLOAT:
+            return _FLOAT.unpack(data)[0]
+        return self.adapters[name].validate_json(bytes(data))
+
+    def json_value(self, name: str, kind: str, data) -> bytes:
+        """The value of a field as a JSON fragment, for rebuilding a whole record."""
+        if kind == JSON:
+            return bytes(data)
+        value = self.decode_value(name, kind, data)
+        if kind == ENUM:
+            value = value.value
+        elif kind == DATETIME:
+            value = value.isoformat()
+        return json.dumps(value).encode()
+
+    def encode(self, record: BaseModel) -> bytes:
+        """Encode a record as: null bitmap, field offsets, field data."""
+        nulls = bytearray(self.null_bytes)
+        offsets = [0]
+        chunks = []
+        for i, (name, kind) in enumerate(zip(self.names, self.kinds)):
+            value = getattr(record, name)
+            if value is None:
+                nulls[i // 8] |= 1 << (i % 8)
+            else:
+                chunk = self.encode_value(name, kind, value)
+                chunks.append(chunk)
+                offsets.append(offsets[-1] + len(chunk))
+                continue
+            offsets.append(offsets[-1])
+        return bytes(nulls) + self.offsets.pack(*offsets) + b"".join(chunks)
+
+    def fields(self, payload: memoryview, names: Iterable[str]) -> Iterator:
+        """Yield (name, kind, data or None) for the requested fields of an encoded record."""
+        data_start = self.null_bytes + self.offsets.size
+        offsets = self.offsets.unpack_from(payload, self.null_bytes)
+        for name in names:
+            i = self.positions[name]
+            if payload[i // 8] & (1 << (i % 8)):
+                yield name, self.kinds[i], None
+            else:
+                start, end = data_start + offsets[i], data_start + offsets[i + 1]
+                yield name, self.kinds[i], payload[start:end]
+
+
+def _write_index(f, keys: Sequence[str], positions: Sequence[int]):
+    """Write a sorted key index: count, key offsets, record offsets, key bytes."""
+    order = sorted(range(len(keys)), key=lambda i: keys[i].encode())
+    encoded = [keys[i].encode() for i in order]
+    key_offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(k) for k in encoded], out=key_offsets[1:])
+    f.write(struct.pack("<Q", len(encoded)))
+    f.write(key_offsets.tobytes())
+    f.write(np.array([positions[i] for i in order], dtype="<u8").tobytes())
+    f.write(b"".join(encoded))
+
+
+class RecordArchiveWriter:
+    """Write Dataset or DataRelease records to a compact binary archive.
+
+    File layout::
+
+        header    magic, version, schema (JSON: field names, encodings, enum dictionaries)
+        records   u32 length + encoded record, repeated
+        footer    sorted index on usgsIdentifier, sorted index on identifier
+        trailer   u64 footer offset, magic
+
+    Each encoded record starts with a null bitmap and a table of field offsets,
+    so a reader can decode individual fields without touching the rest.
+    Enums (of at most 256 members) are stored as one-byte dictionary codes,
+    datetimes as int64 microseconds plus their UTC offset, and nested models
+    as compact JSON. The reader refuses an archive written for another model.
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike], model: Type[BaseModel] = DataRelease
+    ):
+        self._schema = _Schema.from_model(model)
+        self._f = open(path, "wb")
+        schema = self._schema.to_json()
+        self._f.write(_HEADER.pack(MAGIC, VERSION, len(schema)) + schema)
+        self._usgs_identifiers: List[str] = []
+        self._identifiers: List[str] = []
+        self._positions: List[int] = []
+        self._identifier_positions: List[int] = []
+
+    def write(self, record: BaseModel):
+        position = self._f.tell()
+        payload = self._schema.encode(record)
+        self._f.write(_LENGTH.pack(len(payload)) + payload)
+        self._usgs_identifiers.append(record.usgsIdentifier)
+        self._positions.append(position)
+        if record.identifier is not None:
+            self._identifiers.append(str(record.identifier))
+            self._identifier_positions.append(position)
+
+    def close(self):
+        if self._f.closed:
+            return
+        footer = self._f.tell()
+        _write_index(self._f, self._usgs_identifiers, self._positions)
+        _write_index(self._f, self._identifiers, self._identifier_positions)
+        self._f.write(_TRAILER.pack(footer, MAGIC))
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_archive(
+    path: Union[str, os.PathLike],
+    records: Iterable[BaseModel],
+    model: Type[BaseModel] = DataRelease,
+) -> int:
+    """Write ``records`` to an archive and return the number written."""
+    n = 0
+    with RecordArchiveWriter(path, model) as writer:
+        for record in records:
+            writer.write(record)
+            n += 1
+    return n
+
+
+class _Index:
+    """A sorted key index read in place from the memory-mapped footer."""
+
+    def __init__(self, buffer, offset: int):
+        (self.count,) = struct.unpack_from("<Q", buffer, offset)
+        offset += 8
+        self.key_offsets = np.frombuffer(buffer, "<u8", self.count + 1, offset)
+        offset += 8 * (self.count + 1)
+        self.positions = np.frombuffer(buffer, "<u8", self.count, offset)
+        offset += 8 * self.count
+        self.keys_start = offset
+        self.end = offset + int(self.key_offsets[-1])
+        self._buffer = buffer
+
+    def key(self, i: int) -> bytes:
+        start = self.keys_start + int(self.key_offsets[i])
+        return self._buffer[start : self.keys_start + int(self.key_offsets[i + 1])]
+
+    def find(self, key: str) -> Optional[int]:
+        target = key.encode()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self.key(lo) == target:
+            return int(self.positions[lo])
+        return None
+
+
+class RecordArchive:
+    """Random access reader for archives written by RecordArchiveWriter.
+
+    The file is memory-mapped. Lookups binary search the footer index in place,
+    and only the requested record (or only the requested fields of it) is
+    decoded.
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike], model: Type[BaseModel] = DataRelease
+    ):
+        self._file = open(path, "rb")
+        self._mmap = self._view = None
+        try:
+            self._open(path, model)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self, path, model: Type[BaseModel]):
+        if os.fstat(self._file.fileno()).st_size < _HEADER.size + _TRAILER.size:
+            raise ValueError(f"{path} is not a horizon record archive")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, schema_length = _HEADER.unpack_from(self._mmap, 0)
+        footer, trailer_magic = _TRAILER.unpack_from(
+            self._mmap, len(self._mmap) - _TRAILER.size
+        )
+        if magic != MAGIC or trailer_magic != MAGIC:
+            raise ValueError(f"{path} is not a horizon record archive")
+        if version != VERSION:
+            raise ValueError(f"Unsupported record archive version {version}")
+        if not _HEADER.size + schema_length <= footer <= len(self._mmap):
+            raise ValueError(f"{path} is truncated")
+        schema = json.loads(self._mmap[_HEADER.size : _HEADER.size + schema_length])
+        if schema["model"] != model.__name__:
+            raise ValueError(
+                f"{path} holds {schema['model']} records, not {model.__name__}"
+            )
+        self._schema = _Schema(model, schema["fields"], schema["enums"])
+        self._records_start = _HEADER.size + schema_length
+        self._records_end = footer
+        try:
+            self._by_usgs_identifier = _Index(self._mmap, footer)
+            self._by_identifier = _Index(self._mmap, self._by_usgs_identifier.end)
+        except (struct.error, ValueError):
+            raise ValueError(f"{path} is truncated") from None
+
+    def __len__(self) -> int:
+        return self._by_usgs_identifier.count
+
+    def __contains__(self, usgsIdentifier: str) -> bool:
+        return self._by_usgs_identifier.find(usgsIdentifier) is not None
+
+    def _payload(self, position: int) -> memoryview:
+        (length,) = _LENGTH.unpack_from(self._mmap, position)
+        start = position + _LENGTH.size
+        return self._view[start : start + length]
+
+    def _decode(self, payload: memoryview) -> BaseModel:
+        schema = self._schema
+        parts = [
+            json.dumps(name).encode()
+            + b":"
+            + (b"null" if data is None else schema.json_value(name, kind, data))
+            for name, kind, data in schema.fields(payload, schema.names)
+        ]
+        return schema.model.model_validate_json(b"{" + b",".join(parts) + b"}")
+
+    def _position(
+        self, usgsIdentifier: Optional[str], identifier: Optional[str]
+    ) -> int:
+        if usgsIdentifier is not None:
+            position = self._by_usgs_identifier.find(usgsIdentifier)
+        else:
+            position = self._by_identifier.find(str(identifier))
+        if position is None:
+            raise KeyError(usgsIdentifier if usgsIdentifier is not None else identifier)
+        return position
+
+    def get(self, usgsIdentifier: str) -> BaseModel:
+        """Decode and validate the record with this usgsIdentifier."""
+        return self._decode(self._payload(self._position(usgsIdentifier, None)))
+
+    def get_by_identifier(self, identifier) -> BaseModel:
+        """Decode and validate the record with this identifier (e.g. its DOI URL)."""
+        return self._decode(self._payload(self._position(None, identifier)))
+
+    def read_fields(
+        self,
+        fields: Sequence[str],
+        usgsIdentifier: Optional[str] = None,
+        identifier=None,
+    ) -> Dict[str, Any]:
+        """Decode only ``fields`` of one record, looked up by usgsIdentifier or identifier.
+
+        Values are validated against their field annotation, so nested fields
+        come back as models and enum fields as enum members.
+        """
+        payload = self._payload(self._position(usgsIdentifier, identifier))
+        return {
+            name: None if data is None else self._schema.decode_value(name, kind, data)
+            for name, kind, data in self._schema.fields(payload, fields)
+        }
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        """Decode every record in file order."""
+        position = self._records_start
+        while position < self._records_end:
+            payload = self._payload(position)
+            yield self._decode(payload)
+            position += _LENGTH.size + len(payload)
+
+    def close(self):
+        self._by_usgs_identifier = self._by_identifier = None
+        if self._view is not None:
+            self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,249 @@
+from collections.abc import Sequence
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from ._util import unwrap_optional
+
+
+class PatchOpEnum(str, Enum):
+    """A JSON Patch (RFC 6902) operation supported by apply_patch."""
+
+    add = "add"
+    remove = "remove"
+    replace = "replace"
+
+
+class PatchOperation(BaseModel):
+    """One operation of a record patch.
+
+    Fields
+    ------
+    op: PatchOpEnum
+        The operation.
+    path: str
+        JSON Pointer (RFC 6901) to the target location, e.g. ``/distribution/3/byteSize``.
+        ``-`` as the last list index appends to the list.
+    value: Any
+        The JSON value to add or replace with. Unused for remove.
+    """
+
+    op: PatchOpEnum
+    path: str
+    value: Any = None
+
+
+class ChangeSummary(BaseModel):
+    """Compact summary of the changes made by a patch.
+
+    Fields
+    ------
+    added: int
+        Number of add operations.
+    removed: int
+        Number of remove operations.
+    replaced: int
+        Number of replace operations.
+    fields: List[str]
+        The top-level properties that changed, sorted.
+    """
+
+    added: int = 0
+    removed: int = 0
+    replaced: int = 0
+    fields: List[str] = []
+
+    def notes(self) -> str:
+        """One-line description of the changes, e.g. for version notes."""
+        counts = [
+            f"{count} {name}"
+            for name, count in (
+                ("added", self.added),
+                ("removed", self.removed),
+                ("replaced", self.replaced),
+            )
+            if count
+        ]
+        if not counts:
+            return "No changes"
+        return f"{', '.join(counts)} in {', '.join(self.fields)}"
+
+
+Operation = Union[PatchOperation, Dict[str, Any]]
+
+
+def _escape(token) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _split(path: str) -> List[str]:
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer {path!r}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in path[1:].split("/")]
+
+
+def _diff(old, new, path: str, operations: List[PatchOperation]):
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            operations.append(
+                PatchOperation(op="remove", path=f"{path}/{_escape(key)}")
+            )
+        for key, value in new.items():
+            if key not in old:
+                operations.append(
+                    PatchOperation(op="add", path=f"{path}/{_escape(key)}", value=value)
+                )
+            else:
+                _diff(old[key], value, f"{path}/{_escape(key)}", operations)
+    elif isinstance(old, list) and isinstance(new, list):
+        # Trim the common prefix and suffix, then pair up what is left.
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end_old, end_new = len(old), len(new)
+        while (
+            end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]
+        ):
+            end_old -= 1
+            end_new -= 1
+        paired = min(end_old, end_new) - start
+        for i in range(start, start + paired):
+            _diff(old[i], new[i], f"{path}/{i}", operations)
+        for i in reversed(range(start + paired, end_old)):
+            operations.append(PatchOperation(op="remove", path=f"{path}/{i}"))
+        for i in range(start + paired, end_new):
+            operations.append(
+                PatchOperation(op="add", path=f"{path}/{i}", value=new[i])
+            )
+    else:
+        operations.append(PatchOperation(op="replace", path=path, value=new))
+
+
+def diff(
+    old: Union[BaseModel, Dict[str, Any]], new: Union[BaseModel, Dict[str, Any]]
+) -> List[PatchOperation]:
+    """Compute the operations that turn ``old`` into ``new``.
+
+    Records may be models or their JSON-mode dicts. Lists are compared after
+    trimming their common prefix and suffix, so a single inserted, removed or
+    edited list item produces a single operation.
+    """
+    if isinstance(old, BaseModel):
+        old = old.model_dump(mode="json")
+    if isinstance(new, BaseModel):
+        new = new.model_dump(mode="json")
+    operations: List[PatchOperation] = []
+    _diff(old, new, "", operations)
+    return operations
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _item_type(annotation):
+    annotation = unwrap_optional(annotation)
+    if get_origin(annotation) in (list, List):
+        return get_args(annotation)[0]
+    # A Sequence subclass such as LazyDistributionList(Sequence[Distribution]).
+    for base in getattr(annotation, "__orig_bases__", ()):
+        if get_origin(base) is Sequence:
+            return get_args(base)[0]
+    raise TypeError(f"{annotation} is not a list type")
+
+
+def _set_field(node: BaseModel, name: str, operation: PatchOperation) -> BaseModel:
+    model = type(node)
+    field = model.model_fields.get(name)
+    if field is None:
+        raise KeyError(f"{model.__name__} has no field {name!r}")
+    copy = node.model_copy()
+    if operation.op == PatchOpEnum.remove and not field.is_required():
+        # Restore the default without validating it, as the constructor does.
+        copy.__dict__[name] = field.get_default(call_default_factory=True)
+        copy.__pydantic_fields_set__.discard(name)
+    else:
+        value = None if operation.op == PatchOpEnum.remove else operation.value
+        model.__pydantic_validator__.validate_assignment(copy, name, value)
+    return copy
+
+
+def _apply(node, annotation, tokens: List[str], operation: PatchOperation):
+    token = tokens[0]
+    if isinstance(node, BaseModel):
+        if len(tokens) == 1:
+            return _set_field(node, token, operation)
+        field = type(node).model_fields[token]
+        child = _apply(getattr(node, token), field.annotation, tokens[1:], operation)
+        return node.model_copy(update={token: child})
+
+    if isinstance(node, Sequence) and not isinstance(node, (str, bytes)):
+        items = list(node)
+        index = len(items) if token == "-" else int(token)
+        item_type = _item_type(annotation)
+        if len(tokens) > 1:
+            items[index] = _apply(items[index], item_type, tokens[1:], operation)
+        elif operation.op == PatchOpEnum.remove:
+            del items[index]
+        else:
+            value = _adapter(item_type).validate_python(operation.value)
+            if operation.op == PatchOpEnum.add:
+                if index > len(items):
+                    raise IndexError(f"List index {index} out of range")
+                items.insert(index, value)
+            else:
+                items[index] = value
+        # Other sequence types (lazy lists) are rebuilt from the edited items.
+        return items if isinstance(node, list) else type(node)(items)
+
+    raise TypeError(
+        f"Cannot patch inside a {type(node).__name__} at {operation.path!r}"
+    )
+
+
+def apply_patch(
+    record: BaseModel, operations: Iterable[Operation]
+) -> Tuple[BaseModel, ChangeSummary]:
+    """Apply JSON Patch operations to a record, revalidating only what they touch.
+
+    Returns the patched record and a summary of the changes. The original
+    record is not modified: the new record shares every unchanged subtree with
+    it, and only the models along each operation's path are copied. Each
+    operation validates just its value: a replaced field through the owning
+    model's field validator, an added or replaced list item against the list's
+    item type. Removing a field resets it to its default, or to None if it
+    has no default (which must then validate).
+
+    Raises pydantic.ValidationError if a value is invalid; the original
+    record is unaffected.
+    """
+    summary = ChangeSummary()
+    fields = set()
+    for operation in operations:
+        if not isinstance(operation, PatchOperation):
+            operation = PatchOperation.model_validate(operation)
+        tokens = _split(operation.path)
+        if not tokens:
+            if operation.op != PatchOpEnum.replace:
+                raise ValueError("Only replace can target the whole record")
+            record = type(record).model_validate(operation.value)
+            fields.update(type(record).model_fields)
+        else:
+            record = _apply(record, type(record), tokens, operation)
+            fields.add(tokens[0])
+        if operation.op == PatchOpEnum.add:
+            summary.added += 1
+        elif operation.op == PatchOpEnum.remove:
+            summary.removed += 1
+        else:
+            summary.replaced += 1
+    summary.fields = sorted(fields)
+    return record, summary
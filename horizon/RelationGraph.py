@@ -0,0 +1,176 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .Dataset import DataciteRelationTypeEnum as Rel
+from ._util import DOI_PREFIXES
+
+_PAIRS = [
+    (Rel.IsCitedBy, Rel.Cites),
+    (Rel.IsSupplementTo, Rel.IsSupplementedBy),
+    (Rel.IsContinuedBy, Rel.Continues),
+    (Rel.IsNewVersionOf, Rel.IsPreviousVersionOf),
+    (Rel.IsPartOf, Rel.HasPart),
+    (Rel.IsReferencedBy, Rel.References),
+    (Rel.IsDocumentedBy, Rel.Documents),
+    (Rel.IsCompiledBy, Rel.Compiles),
+    (Rel.IsVariantFormOf, Rel.IsOriginalFormOf),
+    (Rel.IsIdenticalTo, Rel.IsIdenticalTo),
+    (Rel.HasMetadata, Rel.IsMetadataFor),
+    (Rel.Reviews, Rel.IsReviewedBy),
+    (Rel.IsDerivedFrom, Rel.IsSourceOf),
+    (Rel.Describes, Rel.IsDescribedBy),
+    (Rel.HasVersion, Rel.IsVersionOf),
+    (Rel.Requires, Rel.IsRequiredBy),
+    (Rel.Obsoletes, Rel.IsObsoletedBy),
+]
+
+# The relation seen from the other end of an edge. IsPublishedIn has no
+# DataCite inverse and is only stored in the direction it was asserted.
+INVERSE_RELATIONS: Dict[Rel, Rel] = {}
+for _a, _b in _PAIRS:
+    INVERSE_RELATIONS[_a] = _b
+    INVERSE_RELATIONS[_b] = _a
+
+Edge = Tuple[str, Rel, str]
+
+
+def normalize_identifier(identifier) -> str:
+    """Normalize an identifier so that a DOI and its resolver URL name the same node."""
+    identifier = str(identifier).strip()
+    lowered = identifier.lower()
+    for prefix in DOI_PREFIXES:
+        if lowered.startswith(prefix):
+            return lowered[len(prefix) :]
+    if lowered.startswith("10."):
+        return lowered
+    return identifier
+
+
+class RelationGraph:
+    """In-memory graph of RelatedIdentifier relations between catalog records.
+
+    Nodes are normalized identifiers: a record's own ``identifier`` (or its
+    usgsIdentifier when it has none) and every relatedIdentifier it refers to.
+    Each asserted relation also adds the inverse edge (IsPartOf and HasPart,
+    IsNewVersionOf and IsPreviousVersionOf, ...), so relations can be followed
+    from either end. Edges are reference counted, which lets two records assert
+    the same relation from both sides and still be updated or removed
+    independently.
+    """
+
+    def __init__(self, datasets: Iterable = ()):
+        self._edges: Dict[str, Dict[Rel, Dict[str, int]]] = {}
+        self._record_edges: Dict[str, Tuple[str, List[Edge]]] = {}
+        self._nodes: Dict[str, str] = {}
+        for dataset in datasets:
+            self.update(dataset)
+
+    def __len__(self) -> int:
+        return len(self._record_edges)
+
+    @staticmethod
+    def node_for(dataset) -> str:
+        """The node that represents a Dataset in the graph."""
+        if dataset.identifier is not None:
+            return normalize_identifier(dataset.identifier)
+        return dataset.usgsIdentifier
+
+    def _link(self, source: str, relation: Rel, target: str, delta: int):
+        targets = self._edges.setdefault(source, {}).setdefault(relation, {})
+        count = targets.get(target, 0) + delta
+        if count > 0:
+            targets[target] = count
+            return
+        targets.pop(target, None)
+        if not targets:
+            del self._edges[source][relation]
+            if not self._edges[source]:
+                del self._edges[source]
+
+    def _apply(self, edges: List[Edge], delta: int):
+        for source, relation, target in edges:
+            self._link(source, relation, target, delta)
+            inverse = INVERSE_RELATIONS.get(relation)
+            if inverse is not None:
+                self._link(target, inverse, source, delta)
+
+    def update(self, dataset):
+        """Add a dataset's relations, replacing any previously indexed for the same usgsIdentifier."""
+        self.remove(dataset.usgsIdentifier)
+        node = self.node_for(dataset)
+        edges = [
+            (
+                node,
+                Rel(related.dataciteRelationType),
+                normalize_identifier(related.relatedIdentifier),
+            )
+            for related in dataset.relation or ()
+        ]
+        self._apply(edges, 1)
+        self._record_edges[dataset.usgsIdentifier] = (node, edges)
+        self._nodes[node] = dataset.usgsIdentifier
+
+    add = update
+
+    def remove(self, usgsIdentifier: str):
+        """Remove the relations asserted by a record. Unknown identifiers are ignored."""
+        indexed = self._record_edges.pop(usgsIdentifier, None)
+        if indexed is None:
+            return
+        node, edges = indexed
+        self._apply(edges, -1)
+        if self._nodes.get(node) == usgsIdentifier:
+            del self._nodes[node]
+
+    def record(self, node: str) -> Optional[str]:
+        """The usgsIdentifier of the catalog record for a node, if it is in the catalog."""
+        return self._nodes.get(normalize_identifier(node))
+
+    def neighbors(self, node: str, relation: Optional[Rel] = None) -> Set[str]:
+        """Nodes directly related to ``node``, optionally only through ``relation``."""
+        relations = self._edges.get(normalize_identifier(node), {})
+        if relation is not None:
+            return set(relations.get(Rel(relation), ()))
+        return {target for targets in relations.values() for target in targets}
+
+    def relations(self, node: str) -> Dict[Rel, Set[str]]:
+        """Every outgoing relation of ``node``, including derived inverse edges."""
+        relations = self._edges.get(normalize_identifier(node), {})
+        return {relation: set(targets) for relation, targets in relations.items()}
+
+    def closure(self, node: str, *relations: Rel) -> List[str]:
+        """Nodes reachable from ``node`` by repeatedly following ``relations``, in breadth-first order."""
+        start = normalize_identifier(node)
+        relations = [Rel(relation) for relation in relations]
+        seen = {start}
+        order = []
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            edges = self._edges.get(current, {})
+            for relation in relations:
+                for target in edges.get(relation, ()):
+                    if target not in seen:
+                        seen.add(target)
+                        order.append(target)
+                        queue.append(target)
+        return order
+
+    def parts(self, node: str) -> List[str]:
+        """Every direct and nested part of a collection."""
+        return self.closure(node, Rel.HasPart)
+
+    def collections(self, node: str) -> List[str]:
+        """Every collection that ``node`` is directly or indirectly part of."""
+        return self.closure(node, Rel.IsPartOf)
+
+    def version_chain(self, node: str) -> List[str]:
+        """The full version lineage of ``node``, from the oldest version to the newest.
+
+        Follows IsNewVersionOf back to the earliest version, then walks
+        IsPreviousVersionOf forward. Branches are listed breadth first.
+        """
+        start = normalize_identifier(node)
+        older = self.closure(start, Rel.IsNewVersionOf)
+        oldest = older[-1] if older else start
+        return [oldest] + self.closure(oldest, Rel.IsPreviousVersionOf)
@@ -0,0 +1,292 @@
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from .Location import BoundingBox, Location
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Columns of SpatialIndex._boxes. A box that crosses the antimeridian
+# (westBoundLongitude > eastBoundLongitude) is stored as two longitude
+# intervals; every other box leaves the second interval as NaN, which
+# compares False in every query.
+_WEST, _EAST, _WEST2, _EAST2, _SOUTH, _NORTH = range(6)
+
+Box = Union[BoundingBox, Sequence[float]]
+
+
+def _lon_intervals(west: float, east: float) -> List[Tuple[float, float]]:
+    if west <= east:
+        return [(west, east)]
+    return [(west, 180.0), (-180.0, east)]
+
+
+def _as_bounds(box: Box) -> Tuple[float, float, float, float]:
+    """Return (west, east, south, north) for a BoundingBox or a sequence in that order."""
+    if isinstance(box, BoundingBox):
+        return (
+            box.westBoundLongitude,
+            box.eastBoundLongitude,
+            box.southBoundLatitude,
+            box.northBoundLatitude,
+        )
+    west, east, south, north = box
+    return west, east, south, north
+
+
+def _location_bounds(location: Optional[Location]):
+    """Return the bounds and centroid indexed for a Location, or None if it has neither."""
+    if location is None or (location.bbox is None and location.centroid is None):
+        return None
+    if location.bbox is not None:
+        west, east, south, north = _as_bounds(location.bbox)
+    else:
+        west = east = location.centroid.pointLongitude
+        south = north = location.centroid.pointLatitude
+    if location.centroid is not None:
+        centroid = (location.centroid.pointLongitude, location.centroid.pointLatitude)
+    else:
+        center = west + ((east - west) % 360.0) / 2.0
+        centroid = ((center + 180.0) % 360.0 - 180.0, (south + north) / 2.0)
+    return (west, east, south, north), centroid
+
+
+class SpatialIndex:
+    """Index of Dataset.spatial extents for bounding-box and nearest-centroid queries.
+
+    Extents are bucketed into a grid of ``cell_degrees`` square cells, and
+    centroids into the grid's latitude bands. A box query only tests the
+    extents registered in the cells it overlaps, and a nearest query widens
+    its search over the latitude bands until no unsearched band can hold a
+    closer centroid. The candidates are then tested in one vectorized pass over NumPy
+    arrays of bounds and centroids rather than a Python loop over models.
+    Datasets are keyed on usgsIdentifier and can be added, updated or removed
+    incrementally; removed slots are reused by later additions. Datasets
+    without a spatial extent are not indexed.
+    """
+
+    def __init__(
+        self, datasets: Iterable = (), capacity: int = 1024, cell_degrees: float = 10.0
+    ):
+        self._boxes = np.full((capacity, 6), np.nan)
+        self._centroids = np.full((capacity, 2), np.nan)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._keys: List[Optional[str]] = [None] * capacity
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._cell_degrees = cell_degrees
+        self._rows = math.ceil(180.0 / cell_degrees)
+        self._columns = math.ceil(360.0 / cell_degrees)
+        self._cells: List[Set[int]] = [set() for _ in range(self._rows * self._columns)]
+        self._bands: List[Set[int]] = [set() for _ in range(self._rows)]
+        self._cell_arrays: Dict[int, np.ndarray] = {}
+        self._band_arrays: Dict[int, np.ndarray] = {}
+        # slot -> (grid cells of its extent, latitude band of its centroid)
+        self._placement: Dict[int, Tuple[List[int], int]] = {}
+        for dataset in datasets:
+            self.update(dataset)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, usgsIdentifier: str) -> bool:
+        return usgsIdentifier in self._slots
+
+    def _grow(self):
+        capacity = len(self._active)
+        self._boxes = np.concatenate([self._boxes, np.full((capacity, 6), np.nan)])
+        self._centroids = np.concatenate(
+            [self._centroids, np.full((capacity, 2), np.nan)]
+        )
+        self._active = np.concatenate([self._active, np.zeros(capacity, dtype=bool)])
+        self._keys.extend([None] * capacity)
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def _row(self, latitude: float) -> int:
+        return min(max(int((latitude + 90.0) // self._cell_degrees), 0), self._rows - 1)
+
+    def _column(self, longitude: float) -> int:
+        column = int((longitude + 180.0) // self._cell_degrees)
+        return min(max(column, 0), self._columns - 1)
+
+    def _grid_cells(
+        self, west: float, east: float, south: float, north: float
+    ) -> List[int]:
+        columns = set()
+        for lo, hi in _lon_intervals(west, east):
+            columns.update(range(self._column(lo), self._column(hi) + 1))
+        return [
+            row * self._columns + column
+            for row in range(self._row(south), self._row(north) + 1)
+            for column in sorted(columns)
+        ]
+
+    def _candidates(self, box: Box) -> np.ndarray:
+        """Slots, in order, of the extents registered in the cells ``box`` overlaps."""
+        cells = self._grid_cells(*_as_bounds(box))
+        # Extents in several cells are counted once per cell, so when the cells
+        # hold more entries than the index has extents a full scan is cheaper.
+        if sum(len(self._cells[cell]) for cell in cells) > len(self._slots):
+            return np.flatnonzero(self._active)
+        if len(cells) == 1:
+            return np.sort(self._cached(self._cells, self._cell_arrays, cells[0]))
+        found = np.zeros(len(self._active), dtype=bool)
+        for cell in cells:
+            found[self._cached(self._cells, self._cell_arrays, cell)] = True
+        return np.flatnonzero(found)
+
+    @staticmethod
+    def _cached(sets: List[Set[int]], arrays: Dict[int, np.ndarray], i: int):
+        """The slots in ``sets[i]`` as an array, cached until the set changes."""
+        slots = arrays.get(i)
+        if slots is None:
+            slots = arrays[i] = np.fromiter(sets[i], dtype=np.int64, count=len(sets[i]))
+        return slots
+
+    def update(self, dataset):
+        """Add a dataset to the index, or refresh it if it is already indexed."""
+        indexed = _location_bounds(dataset.spatial)
+        if indexed is None:
+            self.remove(dataset.usgsIdentifier)
+            return
+        (west, east, south, north), centroid = indexed
+
+        slot = self._slots.get(dataset.usgsIdentifier)
+        if slot is None:
+            if not self._free:
+                self._grow()
+            slot = self._free.pop()
+            self._slots[dataset.usgsIdentifier] = slot
+            self._keys[slot] = dataset.usgsIdentifier
+            self._active[slot] = True
+
+        row = self._boxes[slot]
+        row[:] = np.nan
+        for column, (lo, hi) in zip((_WEST, _WEST2), _lon_intervals(west, east)):
+            row[column], row[column + 1] = lo, hi
+        row[_SOUTH], row[_NORTH] = south, north
+        self._centroids[slot] = centroid
+
+        self._unplace(slot)
+        cells = self._grid_cells(west, east, south, north)
+        band = self._row(centroid[1])
+        for cell in cells:
+            self._cells[cell].add(slot)
+            self._cell_arrays.pop(cell, None)
+        self._bands[band].add(slot)
+        self._band_arrays.pop(band, None)
+        self._placement[slot] = (cells, band)
+
+    def _unplace(self, slot: int):
+        placement = self._placement.pop(slot, None)
+        if placement is not None:
+            cells, band = placement
+            for cell in cells:
+                self._cells[cell].discard(slot)
+                self._cell_arrays.pop(cell, None)
+            self._bands[band].discard(slot)
+            self._band_arrays.pop(band, None)
+
+    add = update
+
+    def remove(self, usgsIdentifier: str):
+        """Remove a dataset from the index. Unknown identifiers are ignored."""
+        slot = self._slots.pop(usgsIdentifier, None)
+        if slot is None:
+            return
+        self._unplace(slot)
+        self._active[slot] = False
+        self._boxes[slot] = np.nan
+        self._centroids[slot] = np.nan
+        self._keys[slot] = None
+        self._free.append(slot)
+
+    def _result(self, slots: np.ndarray, mask: np.ndarray) -> List[str]:
+        return [self._keys[slot] for slot in slots[mask]]
+
+    def intersects(self, box: Box) -> List[str]:
+        """Return the identifiers of datasets whose extent intersects ``box``."""
+        west, east, south, north = _as_bounds(box)
+        slots = self._candidates(box)
+        b = self._boxes[slots]
+        lon = np.zeros(len(b), dtype=bool)
+        for qwest, qeast in _lon_intervals(west, east):
+            lon |= (b[:, _WEST] <= qeast) & (b[:, _EAST] >= qwest)
+            lon |= (b[:, _WEST2] <= qeast) & (b[:, _EAST2] >= qwest)
+        lat = (b[:, _SOUTH] <= north) & (b[:, _NORTH] >= south)
+        return self._result(slots, lon & lat)
+
+    def within(self, box: Box) -> List[str]:
+        """Return the identifiers of datasets whose extent lies entirely inside ``box``."""
+        west, east, south, north = _as_bounds(box)
+        slots = self._candidates(box)
+        b = self._boxes[slots]
+        inside = np.zeros(len(b), dtype=bool)
+        inside2 = np.isnan(b[:, _WEST2])
+        for qwest, qeast in _lon_intervals(west, east):
+            inside |= (b[:, _WEST] >= qwest) & (b[:, _EAST] <= qeast)
+            inside2 |= (b[:, _WEST2] >= qwest) & (b[:, _EAST2] <= qeast)
+        lat = (b[:, _SOUTH] >= south) & (b[:, _NORTH] <= north)
+        return self._result(slots, inside & inside2 & lat)
+
+    def contains_point(self, longitude: float, latitude: float) -> List[str]:
+        """Return the identifiers of datasets whose extent contains the point."""
+        slots = self._candidates((longitude, longitude, latitude, latitude))
+        b = self._boxes[slots]
+        lon = (b[:, _WEST] <= longitude) & (b[:, _EAST] >= longitude)
+        lon |= (b[:, _WEST2] <= longitude) & (b[:, _EAST2] >= longitude)
+        lat = (b[:, _SOUTH] <= latitude) & (b[:, _NORTH] >= latitude)
+        return self._result(slots, lon & lat)
+
+    def _distances(
+        self, slots: np.ndarray, longitude: float, latitude: float
+    ) -> np.ndarray:
+        lon = np.radians(self._centroids[slots, 0])
+        lat = np.radians(self._centroids[slots, 1])
+        qlon, qlat = np.radians(longitude), np.radians(latitude)
+        a = (
+            np.sin((lat - qlat) / 2) ** 2
+            + np.cos(lat) * np.cos(qlat) * np.sin((lon - qlon) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    def _band_gap(self, latitude: float, lo: int, hi: int) -> float:
+        """Lower bound in km on the distance to any centroid outside bands lo..hi."""
+        gap = math.inf
+        if lo > 0:
+            gap = latitude - (lo * self._cell_degrees - 90.0)
+        if hi < self._rows - 1:
+            gap = min(gap, (hi + 1) * self._cell_degrees - 90.0 - latitude)
+        return math.radians(gap) * EARTH_RADIUS_KM
+
+    def nearest(
+        self, longitude: float, latitude: float, k: int = 1
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``k`` (usgsIdentifier, distance in km) pairs ordered by centroid distance."""
+        if not self._slots:
+            return []
+        k = min(k, len(self._slots))
+        # Two centroids are at least as far apart as their latitudes, so once
+        # k candidates are closer than every unsearched band the search stops.
+        lo = hi = self._row(latitude)
+        step = 1
+        slots = self._cached(self._bands, self._band_arrays, lo)
+        distance = self._distances(slots, longitude, latitude)
+        while True:
+            if len(slots) >= k:
+                best = np.argpartition(distance, k - 1)[:k]
+                if distance[best].max() <= self._band_gap(latitude, lo, hi):
+                    break
+            # Widen by a doubling number of bands to bound the iterations.
+            widened = max(lo - step, 0), min(hi + step, self._rows - 1)
+            bands = [*range(widened[0], lo), *range(hi + 1, widened[1] + 1)]
+            (lo, hi), step = widened, 2 * step
+            for band in bands:
+                added = self._cached(self._bands, self._band_arrays, band)
+                slots = np.concatenate([slots, added])
+                distance = np.concatenate(
+                    [distance, self._distances(added, longitude, latitude)]
+                )
+        best = best[np.lexsort((slots[best], distance[best]))]
+        return [(self._keys[slots[i]], float(distance[i])) for i in best]
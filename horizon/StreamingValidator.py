@@ -0,0 +1,157 @@
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .DataRelease import DataRelease
+from .EntityPool import EntityPool
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_adapters: Dict[Type[BaseModel], Tuple[TypeAdapter, TypeAdapter]] = {}
+
+
+class LineError(BaseModel):
+    """A record of an NDJSON file that failed validation.
+
+    Fields
+    ------
+    lineNumber: int
+        The 1-based line number of the record within the file.
+    errors: List[Dict[str, Any]]
+        The pydantic error details (type, loc, msg) for the record.
+    """
+
+    lineNumber: int
+    errors: List[Dict[str, Any]]
+
+
+def _get_adapters(model: Type[BaseModel]) -> Tuple[TypeAdapter, TypeAdapter]:
+    """Return the (single record, batch) adapters for a model, building them once per process."""
+    adapters = _adapters.get(model)
+    if adapters is None:
+        adapters = (TypeAdapter(model), TypeAdapter(List[model]))
+        _adapters[model] = adapters
+    return adapters
+
+
+def _error_details(exc: ValidationError) -> List[Dict[str, Any]]:
+    return exc.errors(include_url=False, include_context=False, include_input=False)
+
+
+def open_ndjson(path: Union[str, os.PathLike]):
+    """Open an NDJSON file for binary reading, transparently decompressing gzip input."""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_batches(
+    path: Union[str, os.PathLike], batch_size: int = 1000
+) -> Iterator[List[Tuple[int, bytes]]]:
+    """Read an NDJSON file incrementally as batches of (line number, raw line) pairs.
+
+    Blank lines are skipped but still counted so that line numbers match the file.
+    """
+    batch = []
+    with open_ndjson(path) as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            batch.append((line_number, line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def validate_batch(
+    batch: List[Tuple[int, bytes]], model: Type[BaseModel] = DataRelease
+) -> List[Union[BaseModel, LineError]]:
+    """Validate a batch of raw NDJSON lines against a model.
+
+    The whole batch is validated as a single JSON array first. Only when that fails
+    are the lines revalidated one at a time to find which records are bad. That
+    also happens when the array has more items than the batch has lines, since
+    a line such as ``{...}, {...}`` is not a valid NDJSON record even though it
+    joins into a valid array.
+    """
+    single, many = _get_adapters(model)
+    try:
+        results = many.validate_json(b"[" + b",".join(line for _, line in batch) + b"]")
+        if len(results) == len(batch):
+            return results
+    except ValidationError:
+        pass
+
+    results = []
+    for line_number, line in batch:
+        try:
+            results.append(single.validate_json(line))
+        except ValidationError as exc:
+            results.append(
+                LineError(lineNumber=line_number, errors=_error_details(exc))
+            )
+    return results
+
+
+def validate_ndjson(
+    path: Union[str, os.PathLike],
+    model: Type[BaseModel] = DataRelease,
+    batch_size: int = 1000,
+    workers: Optional[int] = 1,
+    pool: Optional[EntityPool] = None,
+) -> Iterator[Union[BaseModel, LineError]]:
+    """Stream validated records from an NDJSON (optionally gzip) catalog dump.
+
+    Records are yielded in file order as either instances of ``model`` or
+    ``LineError`` entries for lines that failed validation. Only a bounded number
+    of batches is held in memory at any time.
+
+    Parameters
+    ----------
+    path: str or PathLike
+        The NDJSON file to read. Gzip compression is detected automatically.
+    model: Type[BaseModel]
+        The model to validate each record against, e.g. Dataset or DataRelease.
+    batch_size: int
+        Number of lines validated together in a single call.
+    workers: Optional[int]
+        Number of worker processes. ``1`` validates in the calling process and
+        ``None`` uses every available core.
+    pool: Optional[EntityPool]
+        When given, entities of every validated record are interned in the pool
+        so records share Entity instances. ``model`` must be a Dataset model.
+    """
+    results = _validate_ndjson(path, model, batch_size, workers)
+    if pool is None:
+        yield from results
+        return
+    for result in results:
+        if not isinstance(result, LineError):
+            pool.intern_dataset(result)
+        yield result
+
+
+def _validate_ndjson(path, model, batch_size, workers):
+    if workers == 1:
+        for batch in iter_batches(path, batch_size):
+            yield from validate_batch(batch, model)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in iter_batches(path, batch_size):
+            pending.append(pool.submit(validate_batch, batch, model))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
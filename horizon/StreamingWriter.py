@@ -0,0 +1,194 @@
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+Record = Union[BaseModel, Dict[str, Any]]
+
+FORMATS = ("ndjson", "json")
+COMPRESSIONS = (None, "gzip", "zstd")
+
+
+def serialize_batch(records: List[Record]) -> List[bytes]:
+    """Serialize records to compact JSON. Runs in worker processes when enabled."""
+    return [
+        (
+            record.__pydantic_serializer__.to_json(record)
+            if isinstance(record, BaseModel)
+            else to_json(record)
+        )
+        for record in records
+    ]
+
+
+def _open_compressed(path: Path, compression: Optional[str], level: Optional[int]):
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6 if level is None else level)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                "zstd compression requires the zstandard package"
+            ) from exc
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(open(path, "wb"), closefd=True)
+    raise ValueError(f"Unknown compression {compression!r}")
+
+
+class StreamingWriter:
+    """Write records to NDJSON or JSON-array files, compressing and rotating as it goes.
+
+    Records (models or plain dicts) are buffered in batches of ``batch_size``,
+    serialized straight to bytes and written to the current file, so memory use
+    is bounded by the batches in flight rather than by the catalog size.
+
+    With ``max_bytes``, a new file is started whenever the next record would
+    take the current one past ``max_bytes`` of uncompressed output. Files are
+    then numbered: ``catalog.ndjson.gz`` becomes ``catalog-00000.ndjson.gz``,
+    ``catalog-00001.ndjson.gz``, ... In JSON format every file is a complete
+    JSON array.
+
+    With ``workers`` > 1, batches are serialized in a process pool with at most
+    ``2 * workers`` batches in flight, and written in order.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        format: str = "ndjson",
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        batch_size: int = 1000,
+        workers: int = 1,
+    ):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression!r}")
+        self.path = Path(path)
+        self.format = format
+        self.compression = compression
+        self.level = level
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.workers = workers
+        self.files: List[Path] = []
+        self.records = 0
+        self._file = None
+        self._file_bytes = 0
+        self._file_records = 0
+        self._batch: List[Record] = []
+        self._pending = deque()
+        self._executor = ProcessPoolExecutor(workers) if workers > 1 else None
+
+    def _chunk_path(self, index: int) -> Path:
+        if self.max_bytes is None:
+            return self.path
+        name = self.path.name
+        stem, dot, suffixes = name.partition(".")
+        return self.path.with_name(f"{stem}-{index:05d}{dot}{suffixes}")
+
+    def _open(self):
+        path = self._chunk_path(len(self.files))
+        self._file = _open_compressed(path, self.compression, self.level)
+        self.files.append(path)
+        self._file_bytes = self._file_records = 0
+        if self.format == "json":
+            self._file.write(b"[")
+            self._file_bytes = 1
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        if self.format == "json":
+            self._file.write(b"]\n")
+        self._file.close()
+        self._file = None
+
+    def _write_lines(self, lines: List[bytes]):
+        separator = b"\n" if self.format == "ndjson" else b",\n"
+        for line in lines:
+            size = len(line) + len(separator)
+            if (
+                self._file is not None
+                and self.max_bytes is not None
+                and self._file_records
+                and self._file_bytes + size > self.max_bytes
+            ):
+                self._close_file()
+            if self._file is None:
+                self._open()
+            if self.format == "ndjson":
+                self._file.write(line)
+                self._file.write(separator)
+            else:
+                if self._file_records:
+                    self._file.write(separator)
+                self._file.write(line)
+            self._file_bytes += size
+            self._file_records += 1
+            self.records += 1
+
+    def _submit(self, batch: List[Record]):
+        if self._executor is None:
+            self._write_lines(serialize_batch(batch))
+            return
+        self._pending.append(self._executor.submit(serialize_batch, batch))
+        while len(self._pending) >= 2 * self.workers:
+            self._write_lines(self._pending.popleft().result())
+
+    def write(self, record: Record):
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            batch, self._batch = self._batch, []
+            self._submit(batch)
+
+    def write_all(self, records: Iterable[Record]) -> int:
+        """Write every record; returns the number of records written so far."""
+        for record in records:
+            self.write(record)
+        return self.records
+
+    def flush(self):
+        """Serialize and write every buffered record."""
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._submit(batch)
+        while self._pending:
+            self._write_lines(self._pending.popleft().result())
+
+    def close(self):
+        try:
+            self.flush()
+            if self._file is None and not self.files:
+                # Always produce a file, even for an empty catalog.
+                self._open()
+            self._close_file()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_records(
+    records: Iterable[Record], path: Union[str, os.PathLike], **options
+) -> List[Path]:
+    """Write records with a StreamingWriter and return the files written."""
+    with StreamingWriter(path, **options) as writer:
+        writer.write_all(records)
+    return writer.files
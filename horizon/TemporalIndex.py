@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Open-ended periods are stored with these sentinels so that a missing
+# startDate sorts before, and a missing endDate after, every real date.
+UNBOUNDED_START = np.iinfo(np.int64).min
+UNBOUNDED_END = np.iinfo(np.int64).max
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_microseconds(value: Optional[datetime], default: int) -> int:
+    """Convert a datetime to int64 microseconds since the epoch. Naive datetimes are taken as UTC."""
+    if value is None:
+        return default
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _as_array(values: Sequence[Optional[datetime]], default: int) -> np.ndarray:
+    return np.array(
+        [to_microseconds(value, default) for value in values], dtype=np.int64
+    )
+
+
+class TemporalIndex:
+    """Index of Dataset.temporal periods for overlap, containment and point-in-time queries.
+
+    Every PeriodOfTime of every dataset becomes one row. Rows are held in two
+    orders, by startDate and by endDate, each with running maximum and minimum
+    arrays of the other date. A query binary searches the dates and the running
+    arrays to trim each order's range to the rows that can match on both
+    dates, then filters only the smaller of the two ranges. A missing startDate or
+    endDate is treated as unbounded. Results are usgsIdentifiers in index order,
+    with each dataset reported once.
+
+    The index is built once from a loaded catalog; rebuild it after changes.
+    """
+
+    def __init__(self, datasets: Iterable):
+        self._keys: List[str] = []
+        starts, ends, owners = [], [], []
+        for dataset in datasets:
+            if not dataset.temporal:
+                continue
+            owner = len(self._keys)
+            self._keys.append(dataset.usgsIdentifier)
+            for period in dataset.temporal:
+                starts.append(to_microseconds(period.startDate, UNBOUNDED_START))
+                ends.append(to_microseconds(period.endDate, UNBOUNDED_END))
+                owners.append(owner)
+
+        starts = np.array(starts, dtype=np.int64)
+        ends = np.array(ends, dtype=np.int64)
+        owners = np.array(owners, dtype=np.int64)
+
+        by_start = np.argsort(starts, kind="stable")
+        self._starts = starts[by_start]
+        self._start_ends = ends[by_start]
+        self._start_owners = owners[by_start]
+
+        by_end = np.argsort(ends, kind="stable")
+        self._ends = ends[by_end]
+        self._end_starts = starts[by_end]
+        self._end_owners = owners[by_end]
+
+        # Running bounds over each order. A row in start order can only end
+        # after end_min once the running maximum of ends reaches end_min, and
+        # can only end before end_max while the minimum of the remaining ends
+        # is at most end_max; likewise for starts in end order.
+        self._max_start_ends = np.maximum.accumulate(self._start_ends)
+        self._min_start_ends = np.minimum.accumulate(self._start_ends[::-1])[::-1]
+        self._max_end_starts = np.maximum.accumulate(self._end_starts)
+        self._min_end_starts = np.minimum.accumulate(self._end_starts[::-1])[::-1]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _query(
+        self, start_min: int, start_max: int, end_min: int, end_max: int
+    ) -> List[str]:
+        """Return datasets with a period where start_min <= start <= start_max and end_min <= end <= end_max."""
+        lo = max(
+            np.searchsorted(self._starts, start_min, "left"),
+            np.searchsorted(self._max_start_ends, end_min, "left"),
+        )
+        hi = min(
+            np.searchsorted(self._starts, start_max, "right"),
+            np.searchsorted(self._min_start_ends, end_max, "right"),
+        )
+        elo = max(
+            np.searchsorted(self._ends, end_min, "left"),
+            np.searchsorted(self._max_end_starts, start_min, "left"),
+        )
+        ehi = min(
+            np.searchsorted(self._ends, end_max, "right"),
+            np.searchsorted(self._min_end_starts, start_max, "right"),
+        )
+        if hi <= lo or ehi <= elo:
+            return []
+        if hi - lo <= ehi - elo:
+            ends = self._start_ends[lo:hi]
+            owners = self._start_owners[lo:hi][(ends >= end_min) & (ends <= end_max)]
+        else:
+            starts = self._end_starts[elo:ehi]
+            owners = self._end_owners[elo:ehi][
+                (starts >= start_min) & (starts <= start_max)
+            ]
+        return [self._keys[owner] for owner in np.unique(owners)]
+
+    def overlapping(
+        self, startDate: Optional[datetime], endDate: Optional[datetime]
+    ) -> List[str]:
+        """Datasets with a period that shares at least one instant with [startDate, endDate]."""
+        start = to_microseconds(startDate, UNBOUNDED_START)
+        end = to_microseconds(endDate, UNBOUNDED_END)
+        return self._query(UNBOUNDED_START, end, start, UNBOUNDED_END)
+
+    def covering(
+        self, startDate: Optional[datetime], endDate: Optional[datetime]
+    ) -> List[str]:
+        """Datasets with a period that covers all of [startDate, endDate], e.g. "covers 1990-2000"."""
+        start = to_microseconds(startDate, UNBOUNDED_START)
+        end = to_microseconds(endDate, UNBOUNDED_END)
+        return self._query(UNBOUNDED_START, start, end, UNBOUNDED_END)
+
+    def within(
+        self, startDate: Optional[datetime], endDate: Optional[datetime]
+    ) -> List[str]:
+        """Datasets with a period that lies entirely inside [startDate, endDate]."""
+        start = to_microseconds(startDate, UNBOUNDED_START)
+        end = to_microseconds(endDate, UNBOUNDED_END)
+        return self._query(start, UNBOUNDED_END, UNBOUNDED_START, end)
+
+    def at(self, instant: datetime) -> List[str]:
+        """Datasets with a period that contains ``instant``."""
+        return self.covering(instant, instant)
+
+    def count_overlapping(
+        self,
+        startDates: Sequence[Optional[datetime]],
+        endDates: Sequence[Optional[datetime]],
+    ) -> np.ndarray:
+        """Count the periods overlapping each of a batch of query intervals.
+
+        Counts are computed with two vectorized binary searches per batch: every
+        period overlaps the query unless it ends before the query starts or
+        starts after the query ends.
+        """
+        starts = _as_array(startDates, UNBOUNDED_START)
+        ends = _as_array(endDates, UNBOUNDED_END)
+        ended_before = np.searchsorted(self._ends, starts, "left")
+        started_after = len(self._starts) - np.searchsorted(self._starts, ends, "right")
+        return len(self._starts) - ended_before - started_after
+
+    def count_at(self, instants: Sequence[datetime]) -> np.ndarray:
+        """Count the periods containing each of a batch of instants."""
+        return self.count_overlapping(instants, instants)
@@ -0,0 +1,391 @@
+import math
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ._util import get
+
+MAGIC = b"HZNT"
+VERSION = 1
+
+# Weight of each indexed field in the BM25 term frequencies.
+FIELD_BOOSTS = {
+    "title": 3.0,
+    "description": 1.0,
+    "usgsCitation": 0.5,
+    "usgsPurpose": 1.0,
+    "component.title": 2.0,
+    "component.description": 0.8,
+}
+
+_TOKEN = re.compile(r"\w+")
+
+_HEADER = struct.Struct("<4sHI")  # magic, version, number of arrays
+_ARRAY = struct.Struct("<QQ")  # offset, length in bytes
+
+# Arrays of a segment, in file order, with their dtypes.
+_ARRAYS = (
+    ("terms", np.uint8),
+    ("term_offsets", np.int64),
+    ("posting_offsets", np.int64),
+    ("docs", np.int32),
+    ("weights", np.float32),
+    ("lengths", np.float32),
+    ("keys", np.uint8),
+    ("key_offsets", np.int64),
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into case-folded word tokens."""
+    if not text:
+        return []
+    return _TOKEN.findall(text.casefold())
+
+
+def _fields(record) -> Iterator[Tuple[str, Optional[str]]]:
+    for name in ("title", "description", "usgsCitation", "usgsPurpose"):
+        yield name, get(record, name)
+    for component in get(record, "component") or ():
+        yield "component.title", get(component, "title")
+        yield "component.description", get(component, "description")
+
+
+class _Segment:
+    """Immutable postings: sorted terms, each with sorted doc ids and weighted term frequencies."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.terms = arrays["terms"]
+        self.term_offsets = arrays["term_offsets"]
+        self.posting_offsets = arrays["posting_offsets"]
+        self.docs = arrays["docs"]
+        self.weights = arrays["weights"]
+        self._terms = _Terms(self)
+
+    @classmethod
+    def empty(cls) -> "_Segment":
+        return cls(
+            {
+                name: np.zeros(1 if name.endswith("offsets") else 0, dtype=dtype)
+                for name, dtype in _ARRAYS
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.term_offsets) - 1
+
+    def term(self, i: int) -> bytes:
+        return self.terms[self.term_offsets[i] : self.term_offsets[i + 1]].tobytes()
+
+    def find(self, term: bytes) -> int:
+        i = bisect_left(self._terms, term)
+        return i if i < len(self) and self.term(i) == term else -1
+
+    def prefix_range(self, prefix: bytes) -> range:
+        # No UTF-8 encoded string contains the byte 0xff.
+        return range(
+            bisect_left(self._terms, prefix), bisect_left(self._terms, prefix + b"\xff")
+        )
+
+    def postings(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.posting_offsets[i], self.posting_offsets[i + 1]
+        return self.docs[start:end], self.weights[start:end]
+
+
+class _Terms:
+    """Sequence view of a segment's terms for bisect."""
+
+    def __init__(self, segment: _Segment):
+        self.segment = segment
+
+    def __len__(self) -> int:
+        return len(self.segment)
+
+    def __getitem__(self, i: int) -> bytes:
+        return self.segment.term(i)
+
+
+class TextIndex:
+    """Full-text index over the descriptive text of Dataset records, ranked with BM25.
+
+    Indexes title, description, usgsCitation, usgsPurpose and every
+    component's title and description. Each field's term frequencies and
+    length are weighted by ``FIELD_BOOSTS`` before BM25 scoring (BM25F), so a
+    match in a title outranks the same match in a citation.
+
+    Records are added and removed by usgsIdentifier at any time. The records
+    passed to the constructor are compacted straight away; records added later
+    go to an in-memory delta; removed records are masked until ``compact``
+    (or ``save``) rewrites the postings into one compact segment of sorted
+    NumPy arrays. ``save`` writes that segment to a file and ``load`` maps it
+    back with mmap, so opening a large index does not read its postings.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, datasets: Iterable = (), boosts: Dict[str, float] = None):
+        self.boosts = dict(FIELD_BOOSTS if boosts is None else boosts)
+        self._base = _Segment.empty()
+        self._mmap = None
+        self.keys: List[Optional[str]] = []
+        self._doc_ids: Dict[str, int] = {}
+        self._lengths = array("f")
+        self._deleted = bytearray()
+        self._delta: Dict[bytes, Dict[int, float]] = {}
+        self._live = 0
+        self._total_length = 0.0
+        for dataset in datasets:
+            self.add(dataset)
+        if self.keys:
+            self.compact()
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, usgsIdentifier: str) -> bool:
+        return usgsIdentifier in self._doc_ids
+
+    def add(self, dataset: Any):
+        """Index a model or dict, replacing any record with the same usgsIdentifier."""
+        key = get(dataset, "usgsIdentifier")
+        self.remove(key)
+        doc = len(self.keys)
+        frequencies: Dict[str, float] = {}
+        length = 0.0
+        for field, text in _fields(dataset):
+            boost = self.boosts.get(field, 0.0)
+            if not boost:
+                continue
+            tokens = tokenize(text)
+            length += boost * len(tokens)
+            for token in tokens:
+                frequencies[token] = frequencies.get(token, 0.0) + boost
+        for token, weight in frequencies.items():
+            self._delta.setdefault(token.encode(), {})[doc] = weight
+        self.keys.append(key)
+        self._doc_ids[key] = doc
+        self._lengths.append(length)
+        self._deleted.append(0)
+        self._live += 1
+        self._total_length += length
+
+    def update(self, datasets: Iterable):
+        for dataset in datasets:
+            self.add(dataset)
+
+    def remove(self, usgsIdentifier: str) -> bool:
+        doc = self._doc_ids.pop(usgsIdentifier, None)
+        if doc is None:
+            return False
+        self._deleted[doc] = 1
+        self.keys[doc] = None
+        self._live -= 1
+        self._total_length -= self._lengths[doc]
+        return True
+
+    def _term_postings(
+        self, token: str, prefix: bool
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        term = token.encode()
+        if prefix:
+            base = {self._base.term(i): i for i in self._base.prefix_range(term)}
+            delta = [t for t in self._delta if t.startswith(term)]
+        else:
+            i = self._base.find(term)
+            base = {term: i} if i >= 0 else {}
+            delta = [term] if term in self._delta else []
+        # A term's base and delta postings are scored together, so its
+        # document frequency does not depend on when records were compacted.
+        for t in base.keys() | set(delta):
+            parts = [self._base.postings(base[t])] if t in base else []
+            postings = self._delta.get(t)
+            if postings is not None:
+                parts.append(
+                    (
+                        np.fromiter(
+                            postings.keys(), dtype=np.int32, count=len(postings)
+                        ),
+                        np.fromiter(
+                            postings.values(), dtype=np.float32, count=len(postings)
+                        ),
+                    )
+                )
+            if len(parts) == 1:
+                yield parts[0]
+            else:
+                yield tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    def scores(self, query: str, prefix: bool = True) -> np.ndarray:
+        """BM25 score of every document (indexed by doc number) for ``query``.
+
+        With ``prefix``, the last query token also matches every term that
+        starts with it, so results update as a user types.
+        """
+        tokens = tokenize(query)
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        if not tokens or not self._live:
+            return scores
+        lengths = np.frombuffer(self._lengths, dtype=np.float32)
+        deleted = np.frombuffer(self._deleted, dtype=np.bool_)
+        average = self._total_length / self._live or 1.0
+        norms = self.k1 * (1 - self.b + self.b * lengths / average)
+        for position, token in enumerate(dict.fromkeys(tokens)):
+            expand = prefix and position == len(tokens) - 1
+            for docs, weights in self._term_postings(token, expand):
+                live = ~deleted[docs]
+                docs, weights = docs[live], weights[live]
+                if not len(docs):
+                    continue
+                idf = math.log(1 + (self._live - len(docs) + 0.5) / (len(docs) + 0.5))
+                scores[docs] += (
+                    idf * weights * (self.k1 + 1) / (weights + norms[docs])
+                ).astype(np.float32)
+        return scores
+
+    def search(
+        self, query: str, limit: int = 10, prefix: bool = True
+    ) -> List[Tuple[str, float]]:
+        """Return the ``limit`` best (usgsIdentifier, score) pairs for ``query``."""
+        scores = self.scores(query, prefix)
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > limit:
+            matches = matches[np.argpartition(-scores[matches], limit - 1)[:limit]]
+        matches = matches[np.argsort(-scores[matches], kind="stable")]
+        return [(self.keys[doc], float(scores[doc])) for doc in matches]
+
+    def _merged(self) -> Dict[str, np.ndarray]:
+        """Merge the base segment and the delta into new segment arrays, dropping removed records."""
+        deleted = np.frombuffer(self._deleted, dtype=np.bool_)
+        renumber = np.cumsum(~deleted, dtype=np.int64) - 1
+        renumber[deleted] = -1
+
+        base_terms = [self._base.term(i) for i in range(len(self._base))]
+        base_index = {term: i for i, term in enumerate(base_terms)}
+        terms = bytearray()
+        term_offsets = array("q", [0])
+        posting_offsets = array("q", [0])
+        docs_parts: List[np.ndarray] = []
+        weights_parts: List[np.ndarray] = []
+        count = 0
+        for term in sorted(base_index.keys() | self._delta.keys()):
+            docs, weights = [], []
+            if term in base_index:
+                d, w = self._base.postings(base_index[term])
+                docs.append(d)
+                weights.append(w)
+            if term in self._delta:
+                postings = self._delta[term]
+                docs.append(np.fromiter(postings.keys(), dtype=np.int32))
+                weights.append(np.fromiter(postings.values(), dtype=np.float32))
+            d = renumber[np.concatenate(docs)]
+            live = d >= 0
+            if not live.any():
+                continue
+            terms += term
+            term_offsets.append(len(terms))
+            docs_parts.append(d[live].astype(np.int32))
+            weights_parts.append(np.concatenate(weights)[live])
+            count += int(live.sum())
+            posting_offsets.append(count)
+
+        keys = bytearray()
+        key_offsets = array("q", [0])
+        for key in self.keys:
+            if key is not None:
+                keys += key.encode()
+                key_offsets.append(len(keys))
+        lengths = np.frombuffer(self._lengths, dtype=np.float32)[~deleted]
+        return {
+            "terms": np.frombuffer(bytes(terms), dtype=np.uint8),
+            "term_offsets": np.array(term_offsets, dtype=np.int64),
+            "posting_offsets": np.array(posting_offsets, dtype=np.int64),
+            "docs": (
+                np.concatenate(docs_parts) if docs_parts else np.zeros(0, np.int32)
+            ),
+            "weights": (
+                np.concatenate(weights_parts)
+                if weights_parts
+                else np.zeros(0, np.float32)
+            ),
+            "lengths": lengths.copy(),
+            "keys": np.frombuffer(bytes(keys), dtype=np.uint8),
+            "key_offsets": np.array(key_offsets, dtype=np.int64),
+        }
+
+    def _set_segment(self, arrays: Dict[str, np.ndarray]):
+        self._base = _Segment(arrays)
+        keys = arrays["keys"].tobytes()
+        offsets = arrays["key_offsets"]
+        self.keys = [
+            keys[offsets[i] : offsets[i + 1]].decode() for i in range(len(offsets) - 1)
+        ]
+        self._doc_ids = {key: doc for doc, key in enumerate(self.keys)}
+        self._lengths = array("f", arrays["lengths"].tobytes())
+        self._deleted = bytearray(len(self.keys))
+        self._delta = {}
+        self._live = len(self.keys)
+        self._total_length = float(np.sum(arrays["lengths"], dtype=np.float64))
+
+    def compact(self):
+        """Merge added and removed records into a single compact segment."""
+        self._set_segment(self._merged())
+
+    def save(self, path: Union[str, os.PathLike]):
+        """Write a compacted snapshot of the index to ``path``."""
+        arrays = self._merged()
+        position = _HEADER.size + _ARRAY.size * len(_ARRAYS)
+        table = []
+        for name, dtype in _ARRAYS:
+            position += -position % 8
+            data = np.ascontiguousarray(arrays[name], dtype=dtype)
+            table.append((position, data))
+            position += data.nbytes
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(_ARRAYS)))
+            for offset, data in table:
+                f.write(_ARRAY.pack(offset, data.nbytes))
+            for offset, data in table:
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(data.tobytes())
+
+    @classmethod
+    def load(
+        cls, path: Union[str, os.PathLike], boosts: Dict[str, float] = None
+    ) -> "TextIndex":
+        """Open a snapshot written by ``save``. The postings stay memory-mapped."""
+        index = cls(boosts=boosts)
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count = _HEADER.unpack_from(mapped, 0)
+            if magic != MAGIC or version != VERSION or count != len(_ARRAYS):
+                raise ValueError
+            table = [
+                _ARRAY.unpack_from(mapped, _HEADER.size + i * _ARRAY.size)
+                for i in range(count)
+            ]
+            if any(offset + nbytes > len(mapped) for offset, nbytes in table):
+                raise ValueError
+        except (struct.error, ValueError):
+            mapped.close()
+            raise ValueError(f"{path} is not a text index snapshot") from None
+        arrays = {
+            name: np.frombuffer(
+                mapped,
+                dtype=dtype,
+                count=nbytes // np.dtype(dtype).itemsize,
+                offset=offset,
+            )
+            for (name, dtype), (offset, nbytes) in zip(_ARRAYS, table)
+        }
+        index._set_segment(arrays)
+        index._mmap = mapped
+        return index
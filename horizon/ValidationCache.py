@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Set, Type, Union, get_args
+
+import pydantic
+from pydantic import BaseModel
+
+from .DataRelease import DataRelease
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validated (
+    digest BLOB PRIMARY KEY,
+    model TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    used INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _models(annotation, found: Dict[Type[BaseModel], None]):
+    """Collect ``annotation`` and every model nested in its fields, in order."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation in found:
+            return
+        found[annotation] = None
+        for field in annotation.model_fields.values():
+            _models(field.annotation, found)
+    for arg in get_args(annotation):
+        _models(arg, found)
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(model: Type[BaseModel]) -> str:
+    """Fingerprint of everything that can change how ``model`` validates.
+
+    Covers the pydantic version, the model's name and JSON schema, and the
+    source of the modules defining the model and the models nested in its
+    fields (for validators the schema does not show). Editing any of them
+    gives the model a new fingerprint; unrelated models keep theirs.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"{pydantic.VERSION}:{model.__module__}.{model.__qualname__}".encode()
+    )
+    digest.update(json.dumps(model.model_json_schema(), sort_keys=True).encode())
+    found: Dict[Type[BaseModel], None] = {}
+    _models(model, found)
+    for module in sorted({m.__module__ for m in found}):
+        digest.update(Path(sys.modules[module].__file__).read_bytes())
+    return digest.hexdigest()
+
+
+class CacheStats(BaseModel):
+    """Statistics of a ValidationCache.
+
+    Fields
+    ------
+    hits: int
+        Number of documents skipped because they were already known to be valid.
+    misses: int
+        Number of documents that were fully validated.
+    hitRate: float
+        hits / (hits + misses)
+    entries: int
+        Number of known-good documents held by the cache.
+    evictions: int
+        Number of entries evicted to stay within ``max_entries``.
+    """
+
+    hits: int
+    misses: int
+    hitRate: float
+    entries: int
+    evictions: int
+
+
+class ValidationCache:
+    """Persistent record of raw JSON documents that are known to validate.
+
+    Documents are keyed by a BLAKE2 hash of the raw bytes together with the
+    model's schema fingerprint, so a document that validated in an earlier
+    run is skipped by ``check`` until either the document or the model changes.
+    Entries for an outdated fingerprint are dropped when the cache is opened.
+    Only successful validations are cached; invalid documents are validated
+    (and raise) every time.
+
+    The cache is a SQLite database. When it holds more than ``max_entries``
+    documents, the least recently used entries are evicted. Usage updates and
+    new entries are written in batches of ``flush_every``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike] = ":memory:",
+        model: Type[BaseModel] = DataRelease,
+        max_entries: int = 1_000_000,
+        flush_every: int = 1000,
+    ):
+        self.model = model
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.fingerprint = schema_fingerprint(model)
+        self._salt = bytes.fromhex(self.fingerprint)
+        self.hits = self.misses = self.evictions = 0
+        self._added: Set[bytes] = set()
+        self._touched: List[bytes] = []
+
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        with self._db:
+            self._db.execute(_SCHEMA)
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS validated_used ON validated (used)"
+            )
+            self._db.execute(
+                "DELETE FROM validated WHERE model = ? AND fingerprint != ?",
+                (model.__name__, self.fingerprint),
+            )
+        self._clock = self._db.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM validated"
+        ).fetchone()[0]
+        self._entries = self._db.execute(
+            "SELECT COUNT(*) FROM validated WHERE model = ?", (model.__name__,)
+        ).fetchone()[0]
+
+    def digest(self, document: Union[bytes, str]) -> bytes:
+        if isinstance(document, str):
+            document = document.encode()
+        return hashlib.blake2b(document, digest_size=16, key=self._salt).digest()
+
+    def _known(self, digest: bytes) -> bool:
+        if digest in self._added:
+            return True
+        row = self._db.execute(
+            "SELECT 1 FROM validated WHERE digest = ?", (digest,)
+        ).fetchone()
+        return row is not None
+
+    def is_known(self, document: Union[bytes, str]) -> bool:
+        """Whether the raw JSON document is known to be valid."""
+        return self._known(self.digest(document))
+
+    __contains__ = is_known
+
+    def _remember(self, digest: bytes, known: bool):
+        if known:
+            self._touched.append(digest)
+        else:
+            self._added.add(digest)
+        if len(self._added) + len(self._touched) >= self.flush_every:
+            self.flush()
+
+    def check(self, document: Union[bytes, str]) -> bool:
+        """Validate a raw JSON document unless it is already known to be valid.
+
+        Returns True if the document was skipped as known to be valid, False
+        if it was validated. Raises pydantic.ValidationError if the document
+        is invalid.
+        """
+        digest = self.digest(document)
+        known = self._known(digest)
+        if known:
+            self.hits += 1
+        else:
+            self.model.model_validate_json(document)
+            self.misses += 1
+        self._remember(digest, known)
+        return known
+
+    def validate(self, document: Union[bytes, str]) -> BaseModel:
+        """Validate a raw JSON document and return the model instance.
+
+        A model can only come from full validation, so this always validates;
+        it records the document as known to be valid for later ``check`` and
+        ``is_known`` calls, without counting a hit or a miss. Raises
+        pydantic.ValidationError if the document is invalid.
+        """
+        instance = self.model.model_validate_json(document)
+        digest = self.digest(document)
+        self._remember(digest, self._known(digest))
+        return instance
+
+    def flush(self):
+        """Write pending entries and usage updates, then evict down to ``max_entries``."""
+        with self._db:
+            rows = []
+            for digest in self._touched:
+                self._clock += 1
+                rows.append((self._clock, digest))
+            self._db.executemany("UPDATE validated SET used = ? WHERE digest = ?", rows)
+            rows = []
+            for digest in self._added:
+                self._clock += 1
+                rows.append(
+                    (digest, self.model.__name__, self.fingerprint, self._clock)
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO validated VALUES (?, ?, ?, ?)", rows
+            )
+            self._entries += len(rows)
+            self._added.clear()
+            self._touched.clear()
+
+            excess = self._entries - self.max_entries
+            if excess > 0:
+                self._db.execute(
+                    "DELETE FROM validated WHERE digest IN "
+                    "(SELECT digest FROM validated WHERE model = ? ORDER BY used LIMIT ?)",
+                    (self.model.__name__, excess),
+                )
+                self._entries -= excess
+                self.evictions += excess
+
+    def stats(self) -> CacheStats:
+        lookups = self.hits + self.misses
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            hitRate=self.hits / lookups if lookups else 0.0,
+            entries=self._entries + len(self._added),
+            evictions=self.evictions,
+        )
+
+    def clear(self):
+        with self._db:
+            self._db.execute(
+                "DELETE FROM validated WHERE model = ?", (self.model.__name__,)
+            )
+        self._added.clear()
+        self._touched.clear()
+        self._entries = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,226 @@
+import json
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ._util import nested_model
+
+
+class FieldTiming(BaseModel):
+    """Cumulative timing of one model or field for one operation.
+
+    Fields
+    ------
+    model: str
+        The model class name.
+    field: Optional[str]
+        The field name, or None for the whole model.
+    operation: str
+        "validate" or "serialize".
+    count: int
+        Number of values processed.
+    errors: int
+        Number of values that failed validation.
+    totalSeconds: float
+        Cumulative time.
+    meanMicroseconds: float
+        Mean time per value.
+    """
+
+    model: str
+    field: Optional[str]
+    operation: str
+    count: int
+    errors: int
+    totalSeconds: float
+    meanMicroseconds: float
+
+
+class ProfileReport(BaseModel):
+    """Timings collected by a ValidationProfiler, slowest first.
+
+    Fields
+    ------
+    timings: List[FieldTiming]
+        One entry per (model, field, operation).
+    """
+
+    timings: List[FieldTiming]
+
+    def table(self, top: Optional[int] = None) -> str:
+        """Format the report as a fixed-width text table."""
+        rows = [
+            (
+                t.operation,
+                t.model if t.field is None else f"{t.model}.{t.field}",
+                str(t.count),
+                f"{t.totalSeconds * 1e3:.3f}",
+                f"{t.meanMicroseconds:.2f}",
+            )
+            for t in self.timings[:top]
+        ]
+        header = ("operation", "model/field", "count", "total ms", "mean us")
+        widths = [max(len(r[i]) for r in rows + [header]) for i in range(5)]
+        lines = []
+        for row in [header] + rows:
+            lines.append(
+                "  ".join(
+                    cell.ljust(w) if i < 2 else cell.rjust(w)
+                    for i, (cell, w) in enumerate(zip(row, widths))
+                )
+            )
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(model.model_fields[name].annotation)
+
+
+def _items(value) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+class ValidationProfiler:
+    """Opt-in profiler of validation and serialization time per model and per field.
+
+    pydantic validates a whole record in one compiled call, so the profiler
+    measures the parts separately: every model instance in the record is
+    validated (and serialized) on its own, and so is every field value through
+    a TypeAdapter of the field's type. Field times include nested models, so
+    a slow ``Dataset.distribution`` can be traced to ``Distribution.downloadURL``.
+
+    Leave the profiler in place with ``enabled=False`` for production runs:
+    ``validate`` is then a plain ``model_validate`` / ``model_validate_json``
+    call. Profiling a record costs several times its normal validation.
+    """
+
+    def __init__(self, enabled: bool = True, serialization: bool = True):
+        self.enabled = enabled
+        self.serialization = serialization
+        # (model, field, operation) -> [count, errors, nanoseconds]
+        self._stats: Dict[Tuple[str, Optional[str], str], List[int]] = {}
+
+    def _record(self, key, elapsed: int, failed: bool = False):
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = self._stats[key] = [0, 0, 0]
+        entry[0] += 1
+        entry[1] += failed
+        entry[2] += elapsed
+
+    def _time(self, key, function, *args):
+        start = time.perf_counter_ns()
+        try:
+            result = function(*args)
+        except ValidationError:
+            self._record(key, time.perf_counter_ns() - start, True)
+            return None
+        self._record(key, time.perf_counter_ns() - start)
+        return result
+
+    def validate(
+        self, model: Type[BaseModel], data: Union[Dict[str, Any], str, bytes]
+    ) -> BaseModel:
+        """Validate ``data`` (a dict or raw JSON) into ``model``, profiling it when enabled.
+
+        The whole-record time is that of the call the profiler stands in for:
+        ``model_validate_json`` for raw JSON, ``model_validate`` for a dict.
+        Raises pydantic.ValidationError like those do, after recording the
+        failure and the per-field times that locate it.
+        """
+        if not self.enabled:
+            if isinstance(data, (str, bytes)):
+                return model.model_validate_json(data)
+            return model.model_validate(data)
+        key = (model.__name__, None, "validate")
+        raw = isinstance(data, (str, bytes))
+        start = time.perf_counter_ns()
+        try:
+            if raw:
+                result = model.model_validate_json(data)
+            else:
+                result = model.model_validate(data)
+        except ValidationError:
+            self._record(key, time.perf_counter_ns() - start, True)
+            self._profile_fields(model, self._parsed(data) if raw else data)
+            raise
+        self._record(key, time.perf_counter_ns() - start)
+        self._profile_fields(model, json.loads(data) if raw else data)
+        if self.serialization:
+            self._profile_serialization(result)
+        return result
+
+    @staticmethod
+    def _parsed(data: Union[str, bytes]) -> Any:
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def _profile_validation(self, model: Type[BaseModel], data: Dict[str, Any]):
+        self._time((model.__name__, None, "validate"), model.model_validate, data)
+        self._profile_fields(model, data)
+
+    def _profile_fields(self, model: Type[BaseModel], data: Any):
+        if not isinstance(data, dict):
+            return
+        name = model.__name__
+        for field_name, field in model.model_fields.items():
+            if field_name not in data:
+                continue
+            value = data[field_name]
+            adapter = _field_adapter(model, field_name)
+            self._time((name, field_name, "validate"), adapter.validate_python, value)
+            nested = nested_model(field.annotation)
+            if nested is not None:
+                for item in _items(value):
+                    if isinstance(item, dict):
+                        self._profile_validation(nested, item)
+
+    def _profile_serialization(self, instance: BaseModel):
+        model = type(instance)
+        name = model.__name__
+        self._time((name, None, "serialize"), lambda: instance.model_dump(mode="json"))
+        for field_name, field in model.model_fields.items():
+            value = getattr(instance, field_name)
+            adapter = _field_adapter(model, field_name)
+            start = time.perf_counter_ns()
+            adapter.dump_python(value, mode="json")
+            self._record(
+                (name, field_name, "serialize"), time.perf_counter_ns() - start
+            )
+            if nested_model(field.annotation) is not None:
+                for item in _items(value):
+                    if isinstance(item, BaseModel):
+                        self._profile_serialization(item)
+
+    def report(self) -> ProfileReport:
+        timings = [
+            FieldTiming(
+                model=model,
+                field=field,
+                operation=operation,
+                count=count,
+                errors=errors,
+                totalSeconds=nanoseconds / 1e9,
+                meanMicroseconds=nanoseconds / count / 1e3,
+            )
+            for (model, field, operation), (count, errors, nanoseconds) in (
+                self._stats.items()
+            )
+        ]
+        timings.sort(key=lambda t: t.totalSeconds, reverse=True)
+        return ProfileReport(timings=timings)
+
+    def export(self, callback: Callable[[FieldTiming], Any]):
+        """Send every timing to a metrics callback, e.g. a StatsD or Prometheus client."""
+        for timing in self.report().timings:
+            callback(timing)
+
+    def reset(self):
+        self._stats.clear()
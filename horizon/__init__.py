@@ -0,0 +1,81 @@
+"""Horizon metadata data models.
+
+Models are loaded lazily: ``import horizon`` does not import any model module,
+and accessing ``horizon.Creator`` only imports ``horizon.Entity``. Pydantic
+validators are built on first use of each model (``defer_build``), so short-lived
+processes only pay for the models they actually touch.
+
+Every public name is the model or enum class, including the model modules'
+main classes: ``horizon.DataRelease`` and ``from horizon import DataRelease``
+give the DataRelease model, not the ``horizon.DataRelease`` submodule. The
+submodules are still importable with ``from horizon.DataRelease import ...``
+and ``importlib.import_module("horizon.DataRelease")``; note that
+``import horizon.DataRelease as m`` binds the class, since Python resolves it
+through the package attribute.
+"""
+
+import importlib
+import sys
+import types
+
+# Public name -> (defining module, class name).
+_lazy_attributes = {
+    "CatalogedResource": ("CatalogedResource", "CatalogedResource"),
+    "UsgsAssetTypeEnum": ("CatalogedResource", "UsgsAssetTypeEnum"),
+    "AccessRightsEnum": ("CatalogedResource", "AccessRightsEnum"),
+    "Entity": ("Entity", "Entity"),
+    "Creator": ("Entity", "Creator"),
+    "Contributor": ("Entity", "Contributor"),
+    "NameTypeEnum": ("Entity", "NameTypeEnum"),
+    "ContributorTypeEnum": ("Entity", "ContributorTypeEnum"),
+    "License": ("License", "License"),
+    "Checksum": ("Distribution", "Checksum"),
+    "Distribution": ("Distribution", "Distribution"),
+    "BoundingBox": ("Location", "BoundingBox"),
+    "Centroid": ("Location", "Centroid"),
+    "Location": ("Location", "Location"),
+    "Dataset": ("Dataset", "Dataset"),
+    "Keyword": ("Dataset", "Keyword"),
+    "DataciteRelationTypeEnum": ("Dataset", "DataciteRelationTypeEnum"),
+    "RelatedIdentifierTypeEnum": ("Dataset", "RelatedIdentifierTypeEnum"),
+    "RelatedIdentifier": ("Dataset", "RelatedIdentifier"),
+    "AlternateIdentifierTypeEnum": ("Dataset", "AlternateIdentifierTypeEnum"),
+    "AlternateIdentifier": ("Dataset", "AlternateIdentifier"),
+    "PeriodOfTime": ("Dataset", "PeriodOfTime"),
+    "UsgsDataSource": ("Dataset", "UsgsDataSource"),
+    "UsgsMissionArea": ("Dataset", "UsgsMissionArea"),
+    "VersionHistory": ("Dataset", "VersionHistory"),
+    "Component": ("Dataset", "Component"),
+    "DataRelease": ("DataRelease", "DataRelease"),
+    "StatusEnum": ("DataRelease", "StatusEnum"),
+    "UsgsReleaseTypeEnum": ("DataRelease", "UsgsReleaseTypeEnum"),
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name):
+    target = _lazy_attributes.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, class_name = target
+    value = getattr(importlib.import_module(f".{module_name}", __name__), class_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # The import system binds each submodule on the package as it loads.
+        # A model module shares its name with its main class; bind the class.
+        target = _lazy_attributes.get(name)
+        if isinstance(value, types.ModuleType) and target and target[0] == name:
+            value = getattr(value, target[1])
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,36 @@
+"""Helpers shared by the modules that read records as models or raw dicts."""
+
+from typing import Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+# Prefixes of a DOI written as a resolver URL or URI, lowercase.
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "doi:")
+
+
+def get(obj, name):
+    """Read a field of a model or a raw dict; None if ``obj`` is None or lacks it."""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def unwrap_optional(annotation):
+    """``X`` for ``Optional[X]``; any other annotation unchanged."""
+    args = [a for a in get_args(annotation) if a is not type(None)]
+    if get_origin(annotation) is Union and len(args) == 1:
+        return args[0]
+    return annotation
+
+
+def nested_model(annotation) -> Optional[Type[BaseModel]]:
+    """The first model class in an annotation such as ``Optional[List[Model]]``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = nested_model(arg)
+        if model is not None:
+            return model
+    return None
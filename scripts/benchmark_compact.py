@@ -0,0 +1,52 @@
+"""Measure memory per record of DataRelease models and of a CompactCatalog.
+
+Also times conversion to compact records and back. Results are written as
+JSON. Run from the repository root:
+
+    python -m scripts.benchmark_compact --records 1000 --distributions 20
+"""
+
+import argparse
+import json
+from typing import Any, Dict
+
+from horizon.CompactRecord import CompactCatalog, memory_report
+from horizon.DataRelease import DataRelease
+from scripts.benchmark_models import measure
+from scripts.synthetic_catalog import SIZES, generate_catalog
+
+
+def run(
+    records: int = 1000,
+    seed: int = 0,
+    min_time: float = 0.1,
+    repeat: int = 5,
+    **sizes,
+) -> Dict[str, Any]:
+    releases = [DataRelease(**r) for r in generate_catalog(records, seed, **sizes)]
+    catalog = CompactCatalog(releases)
+    return {
+        "parameters": {"records": records, "seed": seed, **sizes},
+        "memory": memory_report(releases).model_dump(),
+        "to_compact": measure(lambda: CompactCatalog(releases), min_time, repeat),
+        "to_model": measure(lambda: list(catalog.models()), min_time, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    for size in SIZES:
+        parser.add_argument(f"--{size}", type=int)
+    args = parser.parse_args()
+
+    sizes = {s: getattr(args, s) for s in SIZES if getattr(args, s) is not None}
+    report = run(args.records, args.seed, args.min_time, args.repeat, **sizes)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure loading a release with many distributions as DataRelease and as LazyDataRelease.
+
+Reports the time and the memory held after loading one generated record, for
+parsing the JSON alone, for LazyDataRelease (parsed, validation deferred) and
+for DataRelease (everything validated), and the time of the lazy aggregates.
+Results are written as JSON. Run from the repository root:
+
+    python -m scripts.benchmark_lazy_distribution --distributions 100000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from pydantic_core import from_json
+
+from horizon.DataRelease import DataRelease
+from horizon.LazyDistribution import LazyDataRelease
+from scripts.benchmark_models import measure
+from scripts.synthetic_catalog import generate_record
+
+
+def retained_bytes(load: Callable[[], Any]) -> int:
+    """Bytes still allocated while the result of ``load()`` is alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run(
+    distributions: int = 10000,
+    seed: int = 0,
+    min_time: float = 0.1,
+    repeat: int = 3,
+) -> Dict[str, Any]:
+    document = json.dumps(
+        generate_record(seed, 0, distributions=distributions, components=0)
+    ).encode()
+    loads = {
+        "from_json": lambda: from_json(document),
+        "LazyDataRelease": lambda: LazyDataRelease.model_validate_json(document),
+        "DataRelease": lambda: DataRelease.model_validate_json(document),
+    }
+    results = {}
+    for name, load in loads.items():
+        results[name] = measure(load, min_time, repeat)
+        results[name]["retained_bytes"] = retained_bytes(load)
+    lazy = LazyDataRelease.model_validate_json(document).distribution
+    results["total_byte_size"] = measure(lazy.total_byte_size, min_time, repeat)
+    results["media_types"] = measure(lazy.media_types, min_time, repeat)
+    results["first_page"] = measure(
+        lambda: LazyDataRelease.model_validate_json(document).distribution.page(0),
+        min_time,
+        repeat,
+    )
+    return {
+        "parameters": {
+            "distributions": distributions,
+            "seed": seed,
+            "documentBytes": len(document),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--distributions", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    report = run(args.distributions, args.seed, args.min_time, args.repeat)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
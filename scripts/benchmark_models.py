@@ -0,0 +1,186 @@
+"""Benchmark construction, validation, serialization and JSON schema generation of every model.
+
+Sample inputs come from the seeded synthetic catalog, so runs are repeatable.
+Results are written as JSON for tracking regressions across pydantic versions.
+Run from the repository root:
+
+    python -m scripts.benchmark_models --records 20 --distributions 50 --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import pydantic
+import pydantic_core
+from pydantic import BaseModel
+
+from horizon.CatalogedResource import CatalogedResource
+from horizon.DataRelease import DataRelease
+from horizon.Dataset import (
+    AlternateIdentifier,
+    Component,
+    Dataset,
+    Keyword,
+    PeriodOfTime,
+    RelatedIdentifier,
+    UsgsDataSource,
+    UsgsMissionArea,
+    VersionHistory,
+)
+from horizon.Distribution import Checksum, Distribution
+from horizon.Entity import Contributor, Creator, Entity
+from horizon.License import License
+from horizon.Location import BoundingBox, Centroid, Location
+from scripts.synthetic_catalog import SIZES, generate_catalog
+
+# Each model with the path of its sample value inside a generated record.
+# An empty path uses the whole record.
+MODELS: List[Tuple[Type[BaseModel], Tuple]] = [
+    (CatalogedResource, ()),
+    (Dataset, ()),
+    (DataRelease, ()),
+    (Entity, ("publisher",)),
+    (Creator, ("creator", 0)),
+    (Contributor, ("qualifiedAttribution",)),
+    (License, ("license",)),
+    (Checksum, ("distribution", 0, "checksum")),
+    (Distribution, ("distribution", 0)),
+    (BoundingBox, ("spatial", "bbox")),
+    (Centroid, ("spatial", "centroid")),
+    (Location, ("spatial",)),
+    (Keyword, ("keyword", 0)),
+    (RelatedIdentifier, ("relation", 0)),
+    (AlternateIdentifier, ("alternateIdentifier", 0)),
+    (PeriodOfTime, ("temporal", 0)),
+    (UsgsDataSource, ("usgsDataSource",)),
+    (UsgsMissionArea, ("usgsMissionArea",)),
+    (VersionHistory, ("versionHistory",)),
+    (Component, ("component", 0)),
+]
+
+
+def sample(record: Dict[str, Any], path: Tuple) -> Optional[Any]:
+    """The value at ``path`` in ``record``, or None where the record has none."""
+    for step in path:
+        try:
+            record = record[step]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return record
+
+
+def measure(
+    operation: Callable[[], Any], min_time: float, repeat: int
+) -> Dict[str, float]:
+    """Time ``operation``, calibrating the loop count so each repeat runs for ``min_time`` seconds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+
+    timings = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        timings.append((time.perf_counter() - start) / loops)
+    median = statistics.median(timings)
+    return {
+        "loops": loops,
+        "median_us": round(median * 1e6, 3),
+        "min_us": round(min(timings) * 1e6, 3),
+        "ops_per_sec": round(1 / median, 1) if median else None,
+    }
+
+
+def operations(
+    model: Type[BaseModel], values: List[Any]
+) -> Dict[str, Callable[[], Any]]:
+    """The benchmarked operations. Each call processes every sample value once."""
+    instances = [model(**value) for value in values]
+    documents = [instance.model_dump_json() for instance in instances]
+    return {
+        "construct": lambda: [model(**value) for value in values],
+        "model_validate": lambda: [model.model_validate(value) for value in values],
+        "model_dump": lambda: [instance.model_dump() for instance in instances],
+        "model_dump_json": lambda: [i.model_dump_json() for i in instances],
+        "model_validate_json": lambda: [
+            model.model_validate_json(d) for d in documents
+        ],
+        "model_json_schema": lambda: model.model_json_schema(),
+    }
+
+
+def run(
+    records: int = 10,
+    seed: int = 0,
+    min_time: float = 0.1,
+    repeat: int = 5,
+    models: List[str] = None,
+    **sizes,
+) -> Dict[str, Any]:
+    catalog = list(generate_catalog(records, seed, **sizes))
+    results = []
+    not_measured = []
+    for model, path in MODELS:
+        if models and model.__name__ not in models:
+            continue
+        values = [sample(record, path) for record in catalog]
+        values = [value for value in values if value is not None]
+        if not values:
+            # E.g. Keyword when the catalog is generated with --keywords 0.
+            not_measured.append(model.__name__)
+            continue
+        for name, operation in operations(model, values).items():
+            timing = measure(operation, min_time, repeat)
+            if name != "model_json_schema":
+                timing["median_us_per_record"] = round(
+                    timing["median_us"] / len(values), 3
+                )
+            results.append({"model": model.__name__, "operation": name, **timing})
+    return {
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+        "pydantic_core": pydantic_core.__version__,
+        "platform": platform.platform(),
+        "parameters": {"records": records, "seed": seed, **sizes},
+        "results": results,
+        "notMeasured": not_measured,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--model", action="append", dest="models")
+    parser.add_argument("--output", help="write results to this JSON file")
+    for size in SIZES:
+        parser.add_argument(f"--{size}", type=int)
+    args = parser.parse_args()
+
+    sizes = {s: getattr(args, s) for s in SIZES if getattr(args, s) is not None}
+    report = run(
+        args.records, args.seed, args.min_time, args.repeat, args.models, **sizes
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark projection views against full DataRelease validation.
+
+Each field set is validated from the same raw JSON documents as the full
+model. Results are written as JSON. Run from the repository root:
+
+    python -m scripts.benchmark_projection --records 50 --distributions 200
+"""
+
+import argparse
+import json
+from typing import Any, Dict, List
+
+from horizon.DataRelease import DataRelease
+from horizon.Projection import LISTING_FIELDS, projection
+from scripts.benchmark_models import measure
+from scripts.synthetic_catalog import SIZES, generate_catalog
+
+FIELD_SETS = {
+    "listing": list(LISTING_FIELDS),
+    "listing+creators": list(LISTING_FIELDS) + ["creator.name"],
+    "listing+bbox": list(LISTING_FIELDS) + ["spatial.bbox"],
+}
+
+
+def run(
+    records: int = 50,
+    seed: int = 0,
+    min_time: float = 0.1,
+    repeat: int = 5,
+    **sizes,
+) -> Dict[str, Any]:
+    documents = [json.dumps(r) for r in generate_catalog(records, seed, **sizes)]
+    full = measure(
+        lambda: [DataRelease.model_validate_json(d) for d in documents],
+        min_time,
+        repeat,
+    )
+    results: List[Dict[str, Any]] = [{"fields": "full", **full, "speedup": 1.0}]
+    for name, fields in FIELD_SETS.items():
+        view = projection(fields)
+        timing = measure(
+            lambda: [view.from_json(d) for d in documents], min_time, repeat
+        )
+        timing["speedup"] = round(full["median_us"] / timing["median_us"], 2)
+        results.append({"fields": name, **timing})
+    return {
+        "parameters": {"records": records, "seed": seed, **sizes},
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    for size in SIZES:
+        parser.add_argument(f"--{size}", type=int)
+    args = parser.parse_args()
+
+    sizes = {s: getattr(args, s) for s in SIZES if getattr(args, s) is not None}
+    report = run(args.records, args.seed, args.min_time, args.repeat, **sizes)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
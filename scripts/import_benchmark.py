@@ -0,0 +1,81 @@
+"""Measure cold import and first-validation time of the horizon models.
+
+Each case runs in a fresh interpreter so nothing is cached between runs. The
+"eager" cases are the same code with ``defer_build`` switched off, i.e. every
+core schema built when its class is defined, as before deferred building.
+pydantic itself is imported before the timer starts in every case. Run from
+the repository root:
+
+    python scripts/import_benchmark.py --repeat 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Runs before the timer: load the document and, for eager cases, turn off defer_build.
+SETUP = "import pydantic; document = open({path!r}).read()"
+EAGER = (
+    "; _config = pydantic.ConfigDict; "
+    "pydantic.ConfigDict = lambda **kw: _config(**dict(kw, defer_build=False))"
+)
+
+IMPORT = "from horizon.DataRelease import DataRelease"
+VALIDATE = IMPORT + "; DataRelease.model_validate_json(document)"
+
+CASES = {
+    "import horizon": ("import horizon", False),
+    "import DataRelease (deferred)": (IMPORT, False),
+    "import DataRelease (eager)": (IMPORT, True),
+    "import + first validation (deferred)": (VALIDATE, False),
+    "import + first validation (eager)": (VALIDATE, True),
+}
+
+TIMER = "{setup}\nimport time; _t = time.perf_counter(); {stmt}; print(time.perf_counter() - _t)"
+
+
+def time_case(stmt, eager, path, repeat):
+    setup = SETUP.format(path=str(path)) + (EAGER if eager else "")
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(setup=setup, stmt=stmt)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        samples.append(float(out.stdout.strip()) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    from scripts.synthetic_catalog import generate_record
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "record.json"
+        path.write_text(json.dumps(generate_record(0, 0)))
+        results = {
+            name: time_case(stmt, eager, path, args.repeat)
+            for name, (stmt, eager) in CASES.items()
+        }
+    print(json.dumps({"python": sys.version.split()[0], "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Profile validation and serialization time per model and field for a sample file.
+
+The sample is a JSON document, a JSON array of documents or NDJSON (optionally
+gzipped). Run from the repository root:
+
+    python -m scripts.profile_validation sample.ndjson --model DataRelease --top 25
+"""
+
+import argparse
+import json
+
+from pydantic import ValidationError
+
+import horizon
+from horizon.StreamingValidator import open_ndjson
+from horizon.ValidationProfiler import ValidationProfiler
+
+
+def read_documents(path: str):
+    with open_ndjson(path) as f:
+        text = f.read().strip()
+    if text.startswith(b"["):
+        return json.loads(text)
+    try:
+        return [json.loads(text)]
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--model", default="DataRelease")
+    parser.add_argument("--limit", type=int, help="profile at most this many records")
+    parser.add_argument("--top", type=int, default=30, help="rows to print")
+    parser.add_argument("--no-serialization", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    model = getattr(horizon, args.model)
+    profiler = ValidationProfiler(serialization=not args.no_serialization)
+    invalid = 0
+    for document in read_documents(args.path)[: args.limit]:
+        try:
+            profiler.validate(model, document)
+        except ValidationError:
+            invalid += 1
+
+    report = profiler.report()
+    if args.json:
+        print(report.model_dump_json(indent=2))
+    else:
+        print(report.table(args.top))
+        if invalid:
+            print(f"\n{invalid} invalid records")
+
+
+if __name__ == "__main__":
+    main()
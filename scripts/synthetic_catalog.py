@@ -0,0 +1,283 @@
+"""Deterministic synthetic DataRelease records for benchmarks and tests.
+
+Records are plain JSON-compatible dicts. Each record is generated from its own
+seed (catalog seed and position), so record i is identical no matter how many
+records are requested. Write a catalog as NDJSON with:
+
+    python -m scripts.synthetic_catalog 10000 catalog.ndjson --distributions 50
+"""
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator
+
+from horizon.CatalogedResource import AccessRightsEnum, UsgsAssetTypeEnum
+from horizon.DataRelease import StatusEnum, UsgsReleaseTypeEnum
+from horizon.Dataset import (
+    AlternateIdentifierTypeEnum,
+    DataciteRelationTypeEnum,
+    RelatedIdentifierTypeEnum,
+)
+from horizon.Entity import ContributorTypeEnum, NameTypeEnum
+
+WORDS = (
+    "streamflow groundwater sediment geochemistry seismic hazard landslide "
+    "wildfire coastal erosion aquifer recharge nutrient habitat species "
+    "survey mapping elevation lidar imagery mineral resource wetland glacier "
+    "estuary drought flood volcano magnetic gravity soil carbon climate"
+).split()
+
+SCIENCE_CENTERS = [
+    ("Colorado Water Science Center", "cwsc"),
+    ("Alaska Science Center", "asc"),
+    ("Pacific Coastal and Marine Science Center", "pcmsc"),
+    ("Geology, Geophysics, and Geochemistry Science Center", "gggsc"),
+    ("Earth Resources Observation and Science Center", "eros"),
+]
+
+MISSION_AREAS = [
+    ("Water Resources", "wma"),
+    ("Natural Hazards", "nhma"),
+    ("Core Science Systems", "cssma"),
+    ("Ecosystems", "ema"),
+    ("Energy and Minerals", "emma"),
+]
+
+MEDIA_TYPES = [
+    "text/csv",
+    "application/json",
+    "application/zip",
+    "image/tiff",
+    "application/xml",
+    "application/x-netcdf",
+]
+
+KEYWORD_SCHEMES = ["USGS Thesaurus", "ISO 19115 Topic Category", "Place"]
+
+SIZES = ("creators", "distributions", "components", "keywords", "relations")
+
+FIRST_NAMES = "Ada Ben Carmen Dev Elena Farid Grace Hiro Imani Jonas Kai Lena".split()
+LAST_NAMES = "Alvarez Brooks Chen Diaz Evans Fischer Garcia Hughes Ito Jensen".split()
+
+USGS = {
+    "entity_id": "usgs",
+    "name": "U.S. Geological Survey",
+    "nameType": NameTypeEnum.organizational.value,
+    "nameIdentifier": "https://ror.org/035a68863",
+    "email": None,
+}
+
+EPOCH = datetime(1990, 1, 1)
+
+
+def _timestamp(
+    rng: random.Random, start: datetime = EPOCH, days: int = 12000
+) -> datetime:
+    return start + timedelta(days=rng.randrange(days), seconds=rng.randrange(86400))
+
+
+def _words(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _person(rng: random.Random, n: int) -> Dict[str, Any]:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "entity_id": f"person-{n}",
+        "name": f"{last}, {first}",
+        "nameType": NameTypeEnum.usgs_personal.value,
+        "nameIdentifier": f"https://orcid.org/0000-0002-{n:04d}-{rng.randrange(10000):04d}",
+        "email": f"{first.lower()}.{last.lower()}@usgs.gov",
+    }
+
+
+def _creator(rng: random.Random, position: int) -> Dict[str, Any]:
+    center, _ = rng.choice(SCIENCE_CENTERS)
+    return dict(
+        _person(rng, rng.randrange(500)),
+        position=position,
+        affiliation=center,
+        affiliationIdentifier="https://ror.org/035a68863",
+    )
+
+
+def _distribution(rng: random.Random, identifier: str, n: int) -> Dict[str, Any]:
+    media_type = rng.choice(MEDIA_TYPES)
+    name = f"{rng.choice(WORDS)}_{n}.{media_type.rsplit('/', 1)[-1].replace('x-', '')}"
+    return {
+        "title": _words(rng, 3),
+        "name": name,
+        "description": None,
+        "format": None,
+        "mediaType": media_type,
+        "downloadURL": f"https://data.usgs.gov/datacatalog/{identifier}/{name}",
+        "accessURL": None,
+        "byteSize": rng.randrange(1 << 10, 1 << 32),
+        "checksum": {
+            "algorithm": "SHA256",
+            "checksumValue": "%064x" % rng.getrandbits(256),
+        },
+        "modifiedBy": dict(USGS),
+        "modified": _timestamp(rng).isoformat(),
+        "useForPreview": n == 0 and media_type == "image/tiff",
+    }
+
+
+def _bbox(rng: random.Random) -> Dict[str, float]:
+    west = rng.uniform(-170, -70)
+    south = rng.uniform(20, 65)
+    return {
+        "westBoundLongitude": round(west, 4),
+        "eastBoundLongitude": round(min(west + rng.uniform(0.1, 20), 180), 4),
+        "southBoundLatitude": round(south, 4),
+        "northBoundLatitude": round(min(south + rng.uniform(0.1, 10), 90), 4),
+    }
+
+
+def generate_record(
+    seed: int = 0,
+    index: int = 0,
+    creators: int = 3,
+    distributions: int = 5,
+    components: int = 1,
+    keywords: int = 5,
+    relations: int = 2,
+) -> Dict[str, Any]:
+    """Generate one valid DataRelease record as a JSON-compatible dict."""
+    rng = random.Random(f"{seed}:{index}")
+    identifier = f"{rng.getrandbits(48):012x}"
+    doi = f"https://doi.org/10.5066/P{identifier[:8].upper()}"
+    created = _timestamp(rng)
+    issued = created + timedelta(days=rng.randrange(1, 365))
+    bbox = _bbox(rng)
+    center, center_id = rng.choice(SCIENCE_CENTERS)
+    mission, mission_id = rng.choice(MISSION_AREAS)
+    title = _words(rng, 8).capitalize()
+    contact = _person(rng, rng.randrange(500))
+
+    return {
+        "title": title,
+        "usgsAssetType": rng.choice(list(UsgsAssetTypeEnum)).value,
+        "description": _words(rng, 60),
+        "usgsCreated": created.isoformat(),
+        "usgsModified": (issued + timedelta(days=rng.randrange(365))).isoformat(),
+        "identifier": doi,
+        "usgsIdentifier": identifier,
+        "accessRights": rng.choice(list(AccessRightsEnum)).value,
+        "issued": issued.isoformat(),
+        "modified": None,
+        "creator": [_creator(rng, i + 1) for i in range(creators)],
+        "publisher": dict(USGS),
+        "usgsCitation": f"{title}: U.S. Geological Survey data release, {doi}",
+        "contactPoint": contact,
+        "usgsMetadataContactPoint": dict(USGS),
+        "license": {
+            "licenseIdentifier": "CC0-1.0",
+            "license": "Creative Commons Zero v1.0 Universal",
+            "licenseUri": "https://creativecommons.org/publicdomain/zero/1.0/",
+            "licenseIdentifierScheme": "SPDX",
+            "schemeUri": "https://spdx.org/licenses/",
+        },
+        "usgsDataSource": {"name": center, "dataSourceId": center_id},
+        "distribution": [
+            _distribution(rng, identifier, i) for i in range(distributions)
+        ],
+        "component": [
+            {
+                "identifier": None,
+                "title": _words(rng, 4),
+                "description": _words(rng, 20),
+                "usgsCitation": f"{title}, {doi}",
+                "catalogRecord": False,
+                "distribution": [
+                    _distribution(rng, identifier, 1000 * (c + 1) + i)
+                    for i in range(distributions)
+                ],
+                "alternateIdentifier": None,
+            }
+            for c in range(components)
+        ],
+        "keyword": [
+            {
+                "concept": rng.choice(WORDS),
+                "conceptScheme": rng.choice(KEYWORD_SCHEMES),
+                "conceptUri": None,
+            }
+            for _ in range(keywords)
+        ],
+        "spatial": {
+            "bbox": bbox,
+            "centroid": {
+                "pointLongitude": (
+                    bbox["westBoundLongitude"] + bbox["eastBoundLongitude"]
+                )
+                / 2,
+                "pointLatitude": (
+                    bbox["southBoundLatitude"] + bbox["northBoundLatitude"]
+                )
+                / 2,
+            },
+        },
+        "temporal": [
+            {
+                "startDate": _timestamp(rng, datetime(1950, 1, 1), 15000).isoformat(),
+                "endDate": None if rng.random() < 0.2 else created.isoformat(),
+            }
+        ],
+        "relation": [
+            {
+                "dataciteRelationType": rng.choice(
+                    list(DataciteRelationTypeEnum)
+                ).value,
+                "relatedIdentifier": f"10.5066/P{rng.getrandbits(32):08X}",
+                "primaryRelatedIdentifier": rng.random() < 0.5,
+                "relatedIdentifierType": RelatedIdentifierTypeEnum.DOI.value,
+            }
+            for _ in range(relations)
+        ],
+        "alternateIdentifier": [
+            {
+                "identifier": identifier,
+                "identifierType": AlternateIdentifierTypeEnum.LocalIdentifier.value,
+            }
+        ],
+        "usgsPurpose": _words(rng, 30),
+        "usgsMissionArea": {"name": mission, "missionAreaId": mission_id},
+        "qualifiedAttribution": dict(
+            _creator(rng, 1),
+            contributorType=rng.choice(list(ContributorTypeEnum)).value,
+        ),
+        "versionHistory": {
+            "version": "1.0",
+            "issued": issued.isoformat(),
+            "versionNotes": issued.isoformat(),
+        },
+        "status": rng.choice(list(StatusEnum)).value,
+        "usgsReleaseType": rng.choice(list(UsgsReleaseTypeEnum)).value,
+    }
+
+
+def generate_catalog(n: int, seed: int = 0, **sizes) -> Iterator[Dict[str, Any]]:
+    """Generate ``n`` records. ``sizes`` are passed to generate_record."""
+    for index in range(n):
+        yield generate_record(seed, index, **sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic NDJSON catalog.")
+    parser.add_argument("n", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=0)
+    for size in SIZES:
+        parser.add_argument(f"--{size}", type=int)
+    args = parser.parse_args()
+    sizes = {s: getattr(args, s) for s in SIZES if getattr(args, s) is not None}
+    with open(args.output, "w") as f:
+        for record in generate_catalog(args.n, args.seed, **sizes):
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
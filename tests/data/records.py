@@ -0,0 +1,70 @@
+"""Minimal valid records shared by the tests."""
+
+entity = {
+    "entity_id": "usgs",
+    "name": "U.S. Geological Survey",
+    "nameType": "Organizational",
+    "nameIdentifier": "https://ror.org/035a68863",
+    "email": None,
+}
+
+
+def make_record(usgsIdentifier="1234ab", **overrides):
+    """Build a minimal valid DataRelease record as a plain dict."""
+    record = {
+        "title": "test",
+        "usgsAssetType": "Data",
+        "description": "...",
+        "usgsCreated": "2024-01-01T00:00:00",
+        "usgsModified": "2024-01-02T00:00:00",
+        "identifier": "https://doi.org/10.5066/P9TEST",
+        "usgsIdentifier": usgsIdentifier,
+        "accessRights": "Public",
+        "issued": "2024-01-03T00:00:00",
+        "modified": None,
+        "creator": [
+            dict(entity, position=1, affiliation=None, affiliationIdentifier=None)
+        ],
+        "publisher": dict(entity),
+        "usgsCitation": "citation",
+        "contactPoint": dict(entity),
+        "usgsMetadataContactPoint": dict(entity),
+        "license": {
+            "licenseIdentifier": "CC0-1.0",
+            "license": "Creative Commons Zero v1.0 Universal",
+            "licenseUri": None,
+            "licenseIdentifierScheme": "SPDX",
+            "schemeUri": None,
+        },
+        "usgsDataSource": {"name": "Science Center", "dataSourceId": "sc1"},
+        "distribution": [
+            {
+                "title": None,
+                "name": "data.csv",
+                "description": None,
+                "format": None,
+                "mediaType": "text/csv",
+                "downloadURL": "https://example.com/data.csv",
+                "accessURL": None,
+                "byteSize": 10,
+                "checksum": None,
+                "modifiedBy": dict(entity),
+                "modified": "2024-01-01T00:00:00",
+                "useForPreview": False,
+            }
+        ],
+        "component": [],
+        "keyword": None,
+        "spatial": None,
+        "temporal": None,
+        "relation": None,
+        "alternateIdentifier": None,
+        "usgsPurpose": None,
+        "usgsMissionArea": None,
+        "qualifiedAttribution": None,
+        "versionHistory": None,
+        "status": "Published",
+        "usgsReleaseType": "Data Release",
+    }
+    record.update(overrides)
+    return record
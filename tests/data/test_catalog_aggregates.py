@@ -0,0 +1,41 @@
+from collections import Counter
+
+from horizon.CatalogAggregates import MISSING, AggregateSnapshot, CatalogAggregates
+from horizon.Columnar import DatasetColumns
+from horizon.DataRelease import DataRelease, StatusEnum
+from scripts.synthetic_catalog import generate_catalog
+
+
+def test_incremental_updates_match_a_full_scan():
+    releases = [DataRelease(**r) for r in generate_catalog(60, seed=17)]
+    aggregates = CatalogAggregates(releases)
+    assert len(aggregates) == 60
+    assert aggregates.counts("status") == dict(
+        Counter(r.status.value for r in releases)
+    )
+    assert aggregates.totalBytes == int(
+        DatasetColumns.from_records(releases)["totalByteSize"].sum()
+    )
+
+    first = releases[0]
+    aggregates.set_status(first.usgsIdentifier, StatusEnum.published)
+    aggregates.remove(releases[1].usgsIdentifier)
+    changed = first.model_copy(update={"status": StatusEnum.published})
+    aggregates.upsert(releases[2].model_copy(update={"usgsMissionArea": None}))
+    expected = CatalogAggregates(
+        [changed, releases[2].model_copy(update={"usgsMissionArea": None})]
+        + releases[3:]
+    )
+    assert aggregates.snapshot() == expected.snapshot()
+    assert aggregates.count("missionAreaId", None) >= 1
+    assert MISSING in aggregates.counts("missionAreaId")
+
+
+def test_merge_partial_aggregates():
+    records = list(generate_catalog(40, seed=18))
+    full = CatalogAggregates(records).snapshot()
+    left, right = CatalogAggregates(records[:25]), CatalogAggregates(records[20:])
+    assert left.snapshot() + CatalogAggregates(records[25:]).snapshot() == full
+    left.merge(right)
+    assert left.snapshot() == full
+    assert AggregateSnapshot.model_validate_json(full.model_dump_json()) == full
@@ -0,0 +1,75 @@
+import copy
+import pickle
+from datetime import datetime
+
+import pytest
+
+from horizon.CatalogStore import CatalogStore
+from horizon.DataRelease import DataRelease, StatusEnum
+from horizon.Dataset import Dataset
+from scripts.synthetic_catalog import generate_catalog
+
+
+def test_upsert_query_and_paginate(tmp_path):
+    releases = [DataRelease(**record) for record in generate_catalog(50, seed=2)]
+    store = CatalogStore(tmp_path / "catalog.db")
+    assert store.upsert(releases, batch_size=7) == 50
+    assert len(store) == 50
+
+    published = [r for r in releases if r.status == StatusEnum.published]
+    results = list(store.query(status="Published"))
+    assert {r.usgsIdentifier for r in results} == {r.usgsIdentifier for r in published}
+    assert all(r._model is None for r in results)
+    assert results[0].title == results[0].model.title
+    assert store.count(status=StatusEnum.published) == len(published)
+
+    cutoff = datetime(2010, 1, 1)
+    assert store.count(issued_after=cutoff) == sum(r.issued >= cutoff for r in releases)
+
+    seen, cursor = [], None
+    while True:
+        page = store.page(cursor, limit=8)
+        seen.extend(r.usgsIdentifier for r in page)
+        if page.cursor is None:
+            break
+        cursor = page.cursor
+    assert seen == [
+        r.usgsIdentifier
+        for r in sorted(releases, key=lambda r: (r.issued, r.usgsIdentifier))
+    ]
+
+    with pytest.raises(ValueError):
+        store.page(limit=0)
+    with pytest.raises(TypeError, match="Unknown filter 'colour'"):
+        store.query(colour="red")
+
+    changed = releases[0].model_copy(update={"status": StatusEnum.deprecated})
+    store.upsert([changed])
+    assert store.get(changed.usgsIdentifier).model == changed
+    assert store.get(changed.usgsIdentifier).columns["status"] == "Deprecated"
+    assert store.delete(changed.usgsIdentifier)
+    assert changed.usgsIdentifier not in store
+
+
+def test_dataset_records_hydrate_as_datasets(record):
+    del record["status"], record["usgsReleaseType"]
+    with CatalogStore() as store:
+        store.upsert([Dataset(**record)])
+        stored = store.get(record["usgsIdentifier"])
+        assert type(stored.model) is Dataset
+        assert stored.columns["status"] is None
+
+
+def test_stored_records_copy_and_pickle(record):
+    with CatalogStore() as store:
+        store.upsert([DataRelease(**record)])
+        stored = store.get(record["usgsIdentifier"])
+    for clone in (
+        copy.copy(stored),
+        copy.deepcopy(stored),
+        pickle.loads(pickle.dumps(stored)),
+    ):
+        assert clone.columns == stored.columns and clone.document == stored.document
+        assert clone.title == record["title"]
+    with pytest.raises(AttributeError):
+        stored._missing
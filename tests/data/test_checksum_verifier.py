@@ -0,0 +1,98 @@
+import hashlib
+
+from horizon.ChecksumVerifier import (
+    VerificationStatusEnum as Status,
+    get_hasher,
+    verify_dataset,
+)
+from horizon.DataRelease import DataRelease
+from tests.data.records import make_record
+
+
+def distribution(name, content, algorithm="SHA256", byteSize=None, digest=None):
+    record = make_record()["distribution"][0]
+    digest = (
+        digest or hashlib.new(algorithm.lower().replace("-", "_"), content).hexdigest()
+    )
+    return dict(
+        record,
+        name=name,
+        byteSize=len(content) if byteSize is None else byteSize,
+        checksum={"algorithm": algorithm, "checksumValue": digest},
+    )
+
+
+def test_verify_dataset(tmp_path):
+    files = {
+        "a.csv": b"a" * 5000,
+        "b.csv": b"b" * 10,
+        "c.csv": b"c",
+        "d.csv": b"d",
+        "e.csv": b"e",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_bytes(content)
+    record = make_record(
+        distribution=[
+            distribution("a.csv", files["a.csv"]),
+            distribution("b.csv", files["b.csv"], byteSize=3),
+            distribution("c.csv", files["c.csv"], algorithm="SHA-512", digest="00"),
+            distribution("d.csv", files["d.csv"], algorithm="MD2", digest="00"),
+            distribution("missing.csv", b""),
+        ],
+    )
+    record["component"] = [
+        {
+            "identifier": None,
+            "title": "c",
+            "description": "c",
+            "usgsCitation": "c",
+            "catalogRecord": False,
+            "distribution": [
+                distribution("e.csv", files["e.csv"], algorithm="SHA3-256")
+            ],
+            "alternateIdentifier": None,
+        }
+    ]
+
+    report = verify_dataset(DataRelease(**record), tmp_path, workers=2, chunk_size=1024)
+    assert [f.status for f in report.files] == [
+        Status.ok,
+        Status.sizeMismatch,
+        Status.checksumMismatch,
+        Status.unsupportedAlgorithm,
+        Status.missing,
+        Status.ok,
+    ]
+    assert report.counts[Status.ok] == 2
+    assert report.bytesHashed == 5002
+    assert not report.ok
+
+
+def test_get_hasher_accepts_spdx_spellings():
+    assert get_hasher("BLAKE2b-256").digest_size == 32
+    assert get_hasher("sha_256").name == "sha256"
+    assert get_hasher("ADLER32").hexdigest() == "00000001"
+    assert get_hasher("MD6") is None
+
+
+def test_verify_dataset_stays_inside_root(tmp_path):
+    root = tmp_path / "release"
+    (root / "folder.csv").mkdir(parents=True)
+    secret = tmp_path / "secret.csv"
+    secret.write_bytes(b"secret")
+    record = make_record(
+        distribution=[
+            distribution("../secret.csv", b"secret"),
+            distribution(str(secret), b"secret"),
+            dict(distribution("folder.csv", b""), byteSize=None),
+        ],
+    )
+
+    report = verify_dataset(DataRelease(**record), root)
+    assert [f.status for f in report.files] == [
+        Status.outsideRoot,
+        Status.outsideRoot,
+        Status.unreadable,
+    ]
+    assert report.bytesHashed == 0
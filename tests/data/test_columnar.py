@@ -0,0 +1,79 @@
+import numpy as np
+
+from horizon.Columnar import NULL_CODE, DatasetColumns
+from horizon.DataRelease import DataRelease
+
+
+def test_models_and_dicts_project_the_same(make_record):
+    records = [
+        make_record("a", keyword=[{"concept": "water", "conceptUri": None}]),
+        make_record(
+            "b",
+            accessRights="Non Public",
+            usgsMissionArea={"name": "Water", "missionAreaId": "wma"},
+            spatial={
+                "bbox": {
+                    "westBoundLongitude": -109,
+                    "eastBoundLongitude": -102,
+                    "southBoundLatitude": 37,
+                    "northBoundLatitude": 41,
+                },
+                "centroid": None,
+            },
+        ),
+    ]
+    records[1]["distribution"].append(
+        dict(records[1]["distribution"][0], byteSize=None, mediaType="image/tiff")
+    )
+    records[1]["component"] = [
+        {
+            "identifier": None,
+            "title": "c",
+            "description": "c",
+            "usgsCitation": "c",
+            "catalogRecord": False,
+            "distribution": [records[0]["distribution"][0]],
+            "alternateIdentifier": None,
+        }
+    ]
+
+    from_dicts = DatasetColumns.from_records(records)
+    from_models = DatasetColumns.from_records(DataRelease(**r) for r in records)
+
+    for columns in (from_dicts, from_models):
+        assert len(columns) == 2
+        assert columns.identifiers() == ["a", "b"]
+        assert columns.decode("accessRights") == ["Public", "Non Public"]
+        assert columns["accessRights"].tolist() == [0, 1]
+        assert columns.decode("usgsMissionArea.missionAreaId") == [None, "wma"]
+        assert columns["totalByteSize"].tolist() == [10, 20]
+        assert columns["distribution.offsets"].tolist() == [0, 1, 3]
+        assert columns.decode("distribution.mediaType") == [
+            "text/csv",
+            "text/csv",
+            "image/tiff",
+        ]
+        assert columns["keyword.offsets"].tolist() == [0, 1, 1]
+        assert np.isnan(columns["spatial.bbox.westBoundLongitude"][0])
+        assert columns["spatial.bbox.westBoundLongitude"][1] == -109
+        assert columns.timestamps("issued")[0] == np.datetime64("2024-01-03T00:00:00")
+        assert np.isnat(columns.timestamps("modified")).all()
+    assert from_models["status"][0] != NULL_CODE
+    for name in from_dicts.arrays:
+        assert np.array_equal(
+            from_dicts[name],
+            from_models[name],
+            equal_nan=from_dicts[name].dtype.kind == "f",
+        )
+
+
+def test_dict_defaults_and_unix_timestamps(make_record):
+    record = make_record("a", usgsModified=1704240000)
+    del record["status"]
+    from_dicts = DatasetColumns.from_records([record])
+    from_models = DatasetColumns.from_records([DataRelease(**record)])
+    for columns in (from_dicts, from_models):
+        assert columns.decode("status") == ["Created"]
+        assert columns.timestamps("usgsModified")[0] == np.datetime64(
+            "2024-01-03T00:00:00"
+        )
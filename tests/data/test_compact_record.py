@@ -0,0 +1,93 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from horizon.CompactRecord import (
+    CompactCatalog,
+    ValuePool,
+    compact_class,
+    memory_report,
+    to_compact,
+)
+from horizon.DataRelease import DataRelease
+from horizon.Dataset import PeriodOfTime
+from scripts.synthetic_catalog import generate_catalog
+
+
+@pytest.fixture(scope="module")
+def releases():
+    return [DataRelease(**record) for record in generate_catalog(20, seed=25)]
+
+
+def test_round_trip_is_lossless(releases, record):
+    # status is left unset and takes its default.
+    record = DataRelease(**{k: v for k, v in record.items() if k != "status"})
+    assert "status" not in record.model_fields_set
+    catalog = CompactCatalog(releases + [record])
+    assert list(catalog.models()) == releases + [record]
+    restored = catalog.model(len(releases))
+    assert restored.model_dump(exclude_unset=True) == record.model_dump(
+        exclude_unset=True
+    )
+
+
+def test_compact_records_are_frozen_slots(releases):
+    compact = to_compact(releases[0])
+    assert type(compact) is compact_class(DataRelease)
+    assert not hasattr(compact, "__dict__")
+    assert compact.title == releases[0].title
+    assert compact.status is releases[0].status
+    assert isinstance(compact.distribution, tuple)
+    assert compact.distribution[0].byteSize == releases[0].distribution[0].byteSize
+    assert compact.identifier == str(releases[0].identifier)
+    with pytest.raises(AttributeError):
+        compact.title = "changed"
+    assert pickle.loads(pickle.dumps(compact)) == compact
+    assert hash(to_compact(releases[0])) == hash(compact)
+
+
+def test_values_are_shared_through_the_pool(releases):
+    catalog = CompactCatalog(releases)
+    assert catalog[0].publisher is catalog[1].publisher
+    assert catalog[0].license is catalog[1].license
+
+
+def test_nested_values_keep_their_offsets(record):
+    utc = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    shifted = utc.astimezone(timezone(timedelta(hours=-7)))
+    releases = [
+        DataRelease(**dict(record, temporal=[{"startDate": when, "endDate": None}]))
+        for when in (utc, shifted, utc)
+    ]
+    catalog = CompactCatalog(releases)
+    assert catalog[0].temporal[0] is catalog[2].temporal[0]
+    assert catalog[1].temporal[0] is not catalog[0].temporal[0]
+    offsets = [m.temporal[0].startDate.utcoffset() for m in catalog.models()]
+    assert offsets == [timedelta(0), timedelta(hours=-7), timedelta(0)]
+    assert [m.model_dump_json() for m in catalog.models()] == [
+        m.model_dump_json() for m in releases
+    ]
+
+    pool = ValuePool()
+    periods = [
+        to_compact(PeriodOfTime(startDate=when, endDate=None), pool)
+        for when in (utc, shifted)
+    ]
+    assert periods[1].to_model().startDate.tzinfo == shifted.tzinfo
+
+    # A str enum member equals its value but must not be swapped for it.
+    first = DataRelease(**record)
+    creator = first.creator[0]
+    plain = creator.model_copy(update={"nameType": creator.nameType.value})
+    second = first.model_copy(update={"creator": [plain]})
+    catalog = CompactCatalog([first, second])
+    assert type(catalog.model(0).creator[0].nameType) is type(creator.nameType)
+    assert type(catalog.model(1).creator[0].nameType) is str
+
+
+def test_memory_report(releases):
+    report = memory_report(releases)
+    assert report.records == 20
+    assert report.compactBytes < report.modelBytes / 2
+    assert report.compactBytesPerRecord == round(report.compactBytes / 20, 1)
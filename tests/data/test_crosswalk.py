@@ -0,0 +1,90 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+
+from horizon import Crosswalk
+from horizon.Crosswalk import Each, Fn, Obj, Path, compile_mapping, export, plan
+from horizon.Crosswalk import write_datacite, write_dcat_us
+from horizon.DataRelease import DataRelease
+from horizon.LazyDistribution import LazyDataRelease
+from scripts.synthetic_catalog import generate_catalog, generate_record
+
+
+def test_compile_mapping():
+    transform = compile_mapping(
+        {
+            "name": Path("title"),
+            "kind": "constant",
+            "tags": Each("keyword", Path("concept")),
+            "count": Fn(len, Path("keyword")),
+            "box": Obj({"west": Path("spatial.bbox.west")}, required=("west",)),
+        }
+    )
+    record = {"title": "T", "keyword": [{"concept": "a"}, {"concept": "b"}]}
+    assert transform(record) == {
+        "name": "T",
+        "kind": "constant",
+        "tags": ["a", "b"],
+        "count": 2,
+    }
+
+
+def test_models_and_raw_dicts_export_identically():
+    records = list(generate_catalog(5, seed=19))
+    models = [DataRelease(**r) for r in records]
+    raw = [json.loads(m.model_dump_json()) for m in models]
+    for target in ("datacite", "dcat-us"):
+        assert list(export(models, target)) == list(export(raw, target))
+    assert plan("datacite") is plan("datacite")
+
+    datacite = plan("datacite")(models[0])
+    assert datacite["titles"] == [{"title": models[0].title}]
+    assert datacite["doi"] == str(models[0].identifier).split("doi.org/")[1]
+    assert datacite["publicationYear"] == str(models[0].issued.year)
+    assert {d["dateType"] for d in datacite["dates"]} >= {"Issued", "Created"}
+    relation = models[0].relation[0]
+    assert datacite["relatedIdentifiers"][0]["relationType"] == (
+        relation.dataciteRelationType.value.replace(" ", "")
+    )
+
+    f = io.BytesIO()
+    assert write_datacite(models, f) == 5
+    lines = f.getvalue().splitlines()
+    assert json.loads(lines[0])["data"]["attributes"] == datacite
+
+    f = io.BytesIO()
+    assert write_dcat_us(raw, f) == 5
+    catalog = json.loads(f.getvalue())
+    assert catalog["@type"] == "dcat:Catalog" and len(catalog["dataset"]) == 5
+    dataset = catalog["dataset"][0]
+    assert dataset["accessLevel"] in ("public", "non-public")
+    assert len(dataset["distribution"]) == len(models[0].distribution)
+
+
+def test_aware_datetimes_and_lazy_lists_export_identically():
+    record = generate_record(19, 7, distributions=3)
+    record["issued"] = "2024-05-01T12:00:00Z"
+    record["temporal"] = [{"startDate": "2020-01-01T00:00:00-07:00", "endDate": None}]
+    record["publisher"]["nameType"] = "Service"
+    model = DataRelease(**record)
+    lazy = LazyDataRelease.model_validate_json(json.dumps(record))
+    for target in ("datacite", "dcat-us"):
+        # Model datetimes are formatted without being parsed again.
+        with mock.patch.object(Crosswalk, "_DATETIME", None):
+            expected = plan(target)(model)
+        assert plan(target)(record) == expected
+        assert plan(target)(lazy) == expected
+
+    dcat = plan("dcat-us")(lazy)
+    assert dcat["issued"] == "2024-05-01T12:00:00+00:00"
+    assert dcat["temporal"] == "2020-01-01T00:00:00-07:00/.."
+    assert [d["title"] for d in dcat["distribution"]] == [
+        d["title"] for d in record["distribution"]
+    ]
+    service = plan("datacite")({"creator": [record["publisher"]]})["creators"][0]
+    assert service["nameType"] == "Organizational"
+
+    with pytest.raises(TypeError):
+        compile_mapping({"value": Path("value")})({"value": object()})
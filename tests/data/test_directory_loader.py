@@ -0,0 +1,84 @@
+import asyncio
+import json
+from unittest import mock
+
+from horizon.DataRelease import DataRelease
+from horizon.Dataset import Dataset
+from horizon.CatalogedResource import CatalogedResource
+from horizon.DirectoryLoader import (
+    FileError,
+    aload_directory,
+    detect_model,
+    load_directory,
+    load_file,
+)
+from scripts.synthetic_catalog import generate_catalog, generate_record
+
+
+def write_tree(root):
+    for i, record in enumerate(generate_catalog(20, seed=4)):
+        if i % 5 == 0:
+            record.pop("status", None)
+            record.pop("usgsReleaseType", None)
+        directory = root / f"group{i % 3}"
+        directory.mkdir(exist_ok=True)
+        (directory / f"{record['usgsIdentifier']}.json").write_text(json.dumps(record))
+    (root / "broken.json").write_text('{"title": "no identifier"}')
+    (root / "notes.txt").write_text("ignored")
+
+
+def test_load_directory(tmp_path):
+    write_tree(tmp_path)
+    calls = []
+    results = list(
+        load_directory(tmp_path, concurrency=4, progress=lambda *a: calls.append(a))
+    )
+    assert len(results) == 21
+    assert [path for path, _ in results] == sorted(path for path, _ in results)
+    assert calls[-1] == (21, 21)
+
+    errors = [r for _, r in results if isinstance(r, FileError)]
+    assert len(errors) == 1 and errors[0].path.endswith("broken.json")
+    kinds = [type(r) for _, r in results if not isinstance(r, FileError)]
+    assert kinds.count(Dataset) == 4 and kinds.count(DataRelease) == 16
+
+    forced = list(load_directory(tmp_path / "group0", model=Dataset))
+    assert all(type(r) is Dataset for _, r in forced)
+
+
+def test_detect_model_reads_top_level_keys():
+    record = generate_record(4, 0)
+    assert detect_model(None, json.dumps(record).encode()) is DataRelease
+    del record["status"], record["usgsReleaseType"]
+    record["keyword"][0]["concept"] = "status"
+    record["usgsPurpose"] = 'Mentions "usgsReleaseType"'
+    assert detect_model(None, json.dumps(record).encode()) is Dataset
+    assert detect_model(None, b'[{"status": 1}]') is CatalogedResource
+    assert detect_model(None, b"not json") is CatalogedResource
+
+
+def test_detected_documents_are_parsed_once(tmp_path):
+    path = tmp_path / "record.json"
+    path.write_text(json.dumps(generate_record(4, 1)))
+    with mock.patch.object(
+        DataRelease, "model_validate_json", side_effect=AssertionError
+    ):
+        assert type(load_file(path)) is DataRelease
+    (tmp_path / "broken.json").write_text("{not json")
+    assert load_file(tmp_path / "broken.json").errors[0]["type"] == "json_invalid"
+
+
+def test_aload_directory(tmp_path):
+    write_tree(tmp_path)
+
+    async def collect(ordered):
+        return [
+            path
+            async for path, _ in aload_directory(
+                tmp_path, concurrency=3, ordered=ordered
+            )
+        ]
+
+    ordered = asyncio.run(collect(True))
+    assert ordered == sorted(ordered) and len(ordered) == 21
+    assert sorted(asyncio.run(collect(False))) == ordered
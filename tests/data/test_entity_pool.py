@@ -0,0 +1,66 @@
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from horizon.DataRelease import DataRelease
+from horizon.Entity import Creator, Entity
+from horizon.EntityPool import EntityPool
+from horizon.StreamingValidator import validate_ndjson
+
+
+def test_intern_dataset_shares_entities(make_record):
+    pool = EntityPool()
+    first = pool.intern_dataset(DataRelease(**make_record("a")))
+    second = pool.intern_dataset(DataRelease(**make_record("b")))
+
+    assert first.publisher is second.publisher is second.contactPoint
+    assert first.distribution[0].modifiedBy is second.publisher
+    assert first.creator[0] is second.creator[0]
+    assert isinstance(first.creator[0], Creator)
+    assert isinstance(first.publisher, Entity)
+    # Interning changes neither equality nor dumps.
+    plain = DataRelease(**make_record("a"))
+    assert first == plain and plain == first
+    assert first.model_dump_json() == plain.model_dump_json()
+
+    stats = pool.stats()
+    assert stats.uniqueEntities == 2
+    assert stats.misses == 2 and stats.hits == 8
+    assert stats.bytesSaved > 0
+
+
+def test_interned_entities_are_read_only(make_record):
+    pool = EntityPool()
+    first = pool.intern_dataset(DataRelease(**make_record("a")))
+    second = pool.intern_dataset(DataRelease(**make_record("b")))
+    with pytest.raises(ValidationError):
+        first.publisher.name = "changed"
+    with pytest.raises(ValidationError):
+        first.creator[0].name = "changed"
+    assert second.publisher.name == make_record()["publisher"]["name"]
+
+    first.publisher = first.publisher.model_copy(update={"name": "changed"})
+    assert second.publisher.name != "changed"
+    assert pickle.loads(pickle.dumps(second)) == second
+
+
+def test_intern_keeps_distinct_content_apart(make_record):
+    pool = EntityPool()
+    record = make_record()
+    record["contactPoint"]["email"] = "contact@usgs.gov"
+    dataset = pool.intern_dataset(DataRelease(**record))
+
+    assert dataset.contactPoint is not dataset.publisher
+    assert dataset.contactPoint.email == "contact@usgs.gov"
+    assert dataset.model_dump() == DataRelease(**record).model_dump()
+
+
+def test_validate_ndjson_with_pool(tmp_path, make_record):
+    path = tmp_path / "catalog.ndjson"
+    path.write_text("\n".join(json.dumps(make_record(str(i))) for i in range(3)))
+    pool = EntityPool()
+    results = list(validate_ndjson(path, pool=pool))
+    assert results[0].publisher is results[2].publisher
+    assert len(pool) == 2
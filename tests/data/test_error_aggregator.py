@@ -0,0 +1,62 @@
+import json
+
+from horizon.ErrorAggregator import ErrorAggregator, validate_bulk
+from scripts.synthetic_catalog import generate_catalog
+
+
+def write_feed(path, n=200):
+    with open(path, "w") as f:
+        for i, record in enumerate(generate_catalog(n, seed=14, distributions=3)):
+            if i % 10 == 0:
+                record["distribution"][1]["downloadURL"] = "not a url"
+                record["distribution"][2]["downloadURL"] = "also not a url"
+            if i % 25 == 0:
+                del record["title"]
+            f.write(json.dumps(record) + "\n")
+
+
+def test_errors_are_grouped(tmp_path):
+    path = tmp_path / "feed.ndjson"
+    write_feed(path)
+    result = validate_bulk(path, batch_size=32, samples=3)
+
+    assert (result.total, result.checked, result.invalid) == (200, 200, 24)
+    assert result.valid == 176 and not result.ok and result.errorRate == 0.12
+    url, title = result.groups
+    assert (url.path, url.type, url.count) == (
+        "distribution.*.downloadURL",
+        "url_parsing",
+        40,
+    )
+    assert url.sampleLines == [1, 11, 21] and len(url.sampleIdentifiers) == 3
+    assert (title.path, title.type, title.count) == ("title", "missing", 8)
+    assert "distribution.*.downloadURL" in result.summary()
+
+
+def test_fail_fast_and_sampling(tmp_path):
+    path = tmp_path / "feed.ndjson"
+    write_feed(path)
+
+    stopped = validate_bulk(path, batch_size=50, max_errors=3)
+    assert stopped.stopped and stopped.invalid == 3 and stopped.checked == 21
+
+    sampled = validate_bulk(path, sample=0.25, seed=1)
+    assert sampled.sampled and sampled.total == 200
+    assert 20 < sampled.checked < 80
+    assert sampled == validate_bulk(path, sample=0.25, seed=1)
+
+    capped = validate_bulk(path, sample=0.25, seed=1, max_checked=10, batch_size=4)
+    assert capped.stopped and capped.checked == 10 and capped.total < 80
+    first = validate_bulk(path, batch_size=8, max_checked=12)
+    assert (first.total, first.checked, first.invalid) == (12, 12, 2)
+
+
+def test_samples_are_capped_without_line_numbers(record):
+    aggregator = ErrorAggregator(samples=2)
+    line = json.dumps(record).encode()
+    errors = [{"loc": ("title",), "type": "missing", "msg": "Field required"}]
+    for _ in range(5):
+        aggregator.add(errors + errors, line=line)
+    (group,) = aggregator.groups()
+    assert group.count == 10 and group.sampleLines == []
+    assert group.sampleIdentifiers == [record["usgsIdentifier"]] * 2
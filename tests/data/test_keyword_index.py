@@ -0,0 +1,46 @@
+from horizon.DataRelease import DataRelease
+from horizon.KeywordIndex import KeywordIndex
+from tests.data.records import make_record
+
+
+def dataset(usgsIdentifier, *keywords):
+    keyword = [
+        {"concept": concept, "conceptScheme": scheme, "conceptUri": uri}
+        for concept, scheme, uri in keywords
+    ]
+    return DataRelease(**make_record(usgsIdentifier, keyword=keyword))
+
+
+def test_keyword_queries_and_facets():
+    water = (
+        "Water",
+        "USGS Thesaurus",
+        "https://apps.usgs.gov/thesaurus/term.php?thcode=2&code=1",
+    )
+    index = KeywordIndex(
+        [
+            dataset(
+                "a",
+                water,
+                ("Geology", "USGS Thesaurus", None),
+                ("water ", "USGS Thesaurus", None),
+            ),
+            dataset(
+                "b", ("water", "USGS Thesaurus", None), ("Colorado", "Place", None)
+            ),
+            dataset("c", ("Geology", "USGS Thesaurus", None)),
+            DataRelease(**make_record("d")),
+        ]
+    )
+
+    assert index.postings("WATER").tolist() == [0, 1]
+    assert index.identifiers(index.uri_postings(water[2])) == ["a"]
+    assert index.all_of("water", "geology").tolist() == [0]
+    assert index.any_of("colorado", "geology").tolist() == [0, 1, 2]
+    assert index.exclude(index.all_of(), "water").tolist() == [2, 3]
+    assert index.facet_counts("USGS Thesaurus") == {"Water": 2, "Geology": 2}
+    assert index.facet_counts("Place") == {"Colorado": 1}
+    assert index.facet_counts("USGS Thesaurus", within=index.postings("geology")) == {
+        "Geology": 2,
+        "Water": 1,
+    }
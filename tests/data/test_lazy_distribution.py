@@ -0,0 +1,75 @@
+import json
+from collections import Counter
+
+import pytest
+from pydantic import ValidationError
+
+from horizon.DataRelease import DataRelease
+from horizon.Distribution import Distribution
+from horizon.LazyDistribution import LazyDataRelease, LazyDistributionList
+from horizon.RecordPatch import apply_patch
+from scripts.synthetic_catalog import generate_record
+
+
+def test_lazy_data_release_validates_on_access():
+    record = generate_record(11, 0, distributions=30)
+    document = json.dumps(record)
+    full = DataRelease.model_validate_json(document)
+    lazy = LazyDataRelease.model_validate_json(document)
+
+    distributions = lazy.distribution
+    assert isinstance(distributions, LazyDistributionList)
+    assert len(distributions) == 30 and distributions.validated == 0
+    assert distributions.total_byte_size() == sum(
+        d.byteSize or 0 for d in full.distribution
+    )
+    assert distributions.media_types() == Counter(
+        d.mediaType for d in full.distribution
+    )
+    assert distributions.validated == 0
+    assert distributions.count() == 30
+
+    assert distributions[-1] == full.distribution[-1]
+    assert distributions.page(1, size=10) == full.distribution[10:20]
+    assert distributions.validated == 11
+    assert distributions.count(None) == 0
+    assert distributions.count(full.distribution[0]) == 1
+    assert isinstance(lazy.component[0].distribution[0], Distribution)
+    assert lazy.model_dump(mode="json") == full.model_dump(mode="json")
+
+
+def test_lazy_list_pages_and_invalid_items():
+    items = generate_record(11, 1, distributions=5)["distribution"]
+    items[3]["downloadURL"] = "not a url"
+    distributions = LazyDistributionList(items)
+    assert distributions[0].mediaType == items[0]["mediaType"]
+    pages = distributions.pages(size=2)
+    assert len(next(pages)) == 2
+    with pytest.raises(ValidationError):
+        next(pages)
+
+
+def test_aggregates_coerce_raw_values():
+    items = generate_record(11, 2, distributions=3)["distribution"]
+    items[0]["byteSize"], items[1]["byteSize"] = "10", None
+    distributions = LazyDistributionList(items)
+    assert distributions.total_byte_size() == 10 + (items[2]["byteSize"] or 0)
+    items[1]["byteSize"] = "ten"
+    with pytest.raises(ValidationError):
+        distributions.total_byte_size()
+    assert distributions.validated == 0
+
+
+def test_lazy_lists_can_be_patched():
+    lazy = LazyDataRelease(**generate_record(11, 3, distributions=4))
+    patched, _ = apply_patch(
+        lazy,
+        [
+            {"op": "replace", "path": "/distribution/1/byteSize", "value": 7},
+            {"op": "remove", "path": "/distribution/3"},
+        ],
+    )
+    assert isinstance(patched.distribution, LazyDistributionList)
+    assert len(patched.distribution) == 3
+    assert patched.distribution[1].byteSize == 7
+    assert lazy.distribution[1].byteSize != 7 and len(lazy.distribution) == 4
@@ -0,0 +1,187 @@
+import json
+
+import pytest
+
+from horizon.DataRelease import DataRelease
+from horizon.Migration import (
+    VERSION_KEY,
+    Chain,
+    DropField,
+    MapField,
+    MigrationRegistry,
+    RenameField,
+    SetDefault,
+    migrate_directory,
+    migrate_document,
+    migrate_ndjson,
+)
+from scripts.synthetic_catalog import generate_catalog
+
+registry = MigrationRegistry()
+registry.add(
+    1,
+    DropField("relation.*.primaryRelatedIdentifier"),
+    "primaryRelatedIdentifier removed",
+)
+
+
+@registry.register(2, "versionNotes become free text")
+def version_notes_as_text(record):
+    history = record.get("versionHistory")
+    if history and history.get("versionNotes"):
+        history["versionNotes"] = f"Released {history['versionNotes']}"
+    return record
+
+
+registry.add(
+    3,
+    Chain(
+        SetDefault("temporal.*.uncertain", False),
+        RenameField("usgsPurpose", "purpose"),
+    ),
+)
+
+
+class Crash(BaseException):
+    """Not an Exception, so it stops the migration instead of failing one record."""
+
+
+class Interrupt:
+    """Stands in for a crash partway through a migration."""
+
+    def __init__(self, usgsIdentifier):
+        self.usgsIdentifier = usgsIdentifier
+
+    def __call__(self, record):
+        if record["usgsIdentifier"] == self.usgsIdentifier:
+            raise Crash()
+        return record
+
+
+@pytest.fixture(scope="module")
+def records():
+    return list(generate_catalog(25, seed=24))
+
+
+def write_ndjson(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+
+def read_ndjson(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_registry_composes_versions(records):
+    record = json.loads(json.dumps(records[0]))
+    migrated, applied = registry.migrate(record)
+    assert applied == [1, 2, 3] and migrated[VERSION_KEY] == 3
+    assert all("primaryRelatedIdentifier" not in r for r in migrated["relation"])
+    assert migrated["versionHistory"]["versionNotes"].startswith("Released ")
+    assert all(period["uncertain"] is False for period in migrated["temporal"])
+    assert "purpose" in migrated and "usgsPurpose" not in migrated
+    assert registry.migrate(migrated) == (migrated, [])
+
+    partial, applied = registry.migrate(json.loads(json.dumps(records[0])), target=1)
+    assert applied == [1] and "usgsPurpose" in partial
+
+    with pytest.raises(ValueError):
+        registry.add(5, DropField("title"))
+    with pytest.raises(ValueError):
+        registry.add(3, DropField("title"))
+
+
+def test_document_outcomes():
+    unchanged = MigrationRegistry()
+    unchanged.add(1, MapField("title", str.strip))
+    assert migrate_document(b'{"title": "x"}', unchanged)[1:] == (0, "migrated")
+    assert migrate_document(b'{"title": " x "}', unchanged)[1:] == (0, "changed")
+    document = b'{"title": "x", "schemaVersion": 1}'
+    assert migrate_document(document, unchanged) == (document, 1, "current")
+    # A migrated record that no longer validates is left unchanged.
+    document = b'{"title": 1}'
+    assert migrate_document(document, unchanged, model=DataRelease) == (
+        document,
+        0,
+        "failed",
+    )
+    # So is anything that is not a JSON object, or whose transform raises.
+    for document in (b"{not json", b"[1, 2]", b'{"title": null}'):
+        assert migrate_document(document, unchanged) == (document, 0, "failed")
+    broken = MigrationRegistry()
+    broken.add(1, MapField("title", lambda title: 1 / 0))
+    assert migrate_document(b'{"title": "x"}', broken)[2] == "failed"
+
+
+def test_dry_run_reports_without_writing(tmp_path, records):
+    source = tmp_path / "catalog.ndjson"
+    stamped = dict(records[0], **{VERSION_KEY: 3})
+    write_ndjson(source, [stamped] + records[1:])
+    report = migrate_ndjson(source, None, registry, dry_run=True, batch_size=4)
+    assert report.dryRun and report.total == 25
+    assert report.current == 1 and report.migrated == report.changed == 24
+    assert report.versions == {"0": 24, "3": 1}
+    assert list(tmp_path.iterdir()) == [source]
+
+
+def test_ndjson_migration(tmp_path, records):
+    source, destination = tmp_path / "old.ndjson", tmp_path / "new.ndjson"
+    write_ndjson(source, records)
+    # The current model still requires primaryRelatedIdentifier.
+    report = migrate_ndjson(source, destination, registry, model=DataRelease)
+    assert report.failed == 25 and report.failures[:2] == ["1", "2"]
+    assert read_ndjson(destination) == records
+
+    report = migrate_ndjson(source, destination, registry, batch_size=6, workers=2)
+    assert report.migrated == 25 and report.failed == 0
+    migrated = read_ndjson(destination)
+    assert [r["usgsIdentifier"] for r in migrated] == [
+        r["usgsIdentifier"] for r in records
+    ]
+    assert all(r[VERSION_KEY] == 3 for r in migrated)
+    assert not (tmp_path / "new.ndjson.checkpoint").exists()
+
+
+def test_ndjson_migration_reports_bad_lines(tmp_path, records):
+    source, destination = tmp_path / "old.ndjson", tmp_path / "new.ndjson"
+    write_ndjson(source, records[:3])
+    with source.open("a") as f:
+        f.write("{truncated\n")
+    report = migrate_ndjson(source, destination, registry)
+    assert report.migrated == 3 and report.failed == 1 and report.failures == ["4"]
+    assert destination.read_text().splitlines()[-1] == "{truncated"
+
+    with pytest.raises(ValueError):
+        migrate_ndjson(source, tmp_path / "." / "old.ndjson", registry)
+    assert source.read_text().count("\n") == 4
+
+
+def test_ndjson_migration_resumes(tmp_path, records):
+    source, destination = tmp_path / "old.ndjson", tmp_path / "new.ndjson"
+    write_ndjson(source, records)
+    crashing = MigrationRegistry()
+    crashing.add(1, Interrupt(records[13]["usgsIdentifier"]))
+    with pytest.raises(Crash):
+        migrate_ndjson(source, destination, crashing, batch_size=5)
+    checkpoint = json.loads((tmp_path / "new.ndjson.checkpoint").read_text())
+    assert checkpoint["lines"] == 10
+
+    resumable = MigrationRegistry()
+    resumable.add(1, Interrupt(records[3]["usgsIdentifier"]))
+    report = migrate_ndjson(source, destination, resumable, batch_size=5)
+    assert report.total == report.migrated == 25
+    assert [r["usgsIdentifier"] for r in read_ndjson(destination)] == [
+        r["usgsIdentifier"] for r in records
+    ]
+
+
+def test_directory_migration_in_place(tmp_path, records):
+    for i, record in enumerate(records[:8]):
+        (tmp_path / f"{i}.json").write_text(json.dumps(record))
+    report = migrate_directory(tmp_path, registry, dry_run=True)
+    assert report.migrated == 8
+    assert VERSION_KEY not in json.loads((tmp_path / "0.json").read_text())
+
+    report = migrate_directory(tmp_path, registry, batch_size=3, workers=2)
+    assert report.migrated == 8
+    assert json.loads((tmp_path / "0.json").read_text())[VERSION_KEY] == 3
+    assert migrate_directory(tmp_path, registry).current == 8
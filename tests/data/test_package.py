@@ -0,0 +1,47 @@
+import importlib
+import subprocess
+import sys
+from unittest import mock
+
+from pydantic import BaseModel
+
+import horizon
+from horizon.DataRelease import DataRelease
+from horizon.Dataset import Dataset
+from horizon.Entity import Creator, Entity, NameTypeEnum
+
+
+def test_facade_exposes_model_classes():
+    from horizon import DataRelease as imported
+
+    assert issubclass(horizon.DataRelease, BaseModel)
+    assert imported is horizon.DataRelease is DataRelease
+    assert horizon.Dataset is Dataset and horizon.Entity is Entity
+    assert horizon.Creator is Creator
+    assert horizon.NameTypeEnum is NameTypeEnum
+    assert set(horizon.__all__) <= set(dir(horizon))
+    for name in horizon.__all__:
+        assert isinstance(getattr(horizon, name), type)
+
+
+def test_submodules_stay_importable():
+    module = importlib.import_module("horizon.Entity")
+    assert module is sys.modules["horizon.Entity"]
+    assert module.NameTypeEnum is NameTypeEnum
+    with mock.patch("horizon.Entity.Entity") as patched:
+        assert module.Entity is patched
+
+
+def test_import_does_not_load_models():
+    code = "import sys, horizon; print(sorted(m for m in sys.modules if m.startswith('horizon.')))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.strip() == "[]"
+
+    # A submodule imported first (as the models import each other) still
+    # leaves the class on the package.
+    code = (
+        "import horizon.Dataset, horizon; "
+        "print(horizon.Dataset.__name__, horizon.CatalogedResource.__module__)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.strip() == "Dataset horizon.CatalogedResource"
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from horizon.DataRelease import DataRelease
+from horizon.Projection import LISTING_FIELDS, project, projection
+from scripts.synthetic_catalog import generate_record
+
+
+def test_projection_validates_only_requested_fields():
+    record = generate_record(9, 0)
+    document = json.dumps(record)
+    view = project(document)
+    assert set(type(view).model_fields) == set(LISTING_FIELDS)
+    full = DataRelease.model_validate_json(document)
+    assert view.title == full.title and view.issued == full.issued
+    assert view.status == full.status and view.identifier == full.identifier
+    assert view.upgrade() == full
+    with pytest.raises(ValidationError):
+        view.title = "changed"
+
+    # Unrequested fields are not validated.
+    record["distribution"] = "not a list"
+    assert project(json.dumps(record)).title == full.title
+    with pytest.raises(ValidationError):
+        project(json.dumps(dict(record, issued="yesterday")))
+
+
+def test_nested_projection():
+    view = projection(["title", "creator.name", "spatial.bbox"])
+    assert view is projection(["spatial.bbox", "creator.name", "title"])
+    record = generate_record(9, 1)
+    projected = view.from_json(json.dumps(record))
+    assert [c.name for c in projected.creator] == [c["name"] for c in record["creator"]]
+    assert set(type(projected.creator[0]).model_fields) == {"name"}
+    with pytest.raises(ValueError):
+        projection(["title.name"])
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from unittest import mock
+
+import pytest
+from pydantic import create_model
+
+from horizon.DataRelease import DataRelease, StatusEnum
+from horizon.Dataset import Dataset
+from horizon.RecordArchive import RecordArchive, RecordArchiveWriter, write_archive
+from scripts.synthetic_catalog import generate_catalog
+
+
+def test_archive_round_trip_and_random_access(tmp_path):
+    releases = [DataRelease(**record) for record in generate_catalog(20, seed=1)]
+    releases[3].modified = datetime(
+        2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=-7))
+    )
+    releases[4].identifier = None
+    path = tmp_path / "catalog.hznr"
+    assert write_archive(path, releases) == 20
+
+    with RecordArchive(path) as archive:
+        assert len(archive) == 20
+        assert list(archive) == releases
+        assert archive.get(releases[3].usgsIdentifier) == releases[3]
+        assert archive.get_by_identifier(releases[7].identifier) == releases[7]
+        assert releases[4].usgsIdentifier in archive
+        with pytest.raises(KeyError):
+            archive.get("missing")
+
+        fields = archive.read_fields(
+            ["status", "modified", "spatial", "identifier"],
+            usgsIdentifier=releases[3].usgsIdentifier,
+        )
+        assert fields["status"] == releases[3].status
+        assert isinstance(fields["status"], StatusEnum)
+        assert fields["modified"] == releases[3].modified
+        assert fields["modified"].utcoffset() == timedelta(hours=-7)
+        assert fields["spatial"] == releases[3].spatial
+        assert archive.read_fields(
+            ["identifier"], usgsIdentifier=releases[4].usgsIdentifier
+        ) == {"identifier": None}
+
+
+def test_archive_checks_model_and_enum_size(tmp_path):
+    path = tmp_path / "catalog.hznr"
+    write_archive(path, [DataRelease(**r) for r in generate_catalog(2, seed=2)])
+    with pytest.raises(ValueError, match="holds DataRelease records, not Dataset"):
+        RecordArchive(path, model=Dataset)
+
+    Large = Enum("Large", {f"v{i}": str(i) for i in range(257)})
+    model = create_model("Tagged", tag=(Large, ...))
+    with pytest.raises(ValueError, match="257 members"):
+        RecordArchiveWriter(tmp_path / "tagged.hznr", model)
+
+
+def test_archive_rejects_damaged_files(tmp_path):
+    path = tmp_path / "catalog.hznr"
+    write_archive(path, [DataRelease(**r) for r in generate_catalog(2, seed=3)])
+    data = path.read_bytes()
+    for name, content, message in [
+        ("empty.hznr", b"", "not a horizon record archive"),
+        ("short.hznr", data[:10], "not a horizon record archive"),
+        ("magic.hznr", b"XXXX" + data[4:], "not a horizon record archive"),
+        ("truncated.hznr", data[:200] + data[-12:], "truncated"),
+    ]:
+        (tmp_path / name).write_bytes(content)
+        with mock.patch.object(
+            RecordArchive, "close", autospec=True, side_effect=RecordArchive.close
+        ) as close:
+            with pytest.raises(ValueError, match=message):
+                RecordArchive(tmp_path / name)
+        close.assert_called_once()
@@ -0,0 +1,69 @@
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from horizon.DataRelease import DataRelease, StatusEnum
+from horizon.RecordPatch import apply_patch, diff
+from scripts.synthetic_catalog import generate_record
+
+
+def test_diff_and_apply_patch():
+    old = DataRelease(**generate_record(8, 0, distributions=20, components=1))
+    edited = copy.deepcopy(old.model_dump(mode="json"))
+    edited["status"] = "Published"
+    edited["distribution"].insert(5, dict(edited["distribution"][0], title="new"))
+    edited["keyword"][0]["concept"] = "fixed"
+    edited["component"][0]["distribution"].pop()
+
+    operations = diff(old, edited)
+    assert [(o.op.value, o.path) for o in operations] == [
+        ("add", "/distribution/5"),
+        ("remove", "/component/0/distribution/19"),
+        ("replace", "/keyword/0/concept"),
+        ("replace", "/status"),
+    ]
+
+    new, summary = apply_patch(old, operations)
+    assert new.model_dump(mode="json") == edited
+    assert new.status == StatusEnum.published
+    assert new.creator is old.creator and new.distribution[6] is old.distribution[5]
+    assert old.keyword[0].concept != "fixed"
+    assert (summary.added, summary.removed, summary.replaced) == (1, 1, 2)
+    assert summary.fields == ["component", "distribution", "keyword", "status"]
+    assert summary.notes().startswith("1 added, 1 removed, 2 replaced in component")
+    assert diff(new, edited) == []
+
+
+def test_apply_patch_validates_values():
+    record = DataRelease(**generate_record(8, 1))
+    with pytest.raises(ValidationError):
+        apply_patch(record, [{"op": "replace", "path": "/status", "value": "Bogus"}])
+    with pytest.raises(ValidationError):
+        apply_patch(record, [{"op": "add", "path": "/distribution/-", "value": {}}])
+    appended, _ = apply_patch(
+        record,
+        [
+            {
+                "op": "add",
+                "path": "/keyword/-",
+                "value": {"concept": "x", "conceptUri": None},
+            }
+        ],
+    )
+    assert appended.keyword[-1].concept == "x"
+    assert len(appended.keyword) == len(record.keyword) + 1
+
+
+def test_remove_restores_defaults():
+    record = DataRelease(**dict(generate_record(8, 2), status="Deprecated"))
+    removed, summary = apply_patch(record, [{"op": "remove", "path": "/status"}])
+    assert removed.status == "Created" and summary.removed == 1
+    assert "status" not in removed.model_fields_set
+    assert record.status == StatusEnum.deprecated
+    removed, _ = apply_patch(
+        record, [{"op": "remove", "path": "/distribution/0/byteSize"}]
+    )
+    assert removed.distribution[0].byteSize is None
+    with pytest.raises(ValidationError):
+        apply_patch(record, [{"op": "remove", "path": "/title"}])
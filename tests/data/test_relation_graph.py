@@ -0,0 +1,58 @@
+from horizon.DataRelease import DataRelease
+from horizon.Dataset import DataciteRelationTypeEnum as Rel
+from horizon.RelationGraph import RelationGraph
+from tests.data.records import make_record
+
+
+def dataset(usgsIdentifier, doi, *relations):
+    relation = [
+        {
+            "dataciteRelationType": rel,
+            "relatedIdentifier": target,
+            "primaryRelatedIdentifier": False,
+            "relatedIdentifierType": "DOI",
+        }
+        for rel, target in relations
+    ]
+    return DataRelease(
+        **make_record(
+            usgsIdentifier, identifier=f"https://doi.org/{doi}", relation=relation
+        )
+    )
+
+
+def test_inverse_and_transitive_queries():
+    graph = RelationGraph(
+        [
+            dataset("collection", "10.1/c", (Rel.HasPart, "10.1/a")),
+            dataset(
+                "part-a", "10.1/a", (Rel.HasPart, "10.1/a1"), (Rel.Cites, "10.9/paper")
+            ),
+            dataset("v1", "10.1/v1"),
+            dataset("v2", "10.1/v2", (Rel.IsNewVersionOf, "10.1/v1")),
+            dataset("v3", "10.1/v3", (Rel.IsNewVersionOf, "10.1/V2")),
+        ]
+    )
+
+    assert graph.neighbors("10.1/a", Rel.IsPartOf) == {"10.1/c"}
+    assert graph.neighbors("https://doi.org/10.9/paper", Rel.IsCitedBy) == {"10.1/a"}
+    assert graph.parts("10.1/c") == ["10.1/a", "10.1/a1"]
+    assert graph.collections("10.1/a1") == ["10.1/a", "10.1/c"]
+    assert graph.version_chain("10.1/v2") == ["10.1/v1", "10.1/v2", "10.1/v3"]
+    assert graph.record("https://doi.org/10.1/V3") == "v3"
+
+
+def test_incremental_update_keeps_edges_asserted_by_both_sides():
+    graph = RelationGraph(
+        [
+            dataset("collection", "10.1/c", (Rel.HasPart, "10.1/a")),
+            dataset("part-a", "10.1/a", (Rel.IsPartOf, "10.1/c")),
+        ]
+    )
+    graph.update(dataset("collection", "10.1/c"))
+    assert graph.parts("10.1/c") == ["10.1/a"]
+
+    graph.remove("part-a")
+    assert graph.parts("10.1/c") == []
+    assert graph.relations("10.1/a") == {}
+    assert graph.record("10.1/a") is None
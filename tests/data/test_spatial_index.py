@@ -0,0 +1,86 @@
+import pytest
+
+from horizon.DataRelease import DataRelease
+from horizon.Location import BoundingBox
+from horizon.SpatialIndex import SpatialIndex
+from scripts.synthetic_catalog import generate_catalog
+from tests.data.records import make_record
+
+
+def dataset(usgsIdentifier, west, east, south, north, centroid=None):
+    spatial = {
+        "bbox": {
+            "westBoundLongitude": west,
+            "eastBoundLongitude": east,
+            "southBoundLatitude": south,
+            "northBoundLatitude": north,
+        },
+        "centroid": centroid,
+    }
+    return DataRelease(**make_record(usgsIdentifier, spatial=spatial))
+
+
+@pytest.fixture
+def index():
+    return SpatialIndex(
+        [
+            dataset("colorado", -109, -102, 37, 41),
+            dataset("alaska", -170, -130, 52, 71),
+            dataset("aleutians", 170, -165, 50, 56),
+            DataRelease(**make_record("no-extent")),
+        ],
+        capacity=2,
+    )
+
+
+def test_bbox_queries(index):
+    assert len(index) == 3
+    assert index.intersects((-110, -100, 30, 40)) == ["colorado"]
+    assert sorted(
+        index.intersects(
+            BoundingBox(
+                westBoundLongitude=175,
+                eastBoundLongitude=-160,
+                southBoundLatitude=40,
+                northBoundLatitude=60,
+            )
+        )
+    ) == ["alaska", "aleutians"]
+    assert index.within((160, -120, 40, 80)) == ["alaska", "aleutians"]
+    assert index.within((-180, 0, 0, 90)) == ["colorado", "alaska"]
+    assert index.contains_point(178, 53) == ["aleutians"]
+    assert index.contains_point(-179, 53) == ["aleutians"]
+
+
+def test_nearest_and_incremental_update(index):
+    assert index.nearest(-105, 39)[0][0] == "colorado"
+    # The aleutians centroid sits on the antimeridian.
+    assert index.nearest(180, 53)[0][0] == "aleutians"
+
+    index.update(
+        dataset("colorado", 10, 20, 40, 50, {"pointLongitude": 15, "pointLatitude": 45})
+    )
+    index.remove("alaska")
+    assert index.contains_point(-105, 39) == []
+    nearest = index.nearest(15, 45, k=5)
+    assert [key for key, _ in nearest] == ["colorado", "aleutians"]
+    assert nearest[0][1] == 0.0
+    index.add(dataset("hawaii", -161, -154, 18, 23))
+    assert index.intersects((-180, 180, -90, 90)) == ["colorado", "hawaii", "aleutians"]
+
+
+def test_grid_matches_a_single_cell():
+    releases = [DataRelease(**r) for r in generate_catalog(300, seed=4)]
+    grid = SpatialIndex(releases, cell_degrees=5)
+    single = SpatialIndex(releases, cell_degrees=360)
+    for release in releases[::7]:
+        grid.remove(release.usgsIdentifier)
+        single.remove(release.usgsIdentifier)
+    for box in [(-120, -110, 35, 45), (170, -150, 40, 70), (-75, -74, 60, 61)]:
+        assert grid.intersects(box) == single.intersects(box)
+        assert grid.within(box) == single.within(box)
+        assert grid.contains_point(box[0], box[2]) == single.contains_point(
+            box[0], box[2]
+        )
+        assert grid.nearest(box[0], box[2], k=7) == single.nearest(box[0], box[2], k=7)
+    assert grid.nearest(100, -80, k=3) == single.nearest(100, -80, k=3)
@@ -0,0 +1,54 @@
+import gzip
+import json
+
+from horizon.DataRelease import DataRelease
+from horizon.StreamingValidator import LineError, validate_ndjson
+
+
+def write_ndjson(path, lines, compress=False):
+    opener = gzip.open if compress else open
+    with opener(path, "wt") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def test_validate_ndjson_reports_bad_lines(tmp_path, make_record):
+    bad = make_record("bad")
+    bad["issued"] = "invalid_date"
+    lines = [
+        json.dumps(make_record("a")),
+        "",
+        json.dumps(bad),
+        "{not json",
+        json.dumps(make_record("b")),
+    ]
+    path = tmp_path / "catalog.ndjson.gz"
+    write_ndjson(path, lines, compress=True)
+
+    results = list(validate_ndjson(path, batch_size=2))
+    assert [type(r) for r in results] == [
+        DataRelease,
+        LineError,
+        LineError,
+        DataRelease,
+    ]
+    assert [r.lineNumber for r in results if isinstance(r, LineError)] == [3, 4]
+    assert results[1].errors[0]["loc"] == ("issued",)
+    assert results[-1].usgsIdentifier == "b"
+
+
+def test_validate_ndjson_process_pool_keeps_order(tmp_path, make_record):
+    path = tmp_path / "catalog.ndjson"
+    write_ndjson(path, [json.dumps(make_record(str(i))) for i in range(50)])
+
+    results = list(validate_ndjson(path, batch_size=7, workers=2))
+    assert [r.usgsIdentifier for r in results] == [str(i) for i in range(50)]
+
+
+def test_line_with_several_records_is_an_error(tmp_path, make_record):
+    a, b = json.dumps(make_record("a")), json.dumps(make_record("b"))
+    path = tmp_path / "catalog.ndjson"
+    write_ndjson(path, [a, f"{a}, {b}", b])
+
+    results = list(validate_ndjson(path))
+    assert [type(r) for r in results] == [DataRelease, LineError, DataRelease]
+    assert results[1].lineNumber == 2
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from horizon.DataRelease import DataRelease
+from horizon.StreamingValidator import validate_ndjson
+from horizon.StreamingWriter import StreamingWriter, write_records
+from scripts.synthetic_catalog import generate_catalog
+
+
+@pytest.fixture(scope="module")
+def releases():
+    return [DataRelease(**record) for record in generate_catalog(30, seed=15)]
+
+
+def test_gzip_ndjson_with_rotation(tmp_path, releases):
+    files = write_records(
+        releases,
+        tmp_path / "catalog.ndjson.gz",
+        compression="gzip",
+        max_bytes=50_000,
+        batch_size=7,
+    )
+    assert len(files) > 1
+    assert files[0].name == "catalog-00000.ndjson.gz"
+    read = [r for path in files for r in validate_ndjson(path)]
+    assert read == releases
+
+
+def test_json_array_with_worker_pool(tmp_path, releases):
+    path = tmp_path / "catalog.json"
+    with StreamingWriter(path, format="json", workers=2, batch_size=4) as writer:
+        assert writer.write_all(releases[:10]) <= 10
+        writer.write({"usgsIdentifier": "raw"})
+    assert writer.records == 11 and writer.files == [path]
+    documents = json.loads(path.read_text())
+    assert [DataRelease(**d) for d in documents[:10]] == releases[:10]
+    assert documents[10] == {"usgsIdentifier": "raw"}
+
+    write_records([], tmp_path / "empty.json", format="json")
+    assert json.loads((tmp_path / "empty.json").read_text()) == []
@@ -0,0 +1,27 @@
+from horizon.DataRelease import DataRelease
+from scripts.benchmark_models import run
+from scripts.synthetic_catalog import generate_catalog, generate_record
+
+
+def test_generator_is_deterministic_and_valid():
+    catalog = list(
+        generate_catalog(5, seed=7, distributions=3, components=2, keywords=1)
+    )
+    assert catalog[3] == generate_record(
+        7, 3, distributions=3, components=2, keywords=1
+    )
+    assert catalog != list(generate_catalog(5, seed=8))
+
+    release = DataRelease(**catalog[0])
+    assert len(release.distribution) == 3
+    assert [len(c.distribution) for c in release.component] == [3, 3]
+    assert len(release.keyword) == 1
+    assert len({r["usgsIdentifier"] for r in catalog}) == 5
+
+
+def test_benchmark_skips_models_without_samples():
+    report = run(
+        records=2, min_time=0.0, repeat=1, models=["Keyword", "Entity"], keywords=0
+    )
+    assert report["notMeasured"] == ["Keyword"]
+    assert {r["model"] for r in report["results"]} == {"Entity"}
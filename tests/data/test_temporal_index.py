@@ -0,0 +1,77 @@
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from horizon.DataRelease import DataRelease
+from horizon.TemporalIndex import TemporalIndex
+from tests.data.records import make_record
+
+
+def year(y):
+    return datetime(y, 1, 1)
+
+
+def dataset(usgsIdentifier, *periods):
+    temporal = [{"startDate": start, "endDate": end} for start, end in periods]
+    return DataRelease(**make_record(usgsIdentifier, temporal=temporal))
+
+
+@pytest.fixture
+def index():
+    return TemporalIndex(
+        [
+            dataset("eighties", (year(1980), year(1990))),
+            dataset("nineties", (year(1990), year(2000))),
+            dataset("since-1985", (year(1985), None)),
+            dataset("until-1995", (None, year(1995))),
+            dataset("split", (year(1970), year(1975)), (year(2010), year(2012))),
+            DataRelease(**make_record("timeless")),
+        ]
+    )
+
+
+def test_interval_queries(index):
+    assert index.covering(year(1990), year(2000)) == ["nineties", "since-1985"]
+    assert index.overlapping(year(1991), year(1992)) == [
+        "nineties",
+        "since-1985",
+        "until-1995",
+    ]
+    assert index.overlapping(None, year(1972)) == ["until-1995", "split"]
+    assert index.within(year(1960), year(2001)) == ["eighties", "nineties", "split"]
+    assert index.at(datetime(2011, 6, 1, tzinfo=timezone.utc)) == [
+        "since-1985",
+        "split",
+    ]
+
+
+def test_batch_counts(index):
+    counts = index.count_overlapping(
+        [year(1991), None, year(2020)], [year(1992), year(1972), None]
+    )
+    assert counts.tolist() == [3, 2, 1]
+    assert index.count_at([year(1990), year(2030)]).tolist() == [4, 1]
+
+
+def test_queries_match_a_scan():
+    rng = random.Random(5)
+    periods = {}
+    for i in range(60):
+        start = year(rng.randrange(1950, 2020))
+        end = None if i % 9 == 0 else year(start.year + rng.randrange(0, 6))
+        periods[f"d{i}"] = (None if i % 13 == 0 else start, end)
+    index = TemporalIndex(dataset(key, period) for key, period in periods.items())
+
+    def scan(test):
+        return [
+            key
+            for key, (start, end) in periods.items()
+            if test(start or datetime.min, end or datetime.max)
+        ]
+
+    for y in range(1950, 2030, 3):
+        q0, q1 = year(y), year(y + 2)
+        assert index.overlapping(q0, q1) == scan(lambda s, e: s <= q1 and e >= q0)
+        assert index.covering(q0, q1) == scan(lambda s, e: s <= q0 and e >= q1)
+        assert index.within(q0, q1) == scan(lambda s, e: s >= q0 and e <= q1)
@@ -0,0 +1,90 @@
+import mmap
+from unittest import mock
+
+import pytest
+
+from horizon.DataRelease import DataRelease
+from horizon.TextIndex import TextIndex, tokenize
+from scripts.synthetic_catalog import generate_catalog
+
+
+def record(key, title, citation="", description="Plain description"):
+    return {
+        "usgsIdentifier": key,
+        "title": title,
+        "description": description,
+        "usgsCitation": citation,
+        "usgsPurpose": None,
+        "component": [{"title": "Component", "description": "Sediment cores"}],
+    }
+
+
+def test_ranking_prefix_and_updates():
+    index = TextIndex(
+        [
+            record("a", "Groundwater levels", citation="Smith, 2020"),
+            record("b", "Streamflow", citation="Groundwater survey of Ohio"),
+            record("c", "Seismic hazard"),
+        ]
+    )
+    assert index._delta == {}
+    assert tokenize("Ground-Water levels!") == ["ground", "water", "levels"]
+    assert [key for key, _ in index.search("groundwater")] == ["a", "b"]
+    assert [key for key, _ in index.search("seism")] == ["c"]
+    assert index.search("seism", prefix=False) == []
+    assert {key for key, _ in index.search("sediment")} == {"a", "b", "c"}
+
+    index.remove("a")
+    index.add(record("c", "Groundwater chemistry"))
+    assert len(index) == 2 and "a" not in index
+    assert [key for key, _ in index.search("groundwater")] == ["c", "b"]
+    assert index.search("seismic") == []
+
+    # Base and delta postings of one term score like a compacted index.
+    before = index.search("groundwater")
+    index.compact()
+    after = index.search("groundwater")
+    assert [key for key, _ in after] == [key for key, _ in before]
+    assert [score for _, score in after] == pytest.approx([s for _, s in before])
+
+
+def test_snapshot_round_trip(tmp_path):
+    releases = [DataRelease(**r) for r in generate_catalog(40, seed=16)]
+    index = TextIndex(releases[:30])
+    index.remove(releases[0].usgsIdentifier)
+    index.update(releases[30:])
+    query = releases[5].title.split()[0][:4]
+    expected = index.search(query, limit=5)
+
+    index.save(tmp_path / "text.idx")
+    loaded = TextIndex.load(tmp_path / "text.idx")
+    assert len(loaded) == 39
+    assert [k for k, _ in loaded.search(query, limit=5)] == [k for k, _ in expected]
+
+    loaded.add(releases[0])
+    loaded.remove(releases[1].usgsIdentifier)
+    loaded.compact()
+    assert len(loaded) == 39
+    assert releases[0].usgsIdentifier in loaded
+    assert releases[1].usgsIdentifier not in loaded
+    assert all(key is not None for key, _ in loaded.search(query, limit=50))
+
+
+def test_load_rejects_other_files(tmp_path):
+    TextIndex([record("a", "Groundwater")]).save(tmp_path / "text.idx")
+    data = (tmp_path / "text.idx").read_bytes()
+    (tmp_path / "magic.idx").write_bytes(b"XXXX" + data[4:])
+    (tmp_path / "short.idx").write_bytes(data[:8])
+    (tmp_path / "truncated.idx").write_bytes(data[:-8])
+    real_mmap = mmap.mmap
+    for name in ["magic.idx", "short.idx", "truncated.idx"]:
+        mapped = []
+
+        def open_map(*args, **kwargs):
+            mapped.append(real_mmap(*args, **kwargs))
+            return mapped[-1]
+
+        with mock.patch.object(mmap, "mmap", side_effect=open_map):
+            with pytest.raises(ValueError, match="not a text index snapshot"):
+                TextIndex.load(tmp_path / name)
+        assert mapped[0].closed
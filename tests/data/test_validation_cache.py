@@ -0,0 +1,51 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from horizon.Dataset import Dataset
+from horizon.ValidationCache import ValidationCache, schema_fingerprint
+from scripts.synthetic_catalog import generate_catalog
+
+
+def test_cache_skips_known_good_documents(tmp_path):
+    documents = [json.dumps(r) for r in generate_catalog(10, seed=6)]
+    with ValidationCache(tmp_path / "cache.db") as cache:
+        assert not any(cache.check(document) for document in documents)
+        with pytest.raises(ValidationError):
+            cache.check('{"title": "invalid"}')
+        assert cache.stats().misses == 10 and cache.stats().hits == 0
+
+    with ValidationCache(tmp_path / "cache.db") as cache:
+        assert all(cache.check(document) for document in documents)
+        stats = cache.stats()
+        assert stats.hits == 10 and stats.misses == 0 and stats.hitRate == 1.0
+        assert stats.entries == 10
+        assert documents[0] in cache and '{"title": "invalid"}' not in cache
+
+        # validate always returns a model, known or not, and remembers the document.
+        model = cache.validate(documents[0])
+        assert model.usgsIdentifier in documents[0]
+        extra = json.dumps(dict(json.loads(documents[0]), title="new"))
+        assert cache.validate(extra).title == "new" and cache.is_known(extra)
+        assert cache.stats().hits == 10 and cache.stats().misses == 0
+
+    # A different model has its own fingerprint and entries.
+    assert schema_fingerprint(Dataset) != cache.fingerprint
+    with ValidationCache(tmp_path / "cache.db", model=Dataset) as cache:
+        assert documents[0] not in cache
+
+
+def test_cache_evicts_least_recently_used():
+    documents = [json.dumps(r) for r in generate_catalog(6, seed=7)]
+    cache = ValidationCache(max_entries=4, flush_every=1)
+    for document in documents[:4]:
+        cache.check(document)
+    cache.check(documents[0])
+    cache.check(documents[4])
+    cache.check(documents[5])
+
+    assert cache.stats().evictions == 2
+    assert cache.stats().entries == 4
+    assert documents[0] in cache
+    assert documents[1] not in cache and documents[2] not in cache
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from horizon.DataRelease import DataRelease
+from horizon.ValidationProfiler import ValidationProfiler
+from scripts.synthetic_catalog import generate_catalog
+
+
+def test_profiler_records_models_and_fields():
+    records = list(generate_catalog(3, seed=12, distributions=4))
+    profiler = ValidationProfiler()
+    for record in records:
+        assert profiler.validate(DataRelease, json.dumps(record)) == DataRelease(
+            **record
+        )
+
+    timings = {(t.model, t.field, t.operation): t for t in profiler.report().timings}
+    assert timings[("DataRelease", None, "validate")].count == 3
+    assert timings[("Distribution", "downloadURL", "validate")].count == 3 * 4 * 2
+    assert timings[("Creator", "name", "serialize")].count == sum(
+        len(r["creator"]) for r in records
+    )
+    assert "Distribution.downloadURL" in profiler.report().table()
+
+    exported = []
+    profiler.export(exported.append)
+    assert len(exported) == len(timings)
+    profiler.reset()
+    assert profiler.report().timings == []
+
+
+def test_disabled_profiler_only_validates():
+    profiler = ValidationProfiler(enabled=False)
+    record = next(generate_catalog(1, seed=13))
+    assert profiler.validate(DataRelease, record).title == record["title"]
+    with pytest.raises(ValidationError):
+        profiler.validate(DataRelease, "{}")
+    assert profiler.report().timings == []
+
+
+def test_profiler_records_failures():
+    profiler = ValidationProfiler()
+    record = next(generate_catalog(1, seed=14))
+    record["title"] = 5
+    with pytest.raises(ValidationError):
+        profiler.validate(DataRelease, json.dumps(record))
+    with pytest.raises(ValidationError):
+        profiler.validate(DataRelease, record)
+
+    timings = {(t.model, t.field, t.operation): t for t in profiler.report().timings}
+    assert timings[("DataRelease", None, "validate")].errors == 2
+    assert timings[("DataRelease", "title", "validate")].errors == 2
+    assert timings[("DataRelease", "creator", "validate")].errors == 0